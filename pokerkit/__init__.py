@@ -6,6 +6,7 @@ All poker tools are imported here.
 __all__ = (
     'AbsolutePokerParser',
     'ACPCProtocolParser',
+    'ActionStatistics',
     'AntePosting',
     'Automation',
     'BadugiHand',
@@ -17,8 +18,13 @@ __all__ = (
     'BoardDealing',
     'BringInPosting',
     'calculate_equities',
+    'calculate_equity_matrix',
+    'calculate_finish_probabilities',
+    'calculate_hand_potential',
+    'calculate_hand_potentials',
     'calculate_hand_strength',
     'calculate_icm',
+    'calculate_icms',
     'Card',
     'CardBurning',
     'CardsLike',
@@ -27,6 +33,8 @@ __all__ = (
     'ChipsPushing',
     'clean_values',
     'CombinationHand',
+    'compile_range',
+    'CompiledRange',
     'CompletionBettingOrRaisingTo',
     'Deck',
     'DeuceToSevenLowballMixin',
@@ -35,6 +43,10 @@ __all__ = (
     'EightOrBetterLookup',
     'EightOrBetterLowHand',
     'Entry',
+    'EquityCache',
+    'EquityMatrix',
+    'EquityResult',
+    'estimate_equities',
     'filter_none',
     'FixedLimitBadugi',
     'FixedLimitDeuceToSevenLowballTripleDraw',
@@ -49,11 +61,14 @@ __all__ = (
     'GreekHoldemHand',
     'Hand',
     'HandHistory',
+    'HandHistoryStatistics',
+    'HandPotential',
     'HandKilling',
     'Holdem',
     'HoleBoardCombinationHand',
     'HoleCardsShowingOrMucking',
     'HoleDealing',
+    'ICMModel',
     'IPokerNetworkParser',
     'KuhnPoker',
     'KuhnPokerHand',
@@ -81,12 +96,14 @@ __all__ = (
     'parse_range',
     'parse_time',
     'parse_value',
+    'parse_weighted_range',
     'PartyPokerParser',
     'Poker',
     'PokerStarsParser',
     'Pot',
     'PotLimitOmahaHoldem',
     'PotLimitPokerMixin',
+    'PushFold',
     'rake',
     'Rank',
     'RankOrder',
@@ -122,14 +139,33 @@ __all__ = (
     'UnfixedLimitHoldem',
     'UNMATCHABLE_PATTERN',
     'ValuesLike',
+    'WeightedRange',
 )
 
 from pokerkit.analysis import (
+    ActionStatistics,
     calculate_equities,
+    calculate_equity_matrix,
+    calculate_finish_probabilities,
+    calculate_hand_potential,
+    calculate_hand_potentials,
     calculate_hand_strength,
     calculate_icm,
+    calculate_icms,
+    compile_range,
+    CompiledRange,
+    EquityCache,
+    EquityMatrix,
+    EquityResult,
+    estimate_equities,
+    HandHistoryStatistics,
+    HandPotential,
+    ICMModel,
     parse_range,
+    parse_weighted_range,
+    PushFold,
     Statistics,
+    WeightedRange,
 )
 from pokerkit.games import (
     DeuceToSevenLowballMixin,
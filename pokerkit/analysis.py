@@ -4,30 +4,64 @@ analysis.
 
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterable, Iterator
-from collections import Counter, defaultdict
-from concurrent.futures import Executor
-from dataclasses import dataclass
-from functools import partial
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import (
+    Executor,
+    FIRST_COMPLETED,
+    Future,
+    wait,
+)
+from dataclasses import asdict, dataclass, field, fields
+from enum import StrEnum, unique
+from functools import cache, cached_property, lru_cache, partial
+from hashlib import sha256
 from itertools import (
     chain,
     combinations,
+    islice,
     permutations,
     product,
     repeat,
     starmap,
 )
-from math import sqrt
-from operator import eq
-from random import choices, sample
-from statistics import mean, stdev
+from json import dumps, loads
+from math import ceil, comb, inf, sqrt
+from operator import attrgetter, eq, itemgetter, mul
+from os import cpu_count, fspath, PathLike
+from random import getrandbits, Random, randrange
+from sqlite3 import connect, Connection
+from statistics import mean
+from threading import Lock
+from time import perf_counter
 from typing import Any
 
 from pokerkit.hands import Hand
 from pokerkit.notation import HandHistory
-from pokerkit.utilities import Card, Deck, max_or_none, RankOrder, Suit
+from pokerkit.state import (
+    CheckingOrCalling,
+    ChipsPushing,
+    CompletionBettingOrRaisingTo,
+    Folding,
+    State,
+)
+from pokerkit.utilities import (
+    Card,
+    CardsLike,
+    Deck,
+    filter_none,
+    max_or_none,
+    Rank,
+    RankOrder,
+    Suit,
+)
 
 __SUITS = Suit.CLUB, Suit.DIAMOND, Suit.HEART, Suit.SPADE
+__ROUND_SAMPLE_COUNT = 1000
+__RANGE_CACHE_SIZE = 1024
+__ICM_CACHE_SIZE = 16
+__ICM_CACHE_PLAYER_COUNT = 10
 
 
 def __parse_range(
@@ -111,6 +145,34 @@ def __parse_range(
             yield frozenset(Card.parse(raw_range))
 
 
+def __normalize_range(raw_ranges: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(
+        ' '.join(raw_ranges).replace(',', ' ').replace(';', ' ').split(),
+    )
+
+
+@lru_cache(maxsize=__RANGE_CACHE_SIZE)
+def __parse_weighted_range(
+        raw_ranges: tuple[str, ...],
+        rank_order: RankOrder,
+) -> tuple[tuple[frozenset[Card], float], ...]:
+    weights = dict[frozenset[Card], float]()
+
+    for raw_range in raw_ranges:
+        raw_range, separator, raw_weight = raw_range.partition(':')
+        weight = float(raw_weight) if separator else 1.0
+
+        if not weight >= 0:
+            raise ValueError(
+                f'The weight {repr(raw_weight)} is not a non-negative number.',
+            )
+
+        for cards in __parse_range(raw_range, rank_order):
+            weights[cards] = weight
+
+    return tuple(weights.items())
+
+
 def parse_range(
         *raw_ranges: str,
         rank_order: RankOrder = RankOrder.STANDARD,
@@ -128,20 +190,409 @@ def parse_range(
     >>> frozenset(Card.parse('AcKd')) in rng
     False
 
+    The notations may be suffixed by weights (see
+    :func:`pokerkit.analysis.parse_weighted_range`). The combinations
+    whose last weights are zero are excluded.
+
+    >>> parse_range('QQ+ KK:0') == parse_range('QQ', 'AA:0.5')
+    True
+
+    The parsed notations are cached (for the most recently used
+    ``1024`` notations and rank orders), so parsing the same range
+    repeatedly is cheap. A new set is returned on every call.
+
+    >>> parse_range('AKs') is parse_range('AKs')
+    False
+
     :param raw_ranges: The raw ranges to be parsed.
     :param rank_order: The rank ordering to be used, defaults to
                        :attr:`pokerkit.utilities.RankOrder`.
     :return: The range.
+    :raises ValueError: If a weight is invalid.
     """
-    raw_ranges = tuple(
-        ' '.join(raw_ranges).replace(',', ' ').replace(';', ' ').split(),
+    return {
+        cards for cards, weight in __parse_weighted_range(
+            __normalize_range(raw_ranges),
+            rank_order,
+        ) if weight
+    }
+
+
+@dataclass(frozen=True)
+class WeightedRange:
+    """The class for weighted ranges.
+
+    A weighted range assigns a weight (e.g., the frequency at which a
+    player holds the hand) to every combination of ``card_count`` cards
+    of :attr:`pokerkit.utilities.Deck.STANDARD`. The weights are stored
+    in a compact array, in the colexicographic order of the card indices
+    (see :attr:`pokerkit.utilities.Card.index`) of the combinations. For
+    hold'em, there are ``1326`` weights.
+
+    Iterating over a weighted range yields the combinations with
+    positive weights. Therefore, weighted ranges can be used wherever
+    unweighted ranges are expected. The equity calculators sample the
+    combinations in proportion to their weights.
+
+    Typically, weighted ranges are created through
+    :func:`pokerkit.analysis.parse_weighted_range`.
+
+    >>> weighted_range = parse_weighted_range('AKs:0.5 QQ')
+    >>> len(weighted_range.weights)
+    1326
+    >>> len(weighted_range)
+    10
+    >>> weighted_range.get_weight(Card.parse('AsKs'))
+    0.5
+    >>> weighted_range.get_weight(Card.parse('QcQd'))
+    1.0
+    >>> weighted_range.get_weight(Card.parse('AsKd'))
+    0.0
+    >>> frozenset(Card.parse('QcQd')) in weighted_range
+    True
+    >>> set(weighted_range) == parse_range('AKs QQ')
+    True
+    >>> from array import array
+    >>> WeightedRange(array('d', [1.0]))
+    Traceback (most recent call last):
+        ...
+    ValueError: The number of weights 1 is not 1326.
+
+    :param weights: The weights of the combinations.
+    :param card_count: The number of cards in each combination, defaults
+                       to ``2``.
+    :raises ValueError: If the number of weights is not the number of
+                        combinations or a weight is negative.
+    """
+
+    weights: array[float]
+    """The weights of the combinations."""
+    card_count: int = 2
+    """The number of cards in each combination."""
+
+    def __post_init__(self) -> None:
+        combination_count = comb(len(Deck.STANDARD), self.card_count)
+
+        if len(self.weights) != combination_count:
+            raise ValueError(
+                (
+                    f'The number of weights {len(self.weights)} is not'
+                    f' {combination_count}.'
+                ),
+            )
+
+        if not all(weight >= 0 for weight in self.weights):
+            raise ValueError('The weights must be non-negative.')
+
+    @classmethod
+    @cache
+    def __get_combinations(
+            cls,
+            card_count: int,
+    ) -> tuple[frozenset[Card], ...]:
+        cards = sorted(Deck.STANDARD, key=attrgetter('index'))
+
+        return tuple(
+            map(
+                frozenset,
+                sorted(
+                    combinations(cards, card_count),
+                    key=lambda cards: [card.index for card in cards[::-1]],
+                ),
+            ),
+        )
+
+    @classmethod
+    def from_items(
+            cls,
+            items: Iterable[tuple[Iterable[Card], float]],
+            card_count: int = 2,
+    ) -> WeightedRange:
+        """Create a weighted range from combinations and their weights.
+
+        The combinations that are not given have zero weights.
+
+        >>> weighted_range = WeightedRange.from_items(
+        ...     [(Card.parse('AsKs'), 0.25), (Card.parse('2c2d'), 2)],
+        ... )
+        >>> [weight for _, weight in weighted_range.items()]
+        [2.0, 0.25]
+        >>> weighted_range.get_weight(Card.parse('KsAs'))
+        0.25
+
+        :param items: The combinations and their weights.
+        :param card_count: The number of cards in each combination,
+                           defaults to ``2``.
+        :return: The weighted range.
+        :raises ValueError: If a combination is invalid or a weight is
+                            negative.
+        """
+        weights = array('d', repeat(0, comb(len(Deck.STANDARD), card_count)))
+
+        for cards, weight in items:
+            weights[cls.get_index(cards, card_count)] = weight
+
+        return cls(weights, card_count)
+
+    @classmethod
+    def get_index(cls, cards: Iterable[Card], card_count: int = 2) -> int:
+        """Return the index of the weight of the combination.
+
+        >>> WeightedRange.get_index(Card.parse('2c2d'))
+        0
+        >>> WeightedRange.get_index(Card.parse('AsAh'))
+        1325
+
+        :param cards: The cards of the combination.
+        :param card_count: The number of cards in each combination,
+                           defaults to ``2``.
+        :return: The index.
+        :raises ValueError: If the combination does not consist of
+                            ``card_count`` distinct cards of
+                            :attr:`pokerkit.utilities.Deck.STANDARD`.
+        """
+        indices = sorted(set(card.index for card in cards))
+
+        if (
+                len(indices) != card_count
+                or (indices and indices[-1] >= len(Deck.STANDARD))
+        ):
+            raise ValueError(
+                (
+                    f'The cards {repr(cards)} are not {card_count} distinct'
+                    ' cards of the standard deck.'
+                ),
+            )
+
+        return sum(starmap(comb, zip(indices, range(1, card_count + 1))))
+
+    def __iter__(self) -> Iterator[frozenset[Card]]:
+        for cards, _ in self.items():
+            yield cards
+
+    def __len__(self) -> int:
+        return sum(map(bool, self.weights))
+
+    def __contains__(self, cards: Any) -> bool:
+        try:
+            return bool(self.get_weight(cards))
+        except (TypeError, ValueError):
+            return False
+
+    def get_weight(self, cards: Iterable[Card]) -> float:
+        """Return the weight of the combination.
+
+        :param cards: The cards of the combination.
+        :return: The weight.
+        :raises ValueError: If the combination is invalid.
+        """
+        return self.weights[self.get_index(cards, self.card_count)]
+
+    def items(self) -> Iterator[tuple[frozenset[Card], float]]:
+        """Iterate through the combinations with positive weights and
+        their weights.
+
+        :return: The combinations and their weights.
+        """
+        for cards, weight in zip(
+                self.__get_combinations(self.card_count),
+                self.weights,
+        ):
+            if weight:
+                yield cards, weight
+
+
+def parse_weighted_range(
+        *raw_ranges: str,
+        rank_order: RankOrder = RankOrder.STANDARD,
+        card_count: int | None = None,
+) -> WeightedRange:
+    """Parse the weighted range.
+
+    Each notation (see :func:`pokerkit.analysis.parse_range`) can be
+    suffixed by a colon and a non-negative weight, without whitespaces
+    in between. The notations without weights have unit weights. If a
+    combination appears in multiple notations, the last weight is used.
+
+    >>> weighted_range = parse_weighted_range('AKs:0.5, QQ+:1.0, 76s:0.25')
+    >>> weighted_range.get_weight(Card.parse('AhKh'))
+    0.5
+    >>> weighted_range.get_weight(Card.parse('AhAd'))
+    1.0
+    >>> weighted_range.get_weight(Card.parse('7c6c'))
+    0.25
+    >>> len(weighted_range)
+    26
+    >>> parse_weighted_range('AA KK:0.5 AsAh:0').get_weight(Card.parse('AsAh'))
+    0.0
+    >>> parse_weighted_range('AKs:-1')
+    Traceback (most recent call last):
+        ...
+    ValueError: The weight '-1' is not a non-negative number.
+
+    :param raw_ranges: The raw weighted ranges to be parsed.
+    :param rank_order: The rank ordering to be used, defaults to
+                       :attr:`pokerkit.utilities.RankOrder`.
+    :param card_count: The optional number of cards in each
+                       combination, defaults to ``None`` which is the
+                       number of cards of the parsed combinations (or
+                       ``2`` if there are none).
+    :return: The weighted range.
+    :raises ValueError: If a weight or a combination is invalid.
+    """
+    items = __parse_weighted_range(__normalize_range(raw_ranges), rank_order)
+
+    if card_count is None:
+        card_count = min((len(cards) for cards, _ in items), default=2)
+
+    return WeightedRange.from_items(items, card_count)
+
+
+@dataclass(frozen=True)
+class CompiledRange:
+    """The class for compiled ranges.
+
+    A compiled range is an immutable set of the bitmasks (see
+    :meth:`pokerkit.utilities.Card.get_mask`) of the combinations of
+    the range. The set operations (union, intersection, and difference)
+    and the removal of the combinations with dead cards are carried out
+    on the integers. Like weighted ranges, compiled ranges can be used
+    wherever unweighted ranges are expected, and the equity calculators
+    consume their bitmasks directly.
+
+    Typically, compiled ranges are created through
+    :func:`pokerkit.analysis.compile_range`.
+
+    >>> compiled_range = compile_range('AKs QQ')
+    >>> len(compiled_range)
+    10
+    >>> frozenset(Card.parse('AsKs')) in compiled_range
+    True
+    >>> set(compiled_range) == parse_range('AKs QQ')
+    True
+    >>> compiled_range.hole_cards[:3]
+    ((Qc, Qd), (Qc, Qh), (Qd, Qh))
+    >>> len(compiled_range | compile_range('JJ'))
+    16
+    >>> compiled_range & compile_range('QQ+') == compile_range('QQ')
+    True
+    >>> compiled_range - compile_range('QQ') == compile_range('AKs')
+    True
+    >>> len(compiled_range.remove_cards(Card.parse('AsQc')))
+    6
+
+    :param masks: The bitmasks of the combinations.
+    """
+
+    masks: frozenset[int]
+    """The bitmasks of the combinations."""
+
+    @classmethod
+    def from_hole_cards(
+            cls,
+            hole_range: Iterable[Iterable[Card]],
+    ) -> CompiledRange:
+        """Compile a range of combinations of cards.
+
+        >>> CompiledRange.from_hole_cards(parse_range('AKs')) == (
+        ...     compile_range('AKs')
+        ... )
+        True
+
+        :param hole_range: The range.
+        :return: The compiled range.
+        """
+        return cls(frozenset(map(Card.get_mask, hole_range)))
+
+    def __or__(self, other: CompiledRange) -> CompiledRange:
+        return CompiledRange(self.masks | other.masks)
+
+    def __and__(self, other: CompiledRange) -> CompiledRange:
+        return CompiledRange(self.masks & other.masks)
+
+    def __sub__(self, other: CompiledRange) -> CompiledRange:
+        return CompiledRange(self.masks - other.masks)
+
+    def __iter__(self) -> Iterator[frozenset[Card]]:
+        return map(frozenset, self.hole_cards)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __contains__(self, cards: Any) -> bool:
+        try:
+            return Card.get_mask(cards) in self.masks
+        except (AttributeError, ValueError):
+            return False
+
+    @cached_property
+    def sorted_masks(self) -> tuple[int, ...]:
+        """Return the sorted bitmasks of the combinations.
+
+        :return: The sorted bitmasks.
+        """
+        return tuple(sorted(self.masks))
+
+    @cached_property
+    def hole_cards(self) -> tuple[tuple[Card, ...], ...]:
+        """Return the combinations, in the order of
+        :attr:`pokerkit.analysis.CompiledRange.sorted_masks`.
+
+        The cards of each combination are ordered by their indices.
+
+        :return: The combinations.
+        """
+        return tuple(map(Card.from_mask, self.sorted_masks))
+
+    def remove_cards(self, cards: CardsLike) -> CompiledRange:
+        """Remove the combinations that contain any of the cards (e.g.,
+        the board cards or other dead cards).
+
+        :param cards: The dead cards.
+        :return: The compiled range without the combinations.
+        """
+        mask = Card.get_mask(cards)
+
+        return CompiledRange(
+            frozenset(mask_ for mask_ in self.masks if not mask_ & mask),
+        )
+
+
+@lru_cache(maxsize=__RANGE_CACHE_SIZE)
+def __compile_range(
+        raw_ranges: tuple[str, ...],
+        rank_order: RankOrder,
+) -> CompiledRange:
+    return CompiledRange.from_hole_cards(
+        parse_range(*raw_ranges, rank_order=rank_order),
     )
-    range_ = set[frozenset[Card]]()
 
-    for raw_range in raw_ranges:
-        range_.update(__parse_range(raw_range, rank_order))
 
-    return range_
+def compile_range(
+        *raw_ranges: str,
+        rank_order: RankOrder = RankOrder.STANDARD,
+) -> CompiledRange:
+    """Parse and compile the range.
+
+    The notations are the same as those of
+    :func:`pokerkit.analysis.parse_range`. The compiled ranges are
+    cached by their normalized notations (i.e., regardless of the
+    separators used) and rank orders, for the most recently used
+    ``1024`` of them. Since compiled ranges are immutable, the same
+    instance is returned for the same range.
+
+    >>> compile_range('AKs, QQ+') is compile_range('AKs', 'QQ+')
+    True
+    >>> len(compile_range('22+ A2s+ KTo+'))
+    162
+
+    :param raw_ranges: The raw ranges to be parsed.
+    :param rank_order: The rank ordering to be used, defaults to
+                       :attr:`pokerkit.utilities.RankOrder`.
+    :return: The compiled range.
+    :raises ValueError: If a weight is invalid.
+    """
+    return __compile_range(__normalize_range(raw_ranges), rank_order)
 
 
 def __calculate_equities_0(
@@ -150,7 +601,10 @@ def __calculate_equities_0(
         hole_dealing_count: int,
         board_dealing_count: int,
         deck_cards: list[Card],
+        dealt_card_mask: int,
+        dealt_card_count: int,
         hand_types: tuple[type[Hand], ...],
+        rng: Random,
 ) -> list[float]:
     hole_cards = tuple(map(list.copy, hole_cards))
     board_cards = board_cards.copy()
@@ -160,7 +614,12 @@ def __calculate_equities_0(
         + board_dealing_count
         - len(board_cards)
     )
-    sampled_cards = sample(deck_cards, k=sample_count)
+    sampled_cards = [
+        card for card in rng.sample(
+            deck_cards,
+            k=sample_count + dealt_card_count,
+        ) if not dealt_card_mask >> card.index & 1
+    ][:sample_count]
     begin = 0
 
     for i in range(len(hole_cards)):
@@ -176,18 +635,30 @@ def __calculate_equities_0(
 
     assert len(board_cards) == board_dealing_count
 
-    equities = [0.0] * len(hole_cards)
+    return __calculate_showdown_equities(
+        [
+            list(
+                map(
+                    partial(
+                        hand_type.from_game_or_none,
+                        board_cards=board_cards,
+                    ),
+                    hole_cards,
+                ),
+            ) for hand_type in hand_types
+        ],
+    )
+
 
-    for hand_type in hand_types:
-        hands = list(
-            map(
-                partial(hand_type.from_game_or_none, board_cards=board_cards),
-                hole_cards,
-            ),
-        )
-        max_hand = max_or_none(hands)
-        statuses = list(map(partial(eq, max_hand), hands))
-        increment = 1 / (len(hand_types) * sum(statuses))
+def __calculate_showdown_equities(
+        hands: list[list[Hand | None]],
+) -> list[float]:
+    equities = [0.0] * len(hands[0])
+
+    for hands_ in hands:
+        max_hand = max_or_none(hands_)
+        statuses = list(map(partial(eq, max_hand), hands_))
+        increment = 1 / (len(hands) * sum(statuses))
 
         for i, status in enumerate(statuses):
             if status:
@@ -196,175 +667,810 @@ def __calculate_equities_0(
     return equities
 
 
+def __iterate_selections(
+        hole_ranges: tuple[list[list[Card]], ...],
+        hole_masks: tuple[list[int], ...],
+        hole_weights: tuple[list[float], ...],
+        mask: int,
+        weight: float = 1,
+) -> Iterator[tuple[tuple[list[Card], ...], int, float]]:
+    if not hole_ranges:
+        yield (), mask, weight
+
+        return
+
+    for cards, cards_mask, cards_weight in zip(
+            hole_ranges[0],
+            hole_masks[0],
+            hole_weights[0],
+    ):
+        if not mask & cards_mask:
+            for (
+                    selection,
+                    selection_mask,
+                    selection_weight,
+            ) in __iterate_selections(
+                hole_ranges[1:],
+                hole_masks[1:],
+                hole_weights[1:],
+                mask | cards_mask,
+                weight * cards_weight,
+            ):
+                yield (cards, *selection), selection_mask, selection_weight
+
+
+def __get_alias_table(
+        weights: list[float],
+) -> tuple[list[float], list[int]] | None:
+    if min(weights, default=0) == max(weights, default=0):
+        return None
+
+    probabilities = [
+        weight * len(weights) / sum(weights) for weight in weights
+    ]
+    aliases = list(range(len(weights)))
+    small_indices = [i for i, p in enumerate(probabilities) if p < 1]
+    large_indices = [i for i, p in enumerate(probabilities) if p >= 1]
+
+    while small_indices and large_indices:
+        small_index = small_indices.pop()
+        large_index = large_indices.pop()
+        aliases[small_index] = large_index
+        probabilities[large_index] -= 1 - probabilities[small_index]
+
+        if probabilities[large_index] < 1:
+            small_indices.append(large_index)
+        else:
+            large_indices.append(large_index)
+
+    for i in chain(small_indices, large_indices):
+        probabilities[i] = 1
+
+    return probabilities, aliases
+
+
+def __sample_selection(
+        hole_ranges: tuple[list[list[Card]], ...],
+        hole_masks: tuple[list[int], ...],
+        alias_tables: tuple[tuple[list[float], list[int]] | None, ...],
+        mask: int,
+        rng: Random,
+) -> tuple[tuple[list[Card], ...], int]:
+    while True:
+        selection = []
+        selection_mask = mask
+
+        for hole_range, masks, alias_table in zip(
+                hole_ranges,
+                hole_masks,
+                alias_tables,
+        ):
+            index = rng.randrange(len(hole_range))
+
+            if alias_table is not None:
+                probabilities, aliases = alias_table
+
+                if rng.random() >= probabilities[index]:
+                    index = aliases[index]
+
+            if selection_mask & masks[index]:
+                break
+
+            selection.append(hole_range[index])
+
+            selection_mask |= masks[index]
+        else:
+            return tuple(selection), selection_mask
+
+
 def __calculate_equities_1(
-        hole_cards: list[tuple[list[Card], ...]],
+        hole_ranges: tuple[list[list[Card]], ...],
+        hole_masks: tuple[list[int], ...],
+        alias_tables: tuple[tuple[list[float], list[int]] | None, ...],
         board_cards: list[Card],
         hole_dealing_count: int,
         board_dealing_count: int,
-        deck_cards: list[list[Card]],
+        deck_cards: list[Card],
         hand_types: tuple[type[Hand], ...],
-        index: int,
-) -> list[float]:
-    return __calculate_equities_0(
-        hole_cards[index],
-        board_cards,
-        hole_dealing_count,
-        board_dealing_count,
-        deck_cards[index],
-        hand_types,
-    )
+        block: tuple[int, int],
+) -> tuple[list[float], list[float]]:
+    sample_count, seed = block
+    rng = Random(seed)
+    board_mask = Card.get_mask(board_cards)
+    deck_mask = Card.get_mask(deck_cards)
+    equity_sums = [0.0] * len(hole_ranges)
+    squared_equity_sums = [0.0] * len(hole_ranges)
+
+    for _ in range(sample_count):
+        hole_cards, mask = __sample_selection(
+            hole_ranges,
+            hole_masks,
+            alias_tables,
+            board_mask,
+            rng,
+        )
+        equities = __calculate_equities_0(
+            hole_cards,
+            board_cards,
+            hole_dealing_count,
+            board_dealing_count,
+            deck_cards,
+            mask,
+            (mask & deck_mask).bit_count(),
+            hand_types,
+            rng,
+        )
 
+        for i, equity in enumerate(equities):
+            equity_sums[i] += equity
+            squared_equity_sums[i] += equity * equity
 
-def calculate_equities(
-        hole_ranges: Iterable[Iterable[Iterable[Card]]],
-        board_cards: Iterable[Card],
+    return equity_sums, squared_equity_sums
+
+
+def __iterate_hole_cards(
+        hole_cards: tuple[list[Card], ...],
+        hole_dealing_count: int,
+        deck_cards: list[Card],
+) -> Iterator[tuple[tuple[Card, ...], ...]]:
+    if not hole_cards:
+        yield ()
+
+        return
+
+    for cards in combinations(
+            deck_cards,
+            hole_dealing_count - len(hole_cards[0]),
+    ):
+        for next_hole_cards in __iterate_hole_cards(
+                hole_cards[1:],
+                hole_dealing_count,
+                [card for card in deck_cards if card not in cards],
+        ):
+            yield (*hole_cards[0], *cards), *next_hole_cards
+
+
+def __count_deals(
+        selections: Iterable[tuple[tuple[list[Card], ...], int, float]],
+        board_cards: list[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck_mask: int,
+        max_deal_count: int,
+) -> int:
+    deal_count = 0
+
+    for selection, mask, _ in selections:
+        card_count = (deck_mask & ~mask).bit_count()
+        selection_deal_count = comb(
+            card_count,
+            board_dealing_count - len(board_cards),
+        )
+        card_count -= board_dealing_count - len(board_cards)
+
+        for cards in selection:
+            selection_deal_count *= comb(
+                card_count,
+                hole_dealing_count - len(cards),
+            )
+            card_count -= hole_dealing_count - len(cards)
+
+        deal_count += selection_deal_count
+
+        if deal_count > max_deal_count:
+            break
+
+    return deal_count
+
+
+def __enumerate_equities(
+        hole_cards: list[tuple[list[Card], ...]],
+        weights: list[float],
+        board_cards: list[Card],
         hole_dealing_count: int,
         board_dealing_count: int,
         deck: Deck,
-        hand_types: Iterable[type[Hand]],
-        *,
-        sample_count: int,
-        executor: Executor | None = None,
+        hand_types: tuple[type[Hand], ...],
 ) -> list[float]:
-    """Calculate the equities.
+    deck_cards = [card for card in deck if card not in board_cards]
+    selection_cards = [
+        frozenset(chain.from_iterable(selection)) for selection in hole_cards
+    ]
+    equity_sums = [[0.0] * len(selection) for selection in hole_cards]
+    deal_counts = [0] * len(hole_cards)
 
-    The user may supply an executor to use parallelization. If not
-    given, a single-threaded evaluation is performed.
+    for runout in combinations(
+            deck_cards,
+            board_dealing_count - len(board_cards),
+    ):
+        runout_board_cards = board_cards + list(runout)
+        hands = dict[tuple[Card, ...], list[Hand | None]]()
 
-    >>> from concurrent.futures import ProcessPoolExecutor
-    >>> from pokerkit import *
-    >>> calculate_equities(
-    ...     (
-    ...         parse_range('33'),
-    ...         parse_range('33'),
-    ...     ),
-    ...     Card.parse('Tc8d6h4s'),
-    ...     2,
-    ...     5,
-    ...     Deck.STANDARD,
-    ...     (StandardHighHand,),
-    ...     sample_count=1000,
+        for i, selection in enumerate(hole_cards):
+            if not selection_cards[i].isdisjoint(runout):
+                continue
+
+            if all(len(cards) == hole_dealing_count for cards in selection):
+                deals: Iterable[tuple[tuple[Card, ...], ...]] = (
+                    tuple(map(tuple, selection)),
+                )
+            else:
+                dealt_cards = selection_cards[i].union(runout)
+                deals = __iterate_hole_cards(
+                    selection,
+                    hole_dealing_count,
+                    [card for card in deck_cards if card not in dealt_cards],
+                )
+
+            for deal in deals:
+                for cards in deal:
+                    if cards not in hands:
+                        hands[cards] = [
+                            hand_type.from_game_or_none(
+                                cards,
+                                runout_board_cards,
+                            ) for hand_type in hand_types
+                        ]
+
+                equities = __calculate_showdown_equities(
+                    [
+                        [hands[cards][j] for cards in deal]
+                        for j in range(len(hand_types))
+                    ],
+                )
+                deal_counts[i] += 1
+
+                for j, equity in enumerate(equities):
+                    equity_sums[i][j] += equity
+
+    equities = [0.0] * max(map(len, hole_cards), default=0)
+    weight_sum = sum(
+        weight for weight, deal_count in zip(weights, deal_counts)
+        if deal_count
+    )
+
+    for equity_sums_, deal_count, weight in zip(
+            equity_sums,
+            deal_counts,
+            weights,
+    ):
+        if deal_count:
+            for i, equity_sum in enumerate(equity_sums_):
+                equities[i] += (
+                    equity_sum / deal_count * weight / weight_sum
+                )
+
+    return equities
+
+
+@dataclass(frozen=True)
+class EquityResult:
+    """The class for equity results.
+
+    The results store the sums of the equities (and of their squares)
+    over the samples, rather than their means, so that a Monte Carlo
+    estimate can be refined by merging it with more samples.
+
+    >>> result = EquityResult.merge(
+    ...     EquityResult((0.5, 1.5), (0.25, 1.25), 2),
+    ...     EquityResult((1.0, 1.0), (1.0, 1.0), 2),
     ... )
-    [0.5, 0.5]
-    >>> calculate_equities(
-    ...     (
-    ...         parse_range('2h2c'),
-    ...         parse_range('3h3c'),
-    ...         parse_range('AhKh'),
-    ...     ),
-    ...     Card.parse('3s3d4c'),
+    >>> result.sample_count
+    4
+    >>> result.equities
+    [0.375, 0.625]
+
+    Exact results, obtained by enumerating the deals, take precedence.
+
+    >>> result = EquityResult.from_equities([0.25, 0.75])
+    >>> EquityResult.merge(
+    ...     EquityResult((0.5, 1.5), (0.25, 1.25), 2),
+    ...     result,
+    ... ) == result
+    True
+    >>> result.standard_errors
+    [0.0, 0.0]
+
+    :param equity_sums: The sums of the equities of each player.
+    :param squared_equity_sums: The sums of the squared equities of each
+                                player.
+    :param sample_count: The number of samples.
+    :param exact: ``True`` if the deals were enumerated, otherwise
+                  ``False``. Defaults to ``False``.
+    """
+
+    equity_sums: tuple[float, ...]
+    """The sums of the equities of each player."""
+    squared_equity_sums: tuple[float, ...]
+    """The sums of the squared equities of each player."""
+    sample_count: int
+    """The number of samples."""
+    exact: bool = False
+    """Whether the deals were enumerated."""
+
+    @classmethod
+    def from_equities(cls, equities: Iterable[float]) -> EquityResult:
+        """Return the exact result of the equities.
+
+        :param equities: The exact equities.
+        :return: The equity result.
+        """
+        equities = tuple(equities)
+
+        return cls(
+            equities,
+            tuple(equity * equity for equity in equities),
+            1,
+            True,
+        )
+
+    @classmethod
+    def merge(cls, *results: EquityResult) -> EquityResult:
+        """Merge the results of the same situation.
+
+        If any of the results is exact, it is returned as it is.
+
+        :param results: The results to merge.
+        :return: The merged result.
+        """
+        for result in results:
+            if result.exact:
+                return result
+
+        return cls(
+            tuple(map(sum, zip(*(result.equity_sums for result in results)))),
+            tuple(
+                map(
+                    sum,
+                    zip(*(result.squared_equity_sums for result in results)),
+                ),
+            ),
+            sum(result.sample_count for result in results),
+        )
+
+    @property
+    def equities(self) -> list[float]:
+        """Return the (estimated) equities.
+
+        :return: The equities.
+        """
+        return [
+            equity_sum / self.sample_count for equity_sum in self.equity_sums
+        ]
+
+    @property
+    def standard_errors(self) -> list[float]:
+        """Return the standard errors of the estimated equities.
+
+        The standard errors are zero for exact results and infinite for
+        fewer than two samples.
+
+        :return: The standard errors.
+        """
+        if self.exact:
+            return [0.0] * len(self.equity_sums)
+        elif self.sample_count < 2:
+            return [inf] * len(self.equity_sums)
+
+        standard_errors = []
+
+        for equity_sum, squared_equity_sum in zip(
+                self.equity_sums,
+                self.squared_equity_sums,
+        ):
+            variance = (
+                squared_equity_sum
+                - equity_sum * equity_sum / self.sample_count
+            ) / (self.sample_count - 1)
+
+            standard_errors.append(sqrt(max(variance, 0) / self.sample_count))
+
+        return standard_errors
+
+
+@dataclass
+class EquityCache:
+    """The class for caches of equity results.
+
+    The results are kept in memory, up to ``max_size`` of them, in the
+    order of their last uses. If a path is given, the results are also
+    persisted in an SQLite database at it, without any bound, and are
+    shared across sessions and processes. A cache can be shared across
+    threads, as the accesses are serialized through a lock.
+
+    The results are keyed by a digest of a canonical description of the
+    situation (see :meth:`pokerkit.analysis.EquityCache.get_key`), so
+    that situations which only differ by a permutation of the suits
+    share their results.
+
+    >>> from pokerkit import *
+    >>> equity_cache = EquityCache()
+    >>> args = (
+    ...     (parse_range('AsKs'), parse_range('QhQd')),
+    ...     tuple(Card.parse('Ts8s2c3d')),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ... )
+    >>> equities = calculate_equities(
+    ...     *args,
+    ...     exhaustive=True,
+    ...     equity_cache=equity_cache,
+    ... )
+    >>> key = EquityCache.get_key(*args)
+    >>> equity_cache.get(key).equities == equities
+    True
+    >>> EquityCache.get_key(
+    ...     (parse_range('AhKh'), parse_range('QsQd')),
+    ...     Card.parse('Th8h2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ... ) == key
+    True
+
+    The cached Monte Carlo estimates are refined by the later
+    calculations with more samples, or with lower target standard
+    errors.
+
+    >>> from random import Random
+    >>> args = (
+    ...     (parse_range('AK'), parse_range('QQ')),
+    ...     tuple(Card.parse('Ts8s2c')),
     ...     2,
     ...     5,
     ...     Deck.STANDARD,
     ...     (StandardHighHand,),
+    ... )
+    >>> key = EquityCache.get_key(*args)
+    >>> equities = calculate_equities(
+    ...     *args,
     ...     sample_count=1000,
+    ...     rng=Random(0),
+    ...     equity_cache=equity_cache,
     ... )
-    [0.0, 1.0, 0.0]
-    >>> with ProcessPoolExecutor() as executor:
-    ...     calculate_equities(
-    ...         (
-    ...             parse_range('2h2c'),
-    ...             parse_range('3h3c'),
-    ...             parse_range('AsKs'),
-    ...         ),
-    ...         Card.parse('QsJsTs'),
-    ...         2,
-    ...         5,
-    ...         Deck.STANDARD,
-    ...         (StandardHighHand,),
-    ...         sample_count=1000,
-    ...         executor=executor,
-    ...     )
-    ...
-    [0.0, 0.0, 1.0]
+    >>> equity_cache.get(key).sample_count
+    1000
+    >>> calculate_equities(
+    ...     *args,
+    ...     sample_count=1000,
+    ...     equity_cache=equity_cache,
+    ... ) == equities
+    True
+    >>> equities = calculate_equities(
+    ...     *args,
+    ...     sample_count=3000,
+    ...     rng=Random(0),
+    ...     equity_cache=equity_cache,
+    ... )
+    >>> equity_cache.get(key).sample_count
+    3000
 
-    :param hole_ranges: The ranges of each player in the pot.
-    :param board_cards: The board cards, may be empty.
-    :param hole_dealing_count: The final number of hole cards; for
-                               hold'em, it is ``2``.
-    :param board_dealing_count: The final number of board cards; for
-                                hold'em, it is ``5``.
-    :param deck: The deck; most games typically use
-                 :attr:`pokerkit.utilities.Deck.STANDARD`.
-    :param hand_types: The hand types; most games typically just use
-                       :class:`pokerkit.hands.StandardHighHand`.
-    :param sample_count: The number of samples to simulate, higher value
-                         gives greater accuracy and fidelity.
-    :param executor: The optional executor, defaults to ``None`` which
-                     is just using 1 thread/process. The user can supply
-                     a ``ProcessPoolExecutor`` to use processes.
-    :return: The equity values.
+    :param max_size: The maximum number of results kept in memory,
+                     defaults to ``1024``.
+    :param path: The optional path of the SQLite database in which the
+                 results are persisted, defaults to ``None``.
     """
-    hole_ranges = tuple(map(list, map(partial(map, list), hole_ranges)))
-    board_cards = list(board_cards)
-    hand_types = tuple(hand_types)
-    hole_cards = []
-    deck_cards = []
 
-    for selection in product(*hole_ranges):
-        counter = Counter(chain(chain.from_iterable(selection), board_cards))
+    max_size: int = 1024
+    """The maximum number of results kept in memory."""
+    path: str | None = None
+    """The optional path of the SQLite database."""
+    __results: OrderedDict[str, EquityResult] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    __connection: Connection | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    __lock: Lock = field(
+        default_factory=Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-        if all(map(partial(eq, 1), counter.values())):
-            hole_cards.append(selection)
-            deck_cards.append(list(set(deck) - counter.keys()))
+    def __post_init__(self) -> None:
+        if self.path is not None:
+            self.__connection = connect(self.path, check_same_thread=False)
 
-    fn = partial(
-        __calculate_equities_1,
-        hole_cards,  # type: ignore[arg-type]
-        board_cards,
-        hole_dealing_count,
-        board_dealing_count,
-        deck_cards,
-        hand_types,
-    )
-    mapper: Any = map if executor is None else executor.map
-    indices = choices(range(len(hole_cards)), k=sample_count)
-    equities = [0.0] * len(hole_ranges)
+            with self.__connection:
+                self.__connection.execute(
+                    (
+                        'CREATE TABLE IF NOT EXISTS equity_results'
+                        ' (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+                    ),
+                )
 
-    for i, equity in chain.from_iterable(map(enumerate, mapper(fn, indices))):
-        equities[i] += equity
+    def __enter__(self) -> EquityCache:
+        return self
 
-    for i, equity in enumerate(equities):
-        equities[i] = equity / sample_count
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
-    return equities
+    @classmethod
+    @cache
+    def __get_permutation_tables(cls) -> tuple[dict[int, int], ...]:
+        suits = Suit.CLUB, Suit.DIAMOND, Suit.HEART, Suit.SPADE
+        cards = tuple(starmap(Card, product(Rank, Suit)))
+        tables = []
 
+        for permuted_suits in permutations(suits):
+            permutation = dict(zip(suits, permuted_suits))
+            tables.append(
+                dict(
+                    zip(
+                        (card.index for card in cards),
+                        (
+                            card.index for card in Card.permute_suits(
+                                cards,
+                                permutation,
+                            )
+                        ),
+                    ),
+                ),
+            )
 
-def calculate_hand_strength(
-        player_count: int,
-        hole_range: Iterable[Iterable[Card]],
+        return tuple(tables)
+
+    @classmethod
+    def get_key(
+            cls,
+            hole_ranges: Iterable[Iterable[Iterable[Card]]],
+            board_cards: Iterable[Card],
+            hole_dealing_count: int,
+            board_dealing_count: int,
+            deck: Deck,
+            hand_types: Iterable[type[Hand]],
+    ) -> str:
+        """Return the key of the situation.
+
+        The key is the digest of the canonical description of the
+        situation: the combinations (and weights) of the ranges that do
+        not conflict with the board cards, the board cards, the cards
+        of the deck, the numbers of dealings, and the hand types. The
+        suits of the cards are permuted so that the description is the
+        lexicographically smallest among those of the permutations of
+        the suits (see also
+        :meth:`pokerkit.utilities.Card.canonicalize`).
+
+        :param hole_ranges: The ranges of each player in the pot.
+        :param board_cards: The board cards, may be empty.
+        :param hole_dealing_count: The final number of hole cards.
+        :param board_dealing_count: The final number of board cards.
+        :param deck: The deck.
+        :param hand_types: The hand types.
+        :return: The key.
+        """
+        board_indices = [card.index for card in board_cards]
+        board_mask = sum(1 << index for index in board_indices)
+        deck_indices = [card.index for card in deck]
+        ranges = []
+
+        for hole_range in hole_ranges:
+            items = []
+
+            for cards in hole_range:
+                cards = tuple(cards)
+                mask = Card.get_mask(cards)
+
+                if mask.bit_count() == len(cards) and not mask & board_mask:
+                    items.append(
+                        (
+                            [card.index for card in cards],
+                            (
+                                hole_range.get_weight(cards)
+                                if isinstance(hole_range, WeightedRange)
+                                else 1.0
+                            ),
+                        ),
+                    )
+
+            ranges.append(items)
+
+        def describe_cards(
+                table: dict[int, int],
+        ) -> tuple[list[int], list[int]]:
+            return (
+                sorted(map(table.__getitem__, board_indices)),
+                sorted(map(table.__getitem__, deck_indices)),
+            )
+
+        def describe_ranges(
+                table: dict[int, int],
+        ) -> list[list[tuple[list[int], float]]]:
+            return [
+                sorted(
+                    (sorted(map(table.__getitem__, indices)), weight)
+                    for indices, weight in items
+                ) for items in ranges
+            ]
+
+        tables = cls.__get_permutation_tables()
+        cards_description = min(map(describe_cards, tables))
+        tables = tuple(
+            table for table in tables
+            if describe_cards(table) == cards_description
+        )
+        description = (
+            min(map(describe_ranges, tables)),
+            cards_description,
+            hole_dealing_count,
+            board_dealing_count,
+            [
+                f'{hand_type.__module__}.{hand_type.__qualname__}'
+                for hand_type in hand_types
+            ],
+        )
+
+        return sha256(repr(description).encode()).hexdigest()
+
+    def get(self, key: str) -> EquityResult | None:
+        """Return the cached result of the key, if any.
+
+        :param key: The key.
+        :return: The result, ``None`` if not cached.
+        """
+        with self.__lock:
+            return self.__get(key)
+
+    def __get(self, key: str) -> EquityResult | None:
+        if key in self.__results:
+            self.__results.move_to_end(key)
+
+            return self.__results[key]
+        elif self.__connection is None:
+            return None
+
+        row = self.__connection.execute(
+            'SELECT value FROM equity_results WHERE key = ?',
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        value = loads(row[0])
+        result = EquityResult(
+            tuple(value['equity_sums']),
+            tuple(value['squared_equity_sums']),
+            value['sample_count'],
+            value['exact'],
+        )
+
+        self.__add(key, result)
+
+        return result
+
+    def put(self, key: str, result: EquityResult) -> None:
+        """Cache the result of the key.
+
+        Any result already cached is replaced.
+
+        :param key: The key.
+        :param result: The result.
+        :return: ``None``.
+        """
+        with self.__lock:
+            self.__add(key, result)
+
+            if self.__connection is not None:
+                with self.__connection:
+                    self.__connection.execute(
+                        (
+                            'INSERT OR REPLACE INTO equity_results'
+                            ' (key, value) VALUES (?, ?)'
+                        ),
+                        (key, dumps(asdict(result))),
+                    )
+
+    def __add(self, key: str, result: EquityResult) -> None:
+        self.__results[key] = result
+
+        self.__results.move_to_end(key)
+
+        while len(self.__results) > self.max_size:
+            self.__results.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the database, if any.
+
+        :return: ``None``.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+
+                self.__connection = None
+
+
+def calculate_equities(
+        hole_ranges: Iterable[Iterable[Iterable[Card]]],
         board_cards: Iterable[Card],
         hole_dealing_count: int,
         board_dealing_count: int,
         deck: Deck,
         hand_types: Iterable[type[Hand]],
         *,
-        sample_count: int,
+        sample_count: int | None = None,
         executor: Executor | None = None,
-) -> float:
-    """Calculate the hand strength: odds of beating a single other hand
-    chosen uniformly at random.
+        exhaustive: bool = False,
+        exhaustive_deal_count: int = 0,
+        block_size: int | None = None,
+        rng: Random | None = None,
+        standard_error: float | None = None,
+        time_limit: float | None = None,
+        equity_cache: EquityCache | None = None,
+) -> list[float]:
+    """Calculate the equities.
 
     The user may supply an executor to use parallelization. If not
     given, a single-threaded evaluation is performed.
 
+    The samples are dispatched to the executor in blocks. Each task
+    carries the shared inputs once, draws the samples of its block from
+    its own random number generator, and returns the sums of the
+    equities, so that the communication overhead does not grow with the
+    number of samples. By default, the samples are split into four
+    blocks per CPU.
+
+    The seeds of the random number generators of the blocks are drawn
+    from ``rng``, if supplied. Hence, for a seeded generator and a
+    fixed block size, the estimates are reproducible, regardless of the
+    executor.
+
+    By default, the equities are estimated through Monte Carlo
+    simulations. If ``exhaustive`` is ``True``, or if the number of
+    deals (the compatible selections of the hole cards from the ranges,
+    each completed by every remaining runout of the board cards and
+    every remaining combination of the hole cards) is at most
+    ``exhaustive_deal_count``, every deal is enumerated instead and the
+    exact equities are returned. The deals are enumerated runout by
+    runout, and the hands of the combinations of the hole cards are
+    evaluated once per runout and shared between the selections. The
+    executor, if any, is not used for the enumeration.
+
     >>> from concurrent.futures import ProcessPoolExecutor
     >>> from pokerkit import *
-    >>> calculate_hand_strength(
-    ...     3,
-    ...     parse_range('3h3c'),
-    ...     Card.parse('3s3d2c2h'),
+    >>> calculate_equities(
+    ...     (
+    ...         parse_range('33'),
+    ...         parse_range('33'),
+    ...     ),
+    ...     Card.parse('Tc8d6h4s'),
     ...     2,
     ...     5,
     ...     Deck.STANDARD,
     ...     (StandardHighHand,),
     ...     sample_count=1000,
     ... )
-    1.0
+    [0.5, 0.5]
+    >>> calculate_equities(
+    ...     (
+    ...         parse_range('2h2c'),
+    ...         parse_range('3h3c'),
+    ...         parse_range('AhKh'),
+    ...     ),
+    ...     Card.parse('3s3d4c'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=1000,
+    ... )
+    [0.0, 1.0, 0.0]
     >>> with ProcessPoolExecutor() as executor:
-    ...     calculate_hand_strength(
-    ...         3,
-    ...         parse_range('AsKs'),
+    ...     calculate_equities(
+    ...         (
+    ...             parse_range('2h2c'),
+    ...             parse_range('3h3c'),
+    ...             parse_range('AsKs'),
+    ...         ),
     ...         Card.parse('QsJsTs'),
     ...         2,
     ...         5,
@@ -374,10 +1480,71 @@ def calculate_hand_strength(
     ...         executor=executor,
     ...     )
     ...
-    1.0
+    [0.0, 0.0, 1.0]
 
-    :param player_count: Number of players in the pot.
-    :param hole_range: The range of the player.
+    Exact equities can be calculated for small numbers of deals, like on
+    the turn.
+
+    >>> equities = calculate_equities(
+    ...     (
+    ...         parse_range('AsKs'),
+    ...         parse_range('QhQd'),
+    ...     ),
+    ...     Card.parse('Ts8s2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     exhaustive=True,
+    ... )
+    >>> [round(equity * 44) for equity in equities]
+    [15, 29]
+
+    >>> calculate_equities(
+    ...     (
+    ...         parse_range('AsKs'),
+    ...         parse_range('QhQd'),
+    ...     ),
+    ...     Card.parse('Ts8s2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=1000,
+    ...     exhaustive_deal_count=1000,
+    ... ) == equities
+    True
+
+    The estimates can be reproduced with seeded random number
+    generators.
+
+    >>> from random import Random
+    >>> args = (
+    ...     (parse_range('AK'), parse_range('QQ')),
+    ...     tuple(Card.parse('Ts8s2c')),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ... )
+    >>> equities = calculate_equities(
+    ...     *args,
+    ...     sample_count=1000,
+    ...     block_size=100,
+    ...     rng=Random(0),
+    ... )
+    >>> with ProcessPoolExecutor() as executor:
+    ...     calculate_equities(
+    ...         *args,
+    ...         sample_count=1000,
+    ...         executor=executor,
+    ...         block_size=100,
+    ...         rng=Random(0),
+    ...     ) == equities
+    ...
+    True
+
+    :param hole_ranges: The ranges of each player in the pot.
     :param board_cards: The board cards, may be empty.
     :param hole_dealing_count: The final number of hole cards; for
                                hold'em, it is ``2``.
@@ -388,19 +1555,40 @@ def calculate_hand_strength(
     :param hand_types: The hand types; most games typically just use
                        :class:`pokerkit.hands.StandardHighHand`.
     :param sample_count: The number of samples to simulate, higher value
-                         gives greater accuracy and fidelity.
+                         gives greater accuracy and fidelity. Only
+                         optional if the deals are enumerated or a time
+                         limit is given.
     :param executor: The optional executor, defaults to ``None`` which
                      is just using 1 thread/process. The user can supply
                      a ``ProcessPoolExecutor`` to use processes.
+    :param exhaustive: ``True`` to enumerate every deal, otherwise
+                       ``False``. Defaults to ``False``.
+    :param exhaustive_deal_count: The number of deals up to which the
+                                  deals are enumerated even if
+                                  ``exhaustive`` is ``False``. Defaults
+                                  to ``0``.
+    :param block_size: The optional number of samples per task
+                       dispatched to the executor.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :param standard_error: The optional standard error of the equities
+                           at which the sampling stops early. For more
+                           details, please refer to
+                           :func:`pokerkit.analysis.estimate_equities`.
+    :param time_limit: The optional number of seconds after which the
+                       sampling stops early. For more details, please
+                       refer to
+                       :func:`pokerkit.analysis.estimate_equities`.
+    :param equity_cache: The optional cache of the results. For more
+                         details, please refer to
+                         :func:`pokerkit.analysis.estimate_equities`.
     :return: The equity values.
+    :raises ValueError: If neither the number of samples nor a time
+                        limit is given even though the deals are not
+                        enumerated.
     """
-    hole_ranges: list[Iterable[Iterable[Card]]] = [
-        [[]] for _ in range(player_count - 1)
-    ]
-
-    hole_ranges.append(hole_range)
-
-    equities = calculate_equities(
+    equities, _ = estimate_equities(
         hole_ranges,
         board_cards,
         hole_dealing_count,
@@ -409,118 +1597,2494 @@ def calculate_hand_strength(
         hand_types,
         sample_count=sample_count,
         executor=executor,
+        exhaustive=exhaustive,
+        exhaustive_deal_count=exhaustive_deal_count,
+        block_size=block_size,
+        rng=rng,
+        standard_error=standard_error,
+        time_limit=time_limit,
+        equity_cache=equity_cache,
     )
 
-    return equities[-1]
+    return equities
+
+
+def estimate_equities(
+        hole_ranges: Iterable[Iterable[Iterable[Card]]],
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_types: Iterable[type[Hand]],
+        *,
+        sample_count: int | None = None,
+        executor: Executor | None = None,
+        exhaustive: bool = False,
+        exhaustive_deal_count: int = 0,
+        block_size: int | None = None,
+        rng: Random | None = None,
+        standard_error: float | None = None,
+        time_limit: float | None = None,
+        equity_cache: EquityCache | None = None,
+) -> tuple[list[float], list[float]]:
+    """Estimate the equities and their standard errors.
+
+    This function accepts the same arguments as
+    :func:`pokerkit.analysis.calculate_equities` but also returns the
+    standard errors of the estimated equities (the standard deviations
+    of the equities of the samples, divided by the square root of the
+    number of samples). The standard errors are zero for enumerated
+    deals.
+
+    Instead of (or on top of) a fixed number of samples, a target
+    standard error and/or a time limit can be supplied. Then, the
+    samples are drawn in rounds (of one block per task, or of
+    ``1000`` samples without an explicit block size) and the sampling
+    stops after the first round at which the standard error of every
+    player's equity is at most ``standard_error``, the elapsed time is
+    at least ``time_limit`` seconds, or ``sample_count`` samples have
+    been drawn. Since a target standard error may not be reached in
+    any reasonable time (e.g., if it is ``0``), the number of samples
+    or the time limit must bound the sampling.
+
+    >>> from random import Random
+    >>> from pokerkit import *
+    >>> equities, standard_errors = estimate_equities(
+    ...     (
+    ...         parse_range('AK'),
+    ...         parse_range('QQ'),
+    ...     ),
+    ...     Card.parse('Ts8s2c'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=100000,
+    ...     rng=Random(0),
+    ...     standard_error=0.01,
+    ... )
+    >>> max(standard_errors) <= 0.01
+    True
+    >>> abs(equities[0] - 0.2746) < 0.05
+    True
+    >>> estimate_equities(
+    ...     (
+    ...         parse_range('2h2c'),
+    ...         parse_range('3h3c'),
+    ...     ),
+    ...     Card.parse('3s3d4c'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     time_limit=60,
+    ...     standard_error=0,
+    ... )
+    ([0.0, 1.0], [0.0, 0.0])
+
+    :param hole_ranges: The ranges of each player in the pot.
+    :param board_cards: The board cards, may be empty.
+    :param hole_dealing_count: The final number of hole cards; for
+                               hold'em, it is ``2``.
+    :param board_dealing_count: The final number of board cards; for
+                                hold'em, it is ``5``.
+    :param deck: The deck; most games typically use
+                 :attr:`pokerkit.utilities.Deck.STANDARD`.
+    :param hand_types: The hand types; most games typically just use
+                       :class:`pokerkit.hands.StandardHighHand`.
+    :param sample_count: The (maximum) number of samples to simulate.
+                         Only optional if the deals are enumerated or a
+                         time limit is given.
+    :param executor: The optional executor, defaults to ``None`` which
+                     is just using 1 thread/process.
+    :param exhaustive: ``True`` to enumerate every deal, otherwise
+                       ``False``. Defaults to ``False``.
+    :param exhaustive_deal_count: The number of deals up to which the
+                                  deals are enumerated even if
+                                  ``exhaustive`` is ``False``. Defaults
+                                  to ``0``.
+    :param block_size: The optional number of samples per task
+                       dispatched to the executor.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :param standard_error: The optional standard error at which the
+                           sampling stops.
+    :param time_limit: The optional number of seconds after which the
+                       sampling stops.
+    :param equity_cache: The optional cache of the results. The exact
+                         results are reused as they are, and the
+                         estimates are refined with more samples until
+                         the stopping criteria are met (the number of
+                         samples includes the cached ones).
+    :return: The equity values and their standard errors.
+    :raises ValueError: If neither the number of samples nor a time
+                        limit is given even though the deals are not
+                        enumerated.
+    """
+    board_cards = list(board_cards)
+    board_mask = Card.get_mask(board_cards)
+    hand_types = tuple(hand_types)
+    key = None
+    result = None
+
+    if equity_cache is not None:
+        hole_ranges = [
+            (
+                hole_range
+                if isinstance(hole_range, (CompiledRange, WeightedRange))
+                else list(hole_range)
+            ) for hole_range in hole_ranges
+        ]
+        key = equity_cache.get_key(
+            hole_ranges,
+            board_cards,
+            hole_dealing_count,
+            board_dealing_count,
+            deck,
+            hand_types,
+        )
+        result = equity_cache.get(key)
+
+        if result is not None and result.exact:
+            return result.equities, result.standard_errors
+
+    ranges: list[list[list[Card]]] = []
+    range_masks: list[list[int]] = []
+    range_weights: list[list[float]] = []
+
+    for hole_range in hole_ranges:
+        items: Iterable[tuple[list[Card], int]]
+
+        if isinstance(hole_range, CompiledRange):
+            items = zip(
+                map(list, hole_range.hole_cards),
+                hole_range.sorted_masks,
+            )
+        else:
+            items = sorted(
+                (
+                    (cards, Card.get_mask(cards)) for cards in (
+                        sorted(cards, key=attrgetter('index'))
+                        for cards in hole_range
+                    )
+                ),
+                key=itemgetter(1),
+            )
+
+        ranges.append([])
+        range_masks.append([])
+        range_weights.append([])
+
+        for cards, mask in items:
+            if mask.bit_count() == len(cards) and not mask & board_mask:
+                ranges[-1].append(cards)
+                range_masks[-1].append(mask)
+                range_weights[-1].append(
+                    (
+                        hole_range.get_weight(cards)
+                        if isinstance(hole_range, WeightedRange)
+                        else 1
+                    ),
+                )
+
+    sorted_hole_ranges = tuple(ranges)
+    hole_masks = tuple(range_masks)
+    hole_weights = tuple(range_weights)
+    selections = partial(
+        __iterate_selections,
+        sorted_hole_ranges,
+        hole_masks,
+        hole_weights,
+        board_mask,
+    )
+
+    if next(selections(), None) is None:
+        raise ValueError(
+            'No selection of the hole cards from the ranges is compatible.',
+        )
+
+    deck_cards = list(deck)
+
+    if exhaustive or (
+            exhaustive_deal_count
+            and __count_deals(
+                selections(),
+                board_cards,
+                hole_dealing_count,
+                board_dealing_count,
+                Card.get_mask(deck_cards),
+                exhaustive_deal_count,
+            ) <= exhaustive_deal_count
+    ):
+        selections_ = list(selections())
+        equities = __enumerate_equities(
+            [selection for selection, _, _ in selections_],
+            [weight for _, _, weight in selections_],
+            board_cards,
+            hole_dealing_count,
+            board_dealing_count,
+            deck,
+            hand_types,
+        )
+
+        if equity_cache is not None:
+            assert key is not None
+
+            equity_cache.put(key, EquityResult.from_equities(equities))
+
+        return equities, [0.0] * len(equities)
+
+    stopping_status = standard_error is not None or time_limit is not None
+
+    if sample_count is None and time_limit is None:
+        raise ValueError(
+            (
+                'The number of samples or a time limit must be given unless'
+                ' the deals are enumerated.'
+            ),
+        )
+
+    fn = partial(
+        __calculate_equities_1,
+        sorted_hole_ranges,
+        hole_masks,
+        tuple(map(__get_alias_table, hole_weights)),
+        board_cards,
+        hole_dealing_count,
+        board_dealing_count,
+        deck_cards,
+        hand_types,
+    )
+    mapper: Any = map if executor is None else executor.map
+    block_count = 1 if executor is None else 4 * (cpu_count() or 1)
+
+    if stopping_status:
+        if block_size is None:
+            block_size = ceil(__ROUND_SAMPLE_COUNT / block_count)
+
+        round_sample_count = block_count * max(block_size, 1)
+    else:
+        assert sample_count is not None
+
+        if block_size is None:
+            block_size = ceil(sample_count / block_count)
+
+        round_sample_count = sample_count
+
+    block_size = max(block_size, 1)
+
+    if result is None:
+        result = EquityResult(
+            (0.0,) * len(sorted_hole_ranges),
+            (0.0,) * len(sorted_hole_ranges),
+            0,
+        )
+
+    cached_sample_count = result.sample_count
+    start_time = perf_counter()
+
+    while (
+            (sample_count is None or result.sample_count < sample_count)
+            and (
+                standard_error is None
+                or max(result.standard_errors) > standard_error
+            )
+    ):
+        if sample_count is not None:
+            round_sample_count = min(
+                round_sample_count,
+                sample_count - result.sample_count,
+            )
+
+        blocks = [
+            (
+                min(block_size, round_sample_count - begin),
+                getrandbits(64) if rng is None else rng.getrandbits(64),
+            ) for begin in range(0, round_sample_count, block_size)
+        ]
+        equity_sums = list(result.equity_sums)
+        squared_equity_sums = list(result.squared_equity_sums)
+
+        for block_equity_sums, block_squared_equity_sums in mapper(
+                fn,
+                blocks,
+        ):
+            for i in range(len(sorted_hole_ranges)):
+                equity_sums[i] += block_equity_sums[i]
+                squared_equity_sums[i] += block_squared_equity_sums[i]
+
+        result = EquityResult(
+            tuple(equity_sums),
+            tuple(squared_equity_sums),
+            result.sample_count + round_sample_count,
+        )
+
+        if (
+                time_limit is not None
+                and perf_counter() - start_time >= time_limit
+        ):
+            break
+
+    if equity_cache is not None and result.sample_count > cached_sample_count:
+        assert key is not None
+
+        equity_cache.put(key, result)
+
+    return result.equities, result.standard_errors
+
+
+def calculate_hand_strength(
+        player_count: int,
+        hole_range: Iterable[Iterable[Card]],
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_types: Iterable[type[Hand]],
+        *,
+        sample_count: int | None = None,
+        executor: Executor | None = None,
+        block_size: int | None = None,
+        rng: Random | None = None,
+        standard_error: float | None = None,
+        time_limit: float | None = None,
+        equity_cache: EquityCache | None = None,
+) -> float:
+    """Calculate the hand strength: odds of beating a single other hand
+    chosen uniformly at random.
+
+    The user may supply an executor to use parallelization. If not
+    given, a single-threaded evaluation is performed.
+
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from pokerkit import *
+    >>> calculate_hand_strength(
+    ...     3,
+    ...     parse_range('3h3c'),
+    ...     Card.parse('3s3d2c2h'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=1000,
+    ... )
+    1.0
+    >>> with ProcessPoolExecutor() as executor:
+    ...     calculate_hand_strength(
+    ...         3,
+    ...         parse_range('AsKs'),
+    ...         Card.parse('QsJsTs'),
+    ...         2,
+    ...         5,
+    ...         Deck.STANDARD,
+    ...         (StandardHighHand,),
+    ...         sample_count=1000,
+    ...         executor=executor,
+    ...     )
+    ...
+    1.0
+
+    :param player_count: Number of players in the pot.
+    :param hole_range: The range of the player.
+    :param board_cards: The board cards, may be empty.
+    :param hole_dealing_count: The final number of hole cards; for
+                               hold'em, it is ``2``.
+    :param board_dealing_count: The final number of board cards; for
+                                hold'em, it is ``5``.
+    :param deck: The deck; most games typically use
+                 :attr:`pokerkit.utilities.Deck.STANDARD`.
+    :param hand_types: The hand types; most games typically just use
+                       :class:`pokerkit.hands.StandardHighHand`.
+    :param sample_count: The number of samples to simulate, higher value
+                         gives greater accuracy and fidelity.
+    :param executor: The optional executor, defaults to ``None`` which
+                     is just using 1 thread/process. The user can supply
+                     a ``ProcessPoolExecutor`` to use processes.
+    :param block_size: The optional number of samples per task
+                       dispatched to the executor.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :param standard_error: The optional standard error of the equity
+                           at which the sampling stops early. For more
+                           details, please refer to
+                           :func:`pokerkit.analysis.estimate_equities`.
+    :param time_limit: The optional number of seconds after which the
+                       sampling stops early. For more details, please
+                       refer to
+                       :func:`pokerkit.analysis.estimate_equities`.
+    :param equity_cache: The optional cache of the results. For more
+                         details, please refer to
+                         :func:`pokerkit.analysis.estimate_equities`.
+    :return: The equity values.
+    """
+    hole_ranges: list[Iterable[Iterable[Card]]] = [
+        [[]] for _ in range(player_count - 1)
+    ]
+
+    hole_ranges.append(hole_range)
+
+    equities = calculate_equities(
+        hole_ranges,
+        board_cards,
+        hole_dealing_count,
+        board_dealing_count,
+        deck,
+        hand_types,
+        sample_count=sample_count,
+        executor=executor,
+        block_size=block_size,
+        rng=rng,
+        standard_error=standard_error,
+        time_limit=time_limit,
+        equity_cache=equity_cache,
+    )
+
+    return equities[-1]
+
+
+def __calculate_equity_matrix_0(
+        hole_cards: list[tuple[Card, ...]],
+        other_hole_cards: list[tuple[Card, ...]],
+        board_cards: list[Card],
+        hand_types: tuple[type[Hand], ...],
+        runouts: list[tuple[Card, ...]],
+) -> tuple[list[list[float]], list[list[int]]]:
+    cards = hole_cards + other_hole_cards
+    masks = list(map(Card.get_mask, cards))
+    offset = len(hole_cards)
+    pairs = [
+        (i, j) for i, j in product(
+            range(len(hole_cards)),
+            range(len(other_hole_cards)),
+        ) if not masks[i] & masks[offset + j]
+    ]
+    equity_sums = [[0.0] * len(other_hole_cards) for _ in hole_cards]
+    deal_counts = [[0] * len(other_hole_cards) for _ in hole_cards]
+
+    for runout in runouts:
+        runout_mask = Card.get_mask(runout)
+        runout_board_cards = board_cards + list(runout)
+        statuses = [not mask & runout_mask for mask in masks]
+        strengths = [[-1] * len(hand_types) for _ in cards]
+
+        for i, hand_type in enumerate(hand_types):
+            hands = [
+                (
+                    hand_type.from_game_or_none(cards_, runout_board_cards)
+                    if status
+                    else None
+                ) for cards_, status in zip(cards, statuses)
+            ]
+            indexed_hands = sorted(
+                (
+                    (k, hand) for k, hand in enumerate(hands)
+                    if hand is not None
+                ),
+                key=lambda indexed_hand: indexed_hand[1],
+            )
+            strength = -1
+            previous_hand: Hand | None = None
+
+            for k, hand in indexed_hands:
+                if previous_hand is None or previous_hand < hand:
+                    strength += 1
+                    previous_hand = hand
+
+                strengths[k][i] = strength
+
+        for i, j in pairs:
+            if statuses[i] and statuses[offset + j]:
+                equity = 0.0
+
+                for strength, other_strength in zip(
+                        strengths[i],
+                        strengths[offset + j],
+                ):
+                    if strength > other_strength:
+                        equity += 1
+                    elif strength == other_strength:
+                        equity += 0.5
+
+                equity_sums[i][j] += equity / len(hand_types)
+                deal_counts[i][j] += 1
+
+    return equity_sums, deal_counts
+
+
+@dataclass(frozen=True)
+class EquityMatrix:
+    """The class for equity matrices of the hole card combinations of a
+    range against those of another.
+
+    Typically, the matrices are created through
+    :func:`pokerkit.analysis.calculate_equity_matrix`.
+
+    :param hole_cards: The hole card combinations of the range.
+    :param other_hole_cards: The hole card combinations of the other
+                             range.
+    :param equities: The equities of each combination of the range
+                     against each combination of the other range.
+    :param board_cards: The board cards, defaults to ``()``.
+    """
+
+    hole_cards: tuple[tuple[Card, ...], ...]
+    """The hole card combinations of the range (the rows)."""
+    other_hole_cards: tuple[tuple[Card, ...], ...]
+    """The hole card combinations of the other range (the columns)."""
+    equities: tuple[tuple[float | None, ...], ...]
+    """The equities of each combination of the range against each
+    combination of the other range, ``None`` if they share cards (or,
+    when sampled, if no runout was drawn for them).
+    """
+    board_cards: tuple[Card, ...] = ()
+    """The board cards."""
+
+    def get_equities(self) -> list[float | None]:
+        """Return the equity of each combination of the range against
+        the other range as a whole.
+
+        Each equity is the mean of the equities against the compatible
+        combinations of the other range, which are equally likely.
+
+        :return: The equities, ``None`` for a combination that is
+                 incompatible with every combination of the other range.
+        """
+        equities: list[float | None] = []
+
+        for row in self.equities:
+            values: list[float] = list(filter_none(row))
+
+            equities.append(mean(values) if values else None)
+
+        return equities
+
+    def get_range_equity(self) -> float:
+        """Return the equity of the range against the other range.
+
+        As with :func:`pokerkit.analysis.calculate_equities`, each
+        compatible pair of combinations is equally likely.
+
+        :return: The equity.
+        :raises ValueError: If no pair of combinations is compatible.
+        """
+        values: list[float] = list(
+            filter_none(chain.from_iterable(self.equities)),
+        )
+
+        if not values:
+            raise ValueError('No pair of combinations is compatible.')
+
+        return mean(values)
+
+
+def calculate_equity_matrix(
+        hole_range: Iterable[Iterable[Card]],
+        other_hole_range: Iterable[Iterable[Card]],
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_types: Iterable[type[Hand]],
+        *,
+        sample_count: int | None = None,
+        executor: Executor | None = None,
+        block_size: int | None = None,
+        rng: Random | None = None,
+) -> EquityMatrix:
+    """Calculate the equity of each hole card combination of a range
+    against each hole card combination of another range.
+
+    Unlike calling :func:`pokerkit.analysis.calculate_equities` for
+    every pair of combinations, the matrix is computed in a single pass
+    over the runouts of the board. For each runout, the hand of every
+    combination of both ranges is evaluated once and then compared
+    against every compatible combination of the other range. The
+    incompatible pairs are identified through bitmasks of the card
+    indices.
+
+    By default, every runout is enumerated and the exact equities are
+    returned. If ``sample_count`` is given, that many runouts are drawn
+    instead, uniformly at random. The runouts are dispatched to the
+    executor, if any, in blocks (of ``block_size`` runouts, by default
+    four blocks per CPU).
+
+    >>> from pokerkit import *
+    >>> matrix = calculate_equity_matrix(
+    ...     parse_range('AsKs', 'AhKd'),
+    ...     parse_range('QQ'),
+    ...     Card.parse('Ts8s2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ... )
+    >>> matrix.hole_cards
+    ((Kd, Ah), (Ks, As))
+    >>> matrix.other_hole_cards[:3]
+    ((Qc, Qd), (Qc, Qh), (Qc, Qs))
+    >>> [round(equity * 44) for equity in matrix.equities[1]]
+    [15, 15, 14, 15, 14, 14]
+    >>> [round(equity * 44, 1) for equity in matrix.get_equities()]
+    [6.0, 14.5]
+    >>> equity = calculate_equities(
+    ...     (parse_range('AsKs', 'AhKd'), parse_range('QQ')),
+    ...     Card.parse('Ts8s2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     exhaustive=True,
+    ... )[0]
+    >>> round(matrix.get_range_equity(), 12) == round(equity, 12)
+    True
+
+    The pairs that share cards have no equity.
+
+    >>> matrix = calculate_equity_matrix(
+    ...     parse_range('AA'),
+    ...     parse_range('AKs'),
+    ...     Card.parse('2c3d4h'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=100,
+    ... )
+    >>> sum(equity is None for equity in chain(*matrix.equities))
+    12
+
+    :param hole_range: The range of the player (the rows).
+    :param other_hole_range: The range of the opponent (the columns).
+    :param board_cards: The board cards, may be empty.
+    :param hole_dealing_count: The final number of hole cards; for
+                               hold'em, it is ``2``.
+    :param board_dealing_count: The final number of board cards; for
+                                hold'em, it is ``5``.
+    :param deck: The deck; most games typically use
+                 :attr:`pokerkit.utilities.Deck.STANDARD`.
+    :param hand_types: The hand types; most games typically just use
+                       :class:`pokerkit.hands.StandardHighHand`.
+    :param sample_count: The optional number of runouts to simulate,
+                         defaults to ``None`` which is enumerating every
+                         runout.
+    :param executor: The optional executor, defaults to ``None`` which
+                     is just using 1 thread/process.
+    :param block_size: The optional number of runouts per task
+                       dispatched to the executor.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :return: The equity matrix.
+    :raises ValueError: If a combination does not consist of the final
+                        number of hole cards.
+    """
+
+    def sort(hole_range: Iterable[Iterable[Card]]) -> list[tuple[Card, ...]]:
+        hole_cards = []
+
+        for cards in hole_range:
+            cards = tuple(sorted(cards, key=attrgetter('index')))
+
+            if len(cards) != hole_dealing_count:
+                raise ValueError(
+                    (
+                        f'The hole card combination {repr(cards)} does not'
+                        f' consist of {hole_dealing_count} cards.'
+                    ),
+                )
+
+            if not Card.get_mask(cards) & board_mask:
+                hole_cards.append(cards)
+
+        hole_cards.sort(key=lambda cards: [card.index for card in cards])
+
+        return hole_cards
+
+    board_cards = list(board_cards)
+    board_mask = Card.get_mask(board_cards)
+    hole_cards = sort(hole_range)
+    other_hole_cards = sort(other_hole_range)
+    deck_cards = [card for card in deck if card not in board_cards]
+    runout_count = board_dealing_count - len(board_cards)
+    runouts: list[tuple[Card, ...]]
+
+    if sample_count is None:
+        runouts = list(combinations(deck_cards, runout_count))
+    else:
+        sample = partial(
+            Random(getrandbits(64) if rng is None else rng.getrandbits(64))
+            .sample,
+            deck_cards,
+            runout_count,
+        )
+        runouts = [tuple(sample()) for _ in range(sample_count)]
+
+    if block_size is None:
+        block_count = 1 if executor is None else 4 * (cpu_count() or 1)
+        block_size = ceil(len(runouts) / block_count)
+
+    block_size = max(block_size, 1)
+    fn = partial(
+        __calculate_equity_matrix_0,
+        hole_cards,
+        other_hole_cards,
+        board_cards,
+        tuple(hand_types),
+    )
+    mapper: Any = map if executor is None else executor.map
+    equity_sums = [[0.0] * len(other_hole_cards) for _ in hole_cards]
+    deal_counts = [[0] * len(other_hole_cards) for _ in hole_cards]
+
+    for block_equity_sums, block_deal_counts in mapper(
+            fn,
+            (
+                runouts[begin:begin + block_size]
+                for begin in range(0, len(runouts), block_size)
+            ),
+    ):
+        for i, j in product(
+                range(len(hole_cards)),
+                range(len(other_hole_cards)),
+        ):
+            equity_sums[i][j] += block_equity_sums[i][j]
+            deal_counts[i][j] += block_deal_counts[i][j]
+
+    equities = tuple(
+        tuple(
+            equity_sum / deal_count if deal_count else None
+            for equity_sum, deal_count in zip(equity_sums_, deal_counts_)
+        ) for equity_sums_, deal_counts_ in zip(equity_sums, deal_counts)
+    )
+
+    return EquityMatrix(
+        tuple(hole_cards),
+        tuple(other_hole_cards),
+        equities,
+        tuple(board_cards),
+    )
+
+
+def __calculate_hand_potentials(
+        hole_cards: Iterable[Iterable[Card]] | None,
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_type: type[Hand],
+        bin_count: int,
+) -> dict[tuple[Card, ...], HandPotential]:
+    import numpy as np
+
+    def get_ranks(statuses: Any, cards: list[Card]) -> tuple[Any, int]:
+        indices = hand_type.batch_from_game(
+            card_indices[statuses],
+            np.array([card.index for card in cards], dtype=np.intp),
+        )
+
+        if hand_type.low:
+            indices = np.where(indices == -1, np.iinfo(np.int64).min, -indices)
+
+        ranks = np.zeros(len(combinations_), dtype=np.intp)
+        unique_indices, ranks[statuses] = np.unique(
+            indices,
+            return_inverse=True,
+        )
+
+        return ranks, len(unique_indices)
+
+    def get_bands(ranks: Any, hero_ranks: Any) -> Any:
+        return (ranks <= hero_ranks).astype(np.intp) + (ranks < hero_ranks)
+
+    def count(codes: Any, code_count: int) -> Any:
+        return np.stack(
+            [(codes == code).sum(1) for code in range(code_count)],
+            axis=1,
+        )
+
+    board_cards = list(board_cards)
+    board_mask = Card.get_mask(board_cards)
+    deck_cards = sorted(
+        (card for card in deck if not board_mask >> card.index & 1),
+        key=attrgetter('index'),
+    )
+    combinations_ = list(combinations(deck_cards, hole_dealing_count))
+    positions = dict(zip(combinations_, range(len(combinations_))))
+
+    if hole_cards is None:
+        hero_positions = np.arange(len(combinations_))
+    else:
+        hero_positions_ = []
+
+        for cards in hole_cards:
+            cards = tuple(sorted(cards, key=attrgetter('index')))
+
+            if cards not in positions:
+                raise ValueError(
+                    (
+                        f'The hole cards {repr(cards)} are not'
+                        f' {hole_dealing_count} distinct cards of the deck'
+                        ' that are not on the board.'
+                    ),
+                )
+
+            hero_positions_.append(positions[cards])
+
+        hero_positions = np.array(hero_positions_, dtype=np.intp)
+
+    card_indices = np.array(
+        [[card.index for card in cards] for cards in combinations_],
+        dtype=np.intp,
+    ).reshape(len(combinations_), hole_dealing_count)
+    masks = np.array(
+        list(map(Card.get_mask, combinations_)),
+        dtype=np.uint64,
+    )
+    conflicts = np.array(
+        [
+            np.flatnonzero(masks & masks[hero_position])
+            for hero_position in hero_positions
+        ],
+        dtype=np.intp,
+    )
+    ranks, rank_count = get_ranks(
+        np.ones(len(combinations_), dtype=np.bool_),
+        board_cards,
+    )
+    hero_ranks = ranks[hero_positions]
+    cumulative_counts = np.concatenate(
+        ([0], np.bincount(ranks, minlength=rank_count).cumsum()),
+    )
+    counts = np.stack(
+        [
+            len(combinations_) - cumulative_counts[hero_ranks + 1],
+            (
+                cumulative_counts[hero_ranks + 1]
+                - cumulative_counts[hero_ranks]
+            ),
+            cumulative_counts[hero_ranks],
+        ],
+        axis=1,
+    ) - count(get_bands(ranks[conflicts], hero_ranks[:, None]), 3)
+    hand_strengths = (counts[:, 2] + counts[:, 1] / 2) / counts.sum(1)
+    conflict_codes = 3 * get_bands(ranks[conflicts], hero_ranks[:, None])
+    potential_counts = np.zeros((len(hero_positions), 3, 3), dtype=np.int64)
+    squared_hand_strength_sums = np.zeros(len(hero_positions))
+    histograms = np.zeros((len(hero_positions), bin_count))
+    bounds = np.stack(
+        [
+            np.zeros_like(hero_ranks),
+            hero_ranks,
+            hero_ranks + 1,
+            np.full_like(hero_ranks, rank_count),
+        ],
+    )
+
+    for runout in combinations(
+            deck_cards,
+            board_dealing_count - len(board_cards),
+    ):
+        alive_statuses = (masks & np.uint64(Card.get_mask(runout))) == 0
+        final_ranks, final_rank_count = get_ranks(
+            alive_statuses,
+            board_cards + list(runout),
+        )
+        cumulative_counts = np.zeros(
+            (rank_count + 1, final_rank_count + 1),
+            dtype=np.int64,
+        )
+        cumulative_counts[1:, 1:] = np.bincount(
+            (
+                ranks[alive_statuses] * final_rank_count
+                + final_ranks[alive_statuses]
+            ),
+            minlength=rank_count * final_rank_count,
+        ).reshape(rank_count, final_rank_count).cumsum(0).cumsum(1)
+        hero_final_ranks = final_ranks[hero_positions]
+        final_bounds = np.stack(
+            [
+                np.zeros_like(hero_final_ranks),
+                hero_final_ranks,
+                hero_final_ranks + 1,
+                np.full_like(hero_final_ranks, final_rank_count),
+            ],
+        )
+        cumulative_counts = cumulative_counts[
+            bounds[:, None],
+            final_bounds[None, :],
+        ]
+        runout_counts = (
+            cumulative_counts[1:, 1:]
+            - cumulative_counts[:-1, 1:]
+            - cumulative_counts[1:, :-1]
+            + cumulative_counts[:-1, :-1]
+        )[::-1, ::-1].transpose(2, 0, 1) - count(
+            np.where(
+                alive_statuses[conflicts],
+                conflict_codes + get_bands(
+                    final_ranks[conflicts],
+                    hero_final_ranks[:, None],
+                ),
+                9,
+            ),
+            9,
+        ).reshape(-1, 3, 3)
+        alive_hero_statuses = alive_statuses[hero_positions]
+        runout_counts = runout_counts[alive_hero_statuses]
+        potential_counts[alive_hero_statuses] += runout_counts
+        final_hand_strengths = (
+            runout_counts[:, :, 2].sum(1)
+            + runout_counts[:, :, 1].sum(1) / 2
+        ) / runout_counts.sum((1, 2))
+        squared_hand_strength_sums[alive_hero_statuses] += (
+            final_hand_strengths ** 2
+        )
+        histograms[
+            alive_hero_statuses,
+            np.minimum(
+                (final_hand_strengths * bin_count).astype(np.intp),
+                bin_count - 1,
+            ),
+        ] += 1
+
+    hand_potentials = {}
+
+    for i, hero_position in enumerate(hero_positions):
+        hand_strength = float(hand_strengths[i])
+        potential_counts_ = potential_counts[i]
+        totals = potential_counts_.sum(1)
+        positive_denominator = totals[0] + totals[1] / 2
+        negative_denominator = totals[2] + totals[1] / 2
+        runout_count = histograms[i].sum()
+
+        if runout_count:
+            squared_effective_hand_strength = float(
+                squared_hand_strength_sums[i] / runout_count,
+            )
+            histogram = tuple((histograms[i] / runout_count).tolist())
+        else:
+            squared_effective_hand_strength = hand_strength ** 2
+            histogram = tuple(
+                float(
+                    i == min(int(hand_strength * bin_count), bin_count - 1),
+                ) for i in range(bin_count)
+            )
+
+        hand_potentials[combinations_[hero_position]] = HandPotential(
+            hand_strength,
+            float(
+                (
+                    potential_counts_[0, 2]
+                    + potential_counts_[0, 1] / 2
+                    + potential_counts_[1, 2] / 2
+                ) / positive_denominator,
+            ) if positive_denominator else 0.0,
+            float(
+                (
+                    potential_counts_[2, 0]
+                    + potential_counts_[1, 0] / 2
+                    + potential_counts_[2, 1] / 2
+                ) / negative_denominator,
+            ) if negative_denominator else 0.0,
+            squared_effective_hand_strength,
+            histogram,
+        )
+
+    return hand_potentials
+
+
+@dataclass(frozen=True)
+class HandPotential:
+    """The class for hand strengths and potentials.
+
+    The hand strength (HS) is the probability that the hand is ahead of
+    a single opponent hand chosen uniformly at random, with ties
+    counting half, on the current board. The positive potential (PPOT)
+    is the probability that the hand is ahead at the showdown when it
+    is currently behind, and the negative potential (NPOT) is the
+    probability that it is behind at the showdown when it is currently
+    ahead (with ties counting half in both cases). The squared effective
+    hand strength (EHS²) is the mean of the squared hand strengths at
+    the showdown, over the runouts of the board, and the histogram is
+    the distribution of the hand strengths at the showdown.
+
+    Typically, these are created through
+    :func:`pokerkit.analysis.calculate_hand_potential` or
+    :func:`pokerkit.analysis.calculate_hand_potentials`.
+
+    :param hand_strength: The hand strength.
+    :param positive_potential: The positive potential.
+    :param negative_potential: The negative potential.
+    :param squared_effective_hand_strength: The squared effective hand
+                                            strength.
+    :param histogram: The histogram of the hand strengths at the
+                      showdown.
+    """
+
+    hand_strength: float
+    """The hand strength (HS)."""
+    positive_potential: float
+    """The positive potential (PPOT)."""
+    negative_potential: float
+    """The negative potential (NPOT)."""
+    squared_effective_hand_strength: float
+    """The squared effective hand strength (EHS²)."""
+    histogram: tuple[float, ...]
+    """The fractions of the runouts in each (equally wide) bin of the
+    hand strengths at the showdown.
+    """
+
+    def get_effective_hand_strength(self, player_count: int = 2) -> float:
+        """Return the effective hand strength (EHS).
+
+        The effective hand strength is ``HS_n * (1 - NPOT) + (1 - HS_n)
+        * PPOT``, where ``HS_n`` is the hand strength raised to the
+        power of the number of opponents.
+
+        :param player_count: The number of players in the pot, defaults
+                             to ``2``.
+        :return: The effective hand strength.
+        """
+        hand_strength = self.hand_strength ** (player_count - 1)
+
+        return (
+            hand_strength * (1 - self.negative_potential)
+            + (1 - hand_strength) * self.positive_potential
+        )
+
+
+def calculate_hand_potential(
+        hole_cards: Iterable[Card],
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_type: type[Hand],
+        *,
+        bin_count: int = 10,
+) -> HandPotential:
+    """Calculate the hand strength and potentials of the hole cards.
+
+    Every opponent hand and every runout of the board is enumerated,
+    hence the values are exact. The example below is the one of
+    Billings et al. (2002). For more details, please refer to
+    :class:`pokerkit.analysis.HandPotential`. To calculate the values
+    of many hands on the same board, use
+    :func:`pokerkit.analysis.calculate_hand_potentials` instead, which
+    shares the evaluations between the hands.
+
+    This function requires NumPy.
+
+    >>> from pokerkit import *
+    >>> hand_potential = calculate_hand_potential(
+    ...     Card.parse('AdQc'),
+    ...     Card.parse('3h4cJh'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     StandardHighHand,
+    ... )
+    >>> round(hand_potential.hand_strength, 3)
+    0.585
+    >>> round(hand_potential.positive_potential, 3)
+    0.208
+    >>> round(hand_potential.negative_potential, 3)
+    0.274
+    >>> round(hand_potential.get_effective_hand_strength(), 3)
+    0.511
+    >>> round(hand_potential.squared_effective_hand_strength, 3)
+    0.307
+    >>> hand_potential = calculate_hand_potential(
+    ...     Card.parse('AsKs'),
+    ...     Card.parse('QsJsTs2c3d'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     StandardHighHand,
+    ...     bin_count=4,
+    ... )
+    >>> hand_potential.hand_strength
+    1.0
+    >>> hand_potential.positive_potential
+    0.0
+    >>> hand_potential.histogram
+    (0.0, 0.0, 0.0, 1.0)
+
+    :param hole_cards: The hole cards.
+    :param board_cards: The board cards.
+    :param hole_dealing_count: The final number of hole cards; for
+                               hold'em, it is ``2``.
+    :param board_dealing_count: The final number of board cards; for
+                                hold'em, it is ``5``.
+    :param deck: The deck; most games typically use
+                 :attr:`pokerkit.utilities.Deck.STANDARD`.
+    :param hand_type: The hand type; most games typically use
+                      :class:`pokerkit.hands.StandardHighHand`.
+    :param bin_count: The number of bins of the histogram, defaults to
+                      ``10``.
+    :return: The hand strength and potentials.
+    :raises ValueError: If the hole cards are invalid.
+    """
+    hand_potentials = __calculate_hand_potentials(
+        (hole_cards,),
+        board_cards,
+        hole_dealing_count,
+        board_dealing_count,
+        deck,
+        hand_type,
+        bin_count,
+    )
+
+    return next(iter(hand_potentials.values()))
+
+
+def calculate_hand_potentials(
+        board_cards: Iterable[Card],
+        hole_dealing_count: int,
+        board_dealing_count: int,
+        deck: Deck,
+        hand_type: type[Hand],
+        *,
+        bin_count: int = 10,
+) -> dict[tuple[Card, ...], HandPotential]:
+    """Calculate the hand strengths and potentials of every combination
+    of the hole cards on the board.
+
+    The hands of all combinations are evaluated once per runout of the
+    board and compared against each other in batches. With
+    :meth:`pokerkit.utilities.Card.canonicalize`, the values can be
+    precomputed for the suit-isomorphic boards (e.g., the ``1755``
+    canonical flops of hold'em) only, for instance to bucket the hands
+    by their histograms.
+
+    This function requires NumPy.
+
+    >>> from pokerkit import *
+    >>> hand_potentials = calculate_hand_potentials(
+    ...     Card.parse('3h4cJhQd'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     StandardHighHand,
+    ... )
+    >>> len(hand_potentials)
+    1128
+    >>> hand_potentials[tuple(Card.parse('QcAd'))] == calculate_hand_potential(
+    ...     Card.parse('AdQc'),
+    ...     Card.parse('3h4cJhQd'),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     StandardHighHand,
+    ... )
+    True
+
+    :param board_cards: The board cards.
+    :param hole_dealing_count: The final number of hole cards; for
+                               hold'em, it is ``2``.
+    :param board_dealing_count: The final number of board cards; for
+                                hold'em, it is ``5``.
+    :param deck: The deck; most games typically use
+                 :attr:`pokerkit.utilities.Deck.STANDARD`.
+    :param hand_type: The hand type; most games typically use
+                      :class:`pokerkit.hands.StandardHighHand`.
+    :param bin_count: The number of bins of the histograms, defaults to
+                      ``10``.
+    :return: The hand strengths and potentials of the combinations,
+             whose cards are ordered by their indices.
+    """
+    return __calculate_hand_potentials(
+        None,
+        board_cards,
+        hole_dealing_count,
+        board_dealing_count,
+        deck,
+        hand_type,
+        bin_count,
+    )
+
+
+@dataclass
+class ActionStatistics:
+    """The class for the action statistics of a player, as displayed by
+    heads-up displays (HUDs).
+
+    The statistics are kept as the counts of the hands, the
+    opportunities, and the occurrences, from which the frequencies are
+    derived. They are merged through summation, so that they can be
+    accumulated incrementally over any number of hands or across
+    workers. The first street is regarded as the preflop and the second
+    one as the flop.
+
+    >>> from pokerkit import *
+    >>> hh = HandHistory.loads(
+    ...     '''
+    ... variant = "NT"
+    ... ante_trimming_status = true
+    ... antes = [0, 0, 0]
+    ... blinds_or_straddles = [1, 2, 0]
+    ... min_bet = 2
+    ... starting_stacks = [200, 200, 200]
+    ... actions = [
+    ...     "d dh p1 AsAh",
+    ...     "d dh p2 7c2d",
+    ...     "d dh p3 KsKh",
+    ...     "p3 cbr 6",
+    ...     "p1 cbr 18",
+    ...     "p2 f",
+    ...     "p3 cc",
+    ...     "d db 2c3d4h",
+    ...     "p1 cbr 20",
+    ...     "p3 cc",
+    ...     "d db 5s",
+    ...     "p1 cc",
+    ...     "p3 cbr 40",
+    ...     "p1 cc",
+    ...     "d db 9d",
+    ...     "p1 cc",
+    ...     "p3 cc",
+    ...     "p1 sm AsAh",
+    ...     "p3 sm -",
+    ... ]
+    ... ''',
+    ... )
+    >>> alice, bob, carol = ActionStatistics.from_state_actions(
+    ...     hh.state_actions,
+    ... )
+    >>> alice.vpip, alice.pfr, alice.three_bet_frequency
+    (1.0, 1.0, 1.0)
+    >>> alice.continuation_bet_frequency
+    1.0
+    >>> alice.went_to_showdown_frequency, alice.won_at_showdown_frequency
+    (1.0, 1.0)
+    >>> bob.vpip, bob.three_bet_opportunity_count, bob.flop_count
+    (0.0, 0, 0)
+    >>> carol.fold_to_three_bet_frequency, carol.aggression_factor
+    (0.0, 1.0)
+    >>> carol.won_at_showdown_frequency
+    0.0
+    >>> statistics = ActionStatistics.merge(alice, bob, carol)
+    >>> statistics.hand_count, statistics.voluntary_put_count
+    (3, 2)
+
+    :param hand_count: The number of hands.
+    :param voluntary_put_count: The number of hands in which money was
+                                voluntarily put in the pot preflop.
+    :param preflop_raise_count: The number of hands with a preflop
+                                raise.
+    :param three_bet_opportunity_count: The number of hands in which a
+                                        preflop raise was faced.
+    :param three_bet_count: The number of hands in which a preflop
+                            raise was reraised.
+    :param three_bet_fold_opportunity_count: The number of hands in
+                                             which a reraise of the
+                                             player's opening preflop
+                                             raise was faced.
+    :param three_bet_fold_count: The number of hands in which the
+                                 player folded to a reraise of their
+                                 opening preflop raise.
+    :param continuation_bet_opportunity_count: The number of hands in
+                                               which the last preflop
+                                               raiser could bet first
+                                               on the flop.
+    :param continuation_bet_count: The number of hands in which the
+                                   last preflop raiser bet first on the
+                                   flop.
+    :param postflop_bet_or_raise_count: The number of the postflop bets
+                                        or raises.
+    :param postflop_call_count: The number of the postflop calls.
+    :param flop_count: The number of hands in which the flop was seen.
+    :param showdown_count: The number of hands that went to showdown.
+    :param showdown_win_count: The number of hands in which money was
+                               won at showdown.
+    """
+
+    hand_count: int = 0
+    """The number of hands."""
+    voluntary_put_count: int = 0
+    """The number of hands with money voluntarily put in preflop."""
+    preflop_raise_count: int = 0
+    """The number of hands with a preflop raise."""
+    three_bet_opportunity_count: int = 0
+    """The number of hands in which a preflop raise was faced."""
+    three_bet_count: int = 0
+    """The number of hands in which a preflop raise was reraised."""
+    three_bet_fold_opportunity_count: int = 0
+    """The number of hands in which a reraise was faced by the opener."""
+    three_bet_fold_count: int = 0
+    """The number of hands in which the opener folded to a reraise."""
+    continuation_bet_opportunity_count: int = 0
+    """The number of hands with a continuation bet opportunity."""
+    continuation_bet_count: int = 0
+    """The number of hands with a continuation bet."""
+    postflop_bet_or_raise_count: int = 0
+    """The number of the postflop bets or raises."""
+    postflop_call_count: int = 0
+    """The number of the postflop calls."""
+    flop_count: int = 0
+    """The number of hands in which the flop was seen."""
+    showdown_count: int = 0
+    """The number of hands that went to showdown."""
+    showdown_win_count: int = 0
+    """The number of hands in which money was won at showdown."""
+
+    @classmethod
+    def merge(cls, *statistics: ActionStatistics) -> ActionStatistics:
+        """Merge the statistics.
+
+        :param statistics: The statistics to merge.
+        :return: The merged statistics.
+        """
+        return cls(
+            *(
+                sum(getattr(sub_statistics, field_.name)
+                    for sub_statistics in statistics)
+                for field_ in fields(cls)
+            ),
+        )
+
+    @classmethod
+    def from_state_actions(
+            cls,
+            state_actions: Iterable[tuple[State, str | None]],
+    ) -> list[ActionStatistics]:
+        """Obtain the statistics of each player in a hand in a single
+        pass over its state-actions (e.g.,
+        :attr:`pokerkit.notation.HandHistory.state_actions`).
+
+        The operations of the state are inspected as they are applied,
+        and are attributed to the street at which they took place.
+
+        :param state_actions: The state-actions of the hand.
+        :return: The statistics of each player.
+        """
+        statistics: list[ActionStatistics] = []
+        folded_statuses: list[bool] = []
+        pushed_amounts: list[int] = []
+        operation_count = 0
+        street_index = None
+        raise_count = 0
+        opener_index = None
+        preflop_raiser_index = None
+
+        for state, _ in state_actions:
+            if not statistics:
+                statistics = [
+                    cls(hand_count=1) for _ in range(state.player_count)
+                ]
+                folded_statuses = [False] * state.player_count
+                pushed_amounts = [0] * state.player_count
+
+            for operation in islice(state.operations, operation_count, None):
+                if isinstance(operation, ChipsPushing):
+                    for i, amount in enumerate(operation.amounts):
+                        pushed_amounts[i] += amount
+
+                    continue
+                elif not isinstance(
+                        operation,
+                        (
+                            CheckingOrCalling,
+                            CompletionBettingOrRaisingTo,
+                            Folding,
+                        ),
+                ):
+                    continue
+
+                i = operation.player_index
+                raising = isinstance(operation, CompletionBettingOrRaisingTo)
+                calling = (
+                    isinstance(operation, CheckingOrCalling)
+                    and operation.amount > 0
+                )
+                folding = isinstance(operation, Folding)
+                sub_statistics = statistics[i]
+
+                if street_index == 0:
+                    if raising or calling:
+                        sub_statistics.voluntary_put_count = 1
+
+                    if raising:
+                        sub_statistics.preflop_raise_count = 1
+
+                    if raise_count == 1 and i != opener_index:
+                        sub_statistics.three_bet_opportunity_count = 1
+
+                        if raising:
+                            sub_statistics.three_bet_count = 1
+                    elif raise_count == 2 and i == opener_index:
+                        sub_statistics.three_bet_fold_opportunity_count = 1
+
+                        if folding:
+                            sub_statistics.three_bet_fold_count = 1
+
+                    if raising:
+                        if not raise_count:
+                            opener_index = i
+
+                        preflop_raiser_index = i
+                else:
+                    if (
+                            street_index == 1
+                            and i == preflop_raiser_index
+                            and not raise_count
+                    ):
+                        sub_statistics.continuation_bet_opportunity_count = 1
+
+                        if raising:
+                            sub_statistics.continuation_bet_count = 1
+
+                    if raising:
+                        sub_statistics.postflop_bet_or_raise_count += 1
+                    elif calling:
+                        sub_statistics.postflop_call_count += 1
+
+                if raising:
+                    raise_count += 1
+                elif folding:
+                    folded_statuses[i] = True
+
+            operation_count = len(state.operations)
+
+            if state.street_index != street_index:
+                street_index = state.street_index
+                raise_count = 0
+
+                if street_index is not None and street_index >= 1:
+                    for i, status in enumerate(state.statuses):
+                        if status:
+                            statistics[i].flop_count = 1
+
+        if folded_statuses.count(False) > 1:
+            for i, folded_status in enumerate(folded_statuses):
+                if not folded_status:
+                    statistics[i].showdown_count = 1
+
+                    if pushed_amounts[i] > 0:
+                        statistics[i].showdown_win_count = 1
+
+        return statistics
+
+    @property
+    def vpip(self) -> float:
+        """Return the frequency of voluntarily putting money in the pot
+        preflop (VPIP).
+
+        :return: The VPIP.
+        :raises ValueError: If there is no hand.
+        """
+        return self.__get_frequency(self.voluntary_put_count, self.hand_count)
+
+    @property
+    def pfr(self) -> float:
+        """Return the preflop raise frequency (PFR).
+
+        :return: The PFR.
+        :raises ValueError: If there is no hand.
+        """
+        return self.__get_frequency(self.preflop_raise_count, self.hand_count)
+
+    @property
+    def three_bet_frequency(self) -> float:
+        """Return the frequency of reraising a preflop raise (3-bet%).
+
+        :return: The 3-bet frequency.
+        :raises ValueError: If there is no opportunity.
+        """
+        return self.__get_frequency(
+            self.three_bet_count,
+            self.three_bet_opportunity_count,
+        )
+
+    @property
+    def fold_to_three_bet_frequency(self) -> float:
+        """Return the frequency of folding the opening preflop raise to a
+        reraise.
+
+        :return: The fold-to-3-bet frequency.
+        :raises ValueError: If there is no opportunity.
+        """
+        return self.__get_frequency(
+            self.three_bet_fold_count,
+            self.three_bet_fold_opportunity_count,
+        )
+
+    @property
+    def continuation_bet_frequency(self) -> float:
+        """Return the continuation bet frequency (c-bet%).
+
+        :return: The c-bet frequency.
+        :raises ValueError: If there is no opportunity.
+        """
+        return self.__get_frequency(
+            self.continuation_bet_count,
+            self.continuation_bet_opportunity_count,
+        )
+
+    @property
+    def aggression_factor(self) -> float:
+        """Return the postflop aggression factor (AF), the ratio of the
+        bets and raises to the calls.
+
+        :return: The AF.
+        :raises ValueError: If there is no call.
+        """
+        if not self.postflop_call_count:
+            raise ValueError('The aggression factor requires a call.')
+
+        return self.postflop_bet_or_raise_count / self.postflop_call_count
+
+    @property
+    def went_to_showdown_frequency(self) -> float:
+        """Return the frequency of going to showdown after seeing the
+        flop (WTSD).
+
+        :return: The WTSD.
+        :raises ValueError: If no flop is seen.
+        """
+        return self.__get_frequency(self.showdown_count, self.flop_count)
+
+    @property
+    def won_at_showdown_frequency(self) -> float:
+        """Return the frequency of winning money at showdown (W$SD).
+
+        :return: The W$SD.
+        :raises ValueError: If there is no showdown.
+        """
+        return self.__get_frequency(
+            self.showdown_win_count,
+            self.showdown_count,
+        )
+
+    @classmethod
+    def __get_frequency(cls, count: int, opportunity_count: int) -> float:
+        if not opportunity_count:
+            raise ValueError('The frequency requires an opportunity.')
+
+        return count / opportunity_count
 
 
 @dataclass
 class Statistics:
     """The class for player statistics.
 
-    :param payoffs: The payoffs of each hand.
+    The statistics are accumulated online: the number of the payoffs,
+    their sum, mean, and sum of the squared deviations from the mean
+    (through Welford's algorithm), and their minimum and maximum are
+    updated as each payoff is added, in constant time and memory.
+    Statistics are merged, also in constant time, through the parallel
+    variance formula.
+
+    >>> statistics = Statistics()
+    >>> for payoff in (-2, 5, 3, -1):
+    ...     statistics.add(payoff)
+    ...
+    >>> statistics.sample_count
+    4
+    >>> statistics.payoff_sum
+    5
+    >>> statistics.payoff_mean
+    1.25
+    >>> round(statistics.payoff_stdev, 4)
+    3.304
+    >>> statistics.payoff_min, statistics.payoff_max
+    (-2, 5)
+    >>> statistics.payoffs is None
+    True
+
+    The payoffs themselves are only kept if a list of them is supplied.
+
+    >>> statistics = Statistics.merge(
+    ...     statistics,
+    ...     Statistics(payoffs=[4, -4]),
+    ... )
+    >>> statistics.sample_count
+    6
+    >>> round(statistics.payoff_mean, 4)
+    0.8333
+    >>> statistics.payoffs is None
+    True
+    >>> Statistics.merge(
+    ...     Statistics(payoffs=[1, 2]),
+    ...     Statistics(payoffs=[3]),
+    ... ).payoffs
+    [1, 2, 3]
+
+    Alternatively, a uniformly random sample of at most
+    ``reservoir_size`` payoffs can be kept through reservoir sampling.
+
+    >>> from random import Random
+    >>> statistics = Statistics(reservoir_size=10, rng=Random(0))
+    >>> for payoff in range(1000):
+    ...     statistics.add(payoff)
+    ...
+    >>> len(statistics.reservoir)
+    10
+
+    The action statistics of the hands (for HUDs), if supplied, are
+    summed in :attr:`pokerkit.analysis.Statistics.action_statistics`.
+
+    :param payoffs: The optional payoffs of each hand, defaults to
+                    ``None``. If supplied, the statistics are
+                    accumulated from them and the payoffs added later
+                    are appended to them.
+    :param reservoir_size: The maximum number of the sampled payoffs,
+                           defaults to ``0``.
+    :param rng: The optional random number generator of the reservoir
+                sampling, defaults to ``None`` which is the global one
+                of the :mod:`random` module.
+    """
+
+    payoffs: list[int] | None = None
+    """The optional payoffs."""
+    reservoir_size: int = 0
+    """The maximum number of the sampled payoffs."""
+    rng: Random | None = field(default=None, compare=False, repr=False)
+    """The optional random number generator."""
+    sample_count: int = field(default=0, init=False)
+    """The sample size."""
+    payoff_sum: float = field(default=0, init=False)
+    """The total payoff."""
+    payoff_min: float = field(default=inf, init=False)
+    """The minimum payoff."""
+    payoff_max: float = field(default=-inf, init=False)
+    """The maximum payoff."""
+    reservoir: list[int] = field(default_factory=list, init=False)
+    """The uniformly random sample of the payoffs."""
+    action_statistics: ActionStatistics = field(
+        default_factory=ActionStatistics,
+        init=False,
+    )
+    """The action statistics."""
+    __payoff_mean: float = field(default=0, init=False, repr=False)
+    __squared_deviation_sum: float = field(
+        default=0,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.payoffs is not None:
+            payoffs = self.payoffs
+            self.payoffs = []
+
+            for payoff in payoffs:
+                self.add(payoff)
+
+    @classmethod
+    def merge(
+            cls,
+            *statistics: Statistics,
+            rng: Random | None = None,
+    ) -> Statistics:
+        """Merge the statistics.
+
+        The payoffs are kept only if they are kept in every statistics.
+        The reservoir of the merged statistics is as large as the
+        largest of those of the statistics. It is sampled from their
+        reservoirs in proportion to their sample sizes.
+
+        :param statistics: The statistics to merge.
+        :param rng: The optional random number generator, defaults to
+                    ``None`` which is the global one of the
+                    :mod:`random` module.
+        :return: The merged stats.
+        """
+        payoffs: list[int] | None = []
+        reservoir_size = 0
+
+        for sub_statistics in statistics:
+            if payoffs is not None and sub_statistics.payoffs is not None:
+                payoffs.extend(sub_statistics.payoffs)
+            else:
+                payoffs = None
+
+            reservoir_size = max(
+                reservoir_size,
+                sub_statistics.reservoir_size,
+            )
+
+        merged_statistics = cls(reservoir_size=reservoir_size, rng=rng)
+        merged_statistics.payoffs = payoffs
+
+        for sub_statistics in statistics:
+            merged_statistics.__merge(sub_statistics)
+
+        merged_statistics.action_statistics = ActionStatistics.merge(
+            *map(attrgetter('action_statistics'), statistics),
+        )
+
+        if reservoir_size:
+            if rng is None:
+                rng = Random(getrandbits(64))
+
+            pools = [
+                rng.sample(
+                    sub_statistics.reservoir,
+                    len(sub_statistics.reservoir),
+                ) for sub_statistics in statistics
+            ]
+            counts = [
+                sub_statistics.sample_count for sub_statistics in statistics
+            ]
+
+            while len(merged_statistics.reservoir) < reservoir_size:
+                weights = [
+                    count if pool else 0
+                    for count, pool in zip(counts, pools)
+                ]
+
+                if not any(weights):
+                    break
+
+                i, = rng.choices(range(len(pools)), weights)
+
+                merged_statistics.reservoir.append(pools[i].pop())
+
+                counts[i] -= 1
+
+        return merged_statistics
+
+    def __merge(self, other: Statistics) -> None:
+        sample_count = self.sample_count + other.sample_count
+
+        if not sample_count:
+            return
+
+        delta = other.__payoff_mean - self.__payoff_mean
+        self.__payoff_mean += delta * other.sample_count / sample_count
+        self.__squared_deviation_sum += (
+            other.__squared_deviation_sum
+            + delta * delta * self.sample_count * other.sample_count
+            / sample_count
+        )
+        self.sample_count = sample_count
+        self.payoff_sum += other.payoff_sum
+        self.payoff_min = min(self.payoff_min, other.payoff_min)
+        self.payoff_max = max(self.payoff_max, other.payoff_max)
+
+    @classmethod
+    def from_hand_history(cls, *hhs: HandHistory) -> dict[str, Statistics]:
+        """Obtain statistics for each player (if any) for a hand
+        history or hand histories.
+
+        For the breakdowns by the positions, or to stream the hand
+        histories, please refer to
+        :meth:`pokerkit.analysis.HandHistoryStatistics.from_hand_histories`.
+
+        :param hh: The hand history/histories to analyze.
+        :return: The hand history statistics.
+        """
+        return HandHistoryStatistics.from_hand_histories(
+            hhs,
+        ).player_statistics
+
+    def add(
+            self,
+            payoff: int,
+            action_statistics: ActionStatistics | None = None,
+    ) -> None:
+        """Add the payoff (and the action statistics) of a hand.
+
+        :param payoff: The payoff.
+        :param action_statistics: The optional action statistics of the
+                                  hand, defaults to ``None``.
+        :return: ``None``.
+        """
+        if action_statistics is not None:
+            self.action_statistics = ActionStatistics.merge(
+                self.action_statistics,
+                action_statistics,
+            )
+
+        self.sample_count += 1
+        self.payoff_sum += payoff
+        self.payoff_min = min(self.payoff_min, payoff)
+        self.payoff_max = max(self.payoff_max, payoff)
+        delta = payoff - self.__payoff_mean
+        self.__payoff_mean += delta / self.sample_count
+        self.__squared_deviation_sum += delta * (payoff - self.__payoff_mean)
+
+        if self.payoffs is not None:
+            self.payoffs.append(payoff)
+
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(payoff)
+        elif self.reservoir_size:
+            if self.rng is None:
+                index = randrange(self.sample_count)
+            else:
+                index = self.rng.randrange(self.sample_count)
+
+            if index < self.reservoir_size:
+                self.reservoir[index] = payoff
+
+    @property
+    def payoff_mean(self) -> float:
+        """Return the payoff rate (per hand).
+
+        :return: The payoff rate.
+        :raises ValueError: If there is no sample.
+        """
+        if not self.sample_count:
+            raise ValueError('The mean requires at least one sample.')
+
+        return self.__payoff_mean
+
+    @property
+    def payoff_variance(self) -> float:
+        """Return the payoff (sample) variance.
+
+        :return: The payoff variance.
+        :raises ValueError: If there are fewer than two samples.
+        """
+        if self.sample_count < 2:
+            raise ValueError('The variance requires at least two samples.')
+
+        return max(self.__squared_deviation_sum, 0) / (self.sample_count - 1)
+
+    @property
+    def payoff_stdev(self) -> float:
+        """Return the payoff standard deviation.
+
+        :return: The payoff standard deviation.
+        :raises ValueError: If there are fewer than two samples.
+        """
+        return sqrt(self.payoff_variance)
+
+    @property
+    def payoff_stderr(self) -> float:
+        """Return the payoff standard error.
+
+        :return: The payoff standard error.
+        :raises ValueError: If there are fewer than two samples.
+        """
+        return self.payoff_stdev / sqrt(self.sample_count)
+
+
+@dataclass
+class HandHistoryStatistics:
+    """The class for the statistics of hand histories, broken down by
+    the players, the positions (the indices of the players in the hand
+    histories), and the pairs of them.
+
+    The statistics are mergeable, so that those of the parts of a
+    collection of hand histories (e.g., of the files of an archive) can
+    be obtained independently (e.g., in parallel) and merged.
+
+    >>> from pokerkit import *
+    >>> hh = HandHistory.loads(
+    ...     '''
+    ... variant = "NT"
+    ... ante_trimming_status = true
+    ... antes = [0, 0, 0]
+    ... blinds_or_straddles = [1, 2, 0]
+    ... min_bet = 2
+    ... starting_stacks = [200, 200, 200]
+    ... actions = [
+    ...     "d dh p1 ????",
+    ...     "d dh p2 ????",
+    ...     "d dh p3 ????",
+    ...     "p3 f",
+    ...     "p1 f",
+    ... ]
+    ... players = ["Alice", "Bob", "Carol"]
+    ... ''',
+    ... )
+    >>> statistics = HandHistoryStatistics.from_hand_histories([hh, hh])
+    >>> statistics.hand_count
+    2
+    >>> statistics.player_statistics['Bob'].payoff_sum
+    2
+    >>> statistics.position_statistics[0].payoff_mean
+    -1.0
+    >>> statistics.player_position_statistics['Carol', 2].sample_count
+    2
+
+    :param player_statistics: The statistics of each player.
+    :param position_statistics: The statistics of each position.
+    :param player_position_statistics: The statistics of each player in
+                                       each position.
+    :param hand_count: The number of hands.
     """
 
-    payoffs: list[int]
-    """The payoffs."""
+    player_statistics: dict[str, Statistics] = field(default_factory=dict)
+    """The statistics of each player."""
+    position_statistics: dict[int, Statistics] = field(
+        default_factory=dict,
+    )
+    """The statistics of each position."""
+    player_position_statistics: dict[tuple[str, int], Statistics] = field(
+        default_factory=dict,
+    )
+    """The statistics of each player in each position."""
+    hand_count: int = 0
+    """The number of hands."""
 
     @classmethod
-    def merge(cls, *statistics: Statistics) -> Statistics:
+    def merge(
+            cls,
+            *statistics: HandHistoryStatistics,
+    ) -> HandHistoryStatistics:
         """Merge the statistics.
 
         :param statistics: The statistics to merge.
-        :return: The merged stats.
+        :return: The merged statistics.
         """
-        payoffs = []
+        player_statistics = defaultdict[str, list[Statistics]](list)
+        position_statistics = defaultdict[int, list[Statistics]](list)
+        player_position_statistics = defaultdict[
+            tuple[str, int],
+            list[Statistics],
+        ](list)
 
         for sub_statistics in statistics:
-            payoffs.extend(sub_statistics.payoffs)
+            for player, statistics_ in (
+                    sub_statistics.player_statistics.items()
+            ):
+                player_statistics[player].append(statistics_)
+
+            for position, statistics_ in (
+                    sub_statistics.position_statistics.items()
+            ):
+                position_statistics[position].append(statistics_)
+
+            for key, statistics_ in (
+                    sub_statistics.player_position_statistics.items()
+            ):
+                player_position_statistics[key].append(statistics_)
 
-        return Statistics(payoffs=payoffs)
+        return cls(
+            {
+                key: Statistics.merge(*value)
+                for key, value in player_statistics.items()
+            },
+            {
+                key: Statistics.merge(*value)
+                for key, value in position_statistics.items()
+            },
+            {
+                key: Statistics.merge(*value)
+                for key, value in player_position_statistics.items()
+            },
+            sum(sub_statistics.hand_count for sub_statistics in statistics),
+        )
 
     @classmethod
-    def from_hand_history(cls, *hhs: HandHistory) -> dict[str, Statistics]:
-        """Obtain statistics for each position and players (if any) for
-        a hand history or hand histories.
+    def from_hand_histories(
+            cls,
+            hhs: Iterable[HandHistory | str | PathLike[str]],
+            *,
+            executor: Executor | None = None,
+            chunk_size: int = 1000,
+            action_statistics_status: bool = False,
+    ) -> HandHistoryStatistics:
+        """Obtain the statistics of the hand histories.
 
-        :param hh: The hand history/histories to analyze.
-        :return: The hand history statistics.
+        The hand histories are consumed one at a time, and each of them
+        is discarded as soon as it is accounted for. Hence, the hand
+        histories can be streamed from a generator or from files, which
+        are loaded lazily. The paths of the files ending with
+        ``.phhs`` are loaded as collections of hand histories, and the
+        other paths as single hand histories.
+
+        If the finishing stacks of a hand history are not recorded, the
+        hand is replayed to its terminal state without retaining the
+        intermediate states.
+
+        If ``action_statistics_status`` is ``True``, every hand is
+        replayed, and the action statistics (for HUDs) are derived in
+        the same pass as the payoffs.
+
+        The user may supply an executor to use parallelization. Then,
+        the hand histories (or their paths) are dispatched to the
+        executor in chunks of ``chunk_size`` of them, and the
+        statistics of the chunks are merged. At most four chunks per
+        CPU are pending at a time.
+
+        :param hhs: The hand histories or the paths of their files.
+        :param executor: The optional executor, defaults to ``None``
+                         which is just using 1 thread/process.
+        :param chunk_size: The number of the hand histories (or their
+                           files) per task dispatched to the executor,
+                           defaults to ``1000``.
+        :param action_statistics_status: Whether to obtain the action
+                                         statistics, defaults to
+                                         ``False``.
+        :return: The statistics.
         """
-        statistics = defaultdict[str, list[Statistics]](list)
+        statistics = cls()
+
+        if executor is None:
+            for hh in cls.__iterate_hand_histories(hhs):
+                statistics.add(
+                    hh,
+                    action_statistics_status=action_statistics_status,
+                )
 
+            return statistics
+
+        hhs = iter(hhs)
+        pending_count = 4 * (cpu_count() or 1)
+        futures: set[Future[HandHistoryStatistics]] = set()
+
+        while True:
+            while len(futures) < pending_count:
+                chunk = list(islice(hhs, max(chunk_size, 1)))
+
+                if not chunk:
+                    break
+
+                futures.add(
+                    executor.submit(
+                        cls.from_hand_histories,
+                        chunk,
+                        action_statistics_status=action_statistics_status,
+                    ),
+                )
+
+            if not futures:
+                break
+
+            done_futures, futures = wait(futures, return_when=FIRST_COMPLETED)
+            statistics = cls.merge(
+                statistics,
+                *(future.result() for future in done_futures),
+            )
+
+        return statistics
+
+    @classmethod
+    def __iterate_hand_histories(
+            cls,
+            hhs: Iterable[HandHistory | str | PathLike[str]],
+    ) -> Iterator[HandHistory]:
         for hh in hhs:
-            if hh.finishing_stacks is None:
-                end_state = tuple(hh)[-1]
-                finishing_stacks = end_state.stacks
+            if isinstance(hh, HandHistory):
+                yield hh
             else:
-                finishing_stacks = hh.finishing_stacks
+                with open(hh, 'rb') as file:
+                    if fspath(hh).endswith('.phhs'):
+                        yield from HandHistory.load_all(file)
+                    else:
+                        yield HandHistory.load(file)
 
-            players: Any
+    def add(
+            self,
+            hh: HandHistory,
+            *,
+            action_statistics_status: bool = False,
+    ) -> None:
+        """Add the payoffs (and the action statistics) of a hand
+        history.
 
-            if hh.players is None:
-                players = repeat(None)
-            else:
-                players = hh.players
+        :param hh: The hand history.
+        :param action_statistics_status: Whether to add the action
+                                         statistics, defaults to
+                                         ``False``.
+        :return: ``None``.
+        """
+        action_statistics: Iterable[ActionStatistics | None]
+
+        if action_statistics_status:
+            state_actions = hh.state_actions
+            state, _ = next(state_actions)
+            # The same state is transitioned until its terminal state.
+            action_statistics = ActionStatistics.from_state_actions(
+                chain(((state, None),), state_actions),
+            )
+            finishing_stacks = state.stacks
+        elif hh.finishing_stacks is None:
+            action_statistics = repeat(None)
+            state, = deque(hh, maxlen=1)
+            finishing_stacks = state.stacks
+        else:
+            action_statistics = repeat(None)
+            finishing_stacks = hh.finishing_stacks
+
+        players: Iterable[str | None]
+
+        if hh.players is None:
+            players = repeat(None)
+        else:
+            players = hh.players
+
+        self.hand_count += 1
+
+        for position, (
+                starting_stack,
+                stack,
+                player,
+                sub_action_statistics,
+        ) in enumerate(
+                zip(
+                    hh.starting_stacks,
+                    finishing_stacks,
+                    players,
+                    action_statistics,
+                ),
+        ):
+            payoff = stack - starting_stack
+
+            if position not in self.position_statistics:
+                self.position_statistics[position] = Statistics()
+
+            self.position_statistics[position].add(
+                payoff,
+                sub_action_statistics,
+            )
+
+            if player is not None:
+                key = player, position
+
+                if player not in self.player_statistics:
+                    self.player_statistics[player] = Statistics()
+
+                if key not in self.player_position_statistics:
+                    self.player_position_statistics[key] = Statistics()
+
+                self.player_statistics[player].add(
+                    payoff,
+                    sub_action_statistics,
+                )
+                self.player_position_statistics[key].add(
+                    payoff,
+                    sub_action_statistics,
+                )
+
+
+@unique
+class ICMModel(StrEnum):
+    """The enum class for the models of the finishing orders of the
+    tournaments.
+
+    >>> ICMModel.MALMUTH_HARVILLE
+    <ICMModel.MALMUTH_HARVILLE: 'Malmuth-Harville'>
+    >>> ICMModel.MALMUTH_WEITZMAN
+    <ICMModel.MALMUTH_WEITZMAN: 'Malmuth-Weitzman'>
+    """
+
+    MALMUTH_HARVILLE: str = 'Malmuth-Harville'
+    """The places are decided from the first one, and each remaining
+    player takes the next place with a probability proportional to their
+    chips. This is the usual independent chip model.
+    """
+    MALMUTH_WEITZMAN: str = 'Malmuth-Weitzman'
+    """The places are decided from the last one, and each remaining
+    player is eliminated next with a probability inversely proportional
+    to their chips.
+    """
+
+
+def __get_icm_weights(
+        chips: tuple[float, ...],
+        model: ICMModel,
+) -> list[float]:
+    match model:
+        case ICMModel.MALMUTH_HARVILLE:
+            weights = list(chips)
+        case ICMModel.MALMUTH_WEITZMAN:
+            weights = [1 / chip if chip else inf for chip in chips]
+        case _:  # pragma: no cover
+            raise AssertionError
+
+    return weights
+
+
+def __get_icm_probabilities(weights: list[float]) -> list[float]:
+    if inf in weights:
+        weights = [float(weight == inf) for weight in weights]
+
+    weight_sum = sum(weights)
+
+    if not weight_sum:
+        return [1 / len(weights)] * len(weights)
+
+    return [weight / weight_sum for weight in weights]
+
+
+def __get_icm_layers(
+        player_count: int,
+        layer_count: int,
+) -> tuple[
+        tuple[tuple[tuple[tuple[int, ...], tuple[int, ...]], ...], int],
+        ...,
+]:
+    if player_count <= __ICM_CACHE_PLAYER_COUNT:
+        return __get_cached_icm_layers(player_count, layer_count)
 
-            for i, (starting_stack, stack, player) in enumerate(
-                    zip(hh.starting_stacks, finishing_stacks, players),
+    return __create_icm_layers(player_count, layer_count)
+
+
+def __create_icm_layers(
+        player_count: int,
+        layer_count: int,
+) -> tuple[
+        tuple[tuple[tuple[tuple[int, ...], tuple[int, ...]], ...], int],
+        ...,
+]:
+    masks = [0]
+    layers = []
+
+    for _ in range(layer_count):
+        positions: dict[int, int] = {}
+        states = []
+
+        for mask in masks:
+            indices = tuple(
+                i for i in range(player_count) if not mask >> i & 1
+            )
+
+            states.append(
+                (
+                    indices,
+                    tuple(
+                        positions.setdefault(mask | 1 << i, len(positions))
+                        for i in indices
+                    ),
+                ),
+            )
+
+        layers.append((tuple(states), len(positions)))
+
+        masks = list(positions)
+
+    return tuple(layers)
+
+
+__get_cached_icm_layers = lru_cache(maxsize=__ICM_CACHE_SIZE)(
+    __create_icm_layers,
+)
+
+
+def __calculate_finish_probabilities_0(
+        chips: list[tuple[float, ...]],
+        place_count: int,
+        model: ICMModel,
+) -> list[list[list[float]]]:
+    player_count = len(chips[0])
+    weights = [__get_icm_weights(chips_, model) for chips_ in chips]
+    probabilities = [
+        [[0.0] * player_count for _ in range(player_count)] for _ in chips
+    ]
+
+    if model == ICMModel.MALMUTH_HARVILLE:
+        layer_count = place_count
+        places: Iterable[int] = range(place_count)
+    else:
+        layer_count = player_count
+        places = range(player_count - 1, -1, -1)
+
+    layer_probabilities = [[1.0] for _ in chips]
+
+    for place, (states, state_count) in zip(
+            places,
+            __get_icm_layers(player_count, layer_count),
+    ):
+        next_layer_probabilities = []
+
+        for weights_, probabilities_, state_probabilities in zip(
+                weights,
+                probabilities,
+                layer_probabilities,
+        ):
+            next_state_probabilities = [0.0] * state_count
+
+            for state_probability, (indices, positions) in zip(
+                    state_probabilities,
+                    states,
             ):
-                if player is not None:
-                    statistics[player].append(
-                        Statistics(payoffs=[stack - starting_stack]),
-                    )
+                remaining_weights = [weights_[i] for i in indices]
+                weight_sum = sum(remaining_weights)
+
+                if 0 < weight_sum < inf:
+                    factor = state_probability / weight_sum
+                    remaining_weights = [
+                        weight * factor for weight in remaining_weights
+                    ]
+                else:
+                    remaining_weights = [
+                        probability * state_probability
+                        for probability in __get_icm_probabilities(
+                            remaining_weights,
+                        )
+                    ]
+
+                for i, position, probability in zip(
+                        indices,
+                        positions,
+                        remaining_weights,
+                ):
+                    probabilities_[i][place] += probability
+                    next_state_probabilities[position] += probability
+
+            next_layer_probabilities.append(next_state_probabilities)
+
+        layer_probabilities = next_layer_probabilities
+
+    return [
+        [
+            player_probabilities[:place_count]
+            for player_probabilities in probabilities_
+        ] for probabilities_ in probabilities
+    ]
 
-        return dict(
-            zip(statistics.keys(), starmap(cls.merge, statistics.values())),
+
+def __sample_finish_probabilities(
+        chips: tuple[float, ...],
+        place_count: int,
+        model: ICMModel,
+        sample_count: int,
+        rng: Random,
+) -> list[list[float]]:
+    weights = __get_icm_weights(chips, model)
+    player_count = len(chips)
+    probabilities = [[0.0] * place_count for _ in range(player_count)]
+    probability = 1 / sample_count
+
+    def get_time(weight: float) -> float:
+        if weight == inf:
+            return 0
+        elif not weight:
+            return inf
+
+        return rng.expovariate(weight)
+
+    for _ in range(sample_count):
+        indices = sorted(
+            range(player_count),
+            key=lambda i: (get_time(weights[i]), rng.random()),
         )
 
-    @property
-    def sample_count(self) -> int:
-        """Return the sample size.
+        if model == ICMModel.MALMUTH_WEITZMAN:
+            indices.reverse()
 
-        :return: The sample size.
-        """
-        return len(self.payoffs)
+        for place, i in enumerate(indices[:place_count]):
+            probabilities[i][place] += probability
 
-    @property
-    def payoff_sum(self) -> float:
-        """Return the total payoff.
+    return probabilities
 
-        :return: The total payoff.
-        """
-        return sum(self.payoffs)
 
-    @property
-    def payoff_mean(self) -> float:
-        """Return the payoff rate (per hand).
+def calculate_finish_probabilities(
+        chips: Iterable[float],
+        place_count: int | None = None,
+        *,
+        model: ICMModel = ICMModel.MALMUTH_HARVILLE,
+        sample_count: int | None = None,
+        rng: Random | None = None,
+) -> tuple[tuple[float, ...], ...]:
+    """Calculate the probabilities of the players finishing in each
+    place.
 
-        :return: The payoff rate.
-        """
-        return mean(self.payoffs)
+    By default, the probabilities are calculated exactly through dynamic
+    programming over the subsets of the players whose places are
+    decided, which takes time in the order of ``2 ** n * n`` for ``n``
+    players (or less, for the Malmuth-Harville model, when only the
+    first few places are needed). For large fields, the probabilities
+    can instead be estimated from ``sample_count`` finishing orders
+    drawn at random. The finishing orders are drawn as races of
+    exponentially distributed times whose rates are the weights of the
+    players, which follow the same distributions as the models.
 
-    @property
-    def payoff_stdev(self) -> float:
-        """Return the payoff standard deviation.
+    >>> probabilities = calculate_finish_probabilities([50, 30, 20])
+    >>> [round(probability, 4) for probability in probabilities[0]]
+    [0.5, 0.3393, 0.1607]
+    >>> [round(probability, 4) for probability in probabilities[2]]
+    [0.2, 0.2857, 0.5143]
+    >>> probabilities = calculate_finish_probabilities(
+    ...     [50, 30, 20],
+    ...     2,
+    ...     model=ICMModel.MALMUTH_WEITZMAN,
+    ... )
+    >>> [round(probability, 4) for probability in probabilities[0]]
+    [0.5328, 0.2736]
 
-        :return: The payoff standard deviation.
-        """
-        return stdev(self.payoffs)
+    The columns of the matrix sum to one, as every place is taken by
+    a single player.
 
-    @property
-    def payoff_stderr(self) -> float:
-        """Return the payoff standard error.
+    >>> from random import Random
+    >>> probabilities = calculate_finish_probabilities(
+    ...     [50, 30, 20],
+    ...     sample_count=10000,
+    ...     rng=Random(0),
+    ... )
+    >>> [round(sum(column), 4) for column in zip(*probabilities)]
+    [1.0, 1.0, 1.0]
+    >>> abs(probabilities[0][0] - 0.5) < 0.02
+    True
 
-        :return: The payoff standard error.
-        """
-        return self.payoff_stdev / sqrt(self.sample_count)
+    The players without any chip finish after those with chips. Among
+    them, the places are decided uniformly at random.
+
+    >>> calculate_finish_probabilities([1, 0, 0])
+    ((1.0, 0.0, 0.0), (0.0, 0.5, 0.5), (0.0, 0.5, 0.5))
+
+    :param chips: The players' chips.
+    :param place_count: The optional number of places (from the first
+                        one), defaults to ``None`` which is the number
+                        of players.
+    :param model: The model of the finishing orders, defaults to
+                  :attr:`pokerkit.analysis.ICMModel.MALMUTH_HARVILLE`.
+    :param sample_count: The optional number of finishing orders to
+                         sample, defaults to ``None`` which is the exact
+                         calculation.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :return: The probabilities of each player (the rows) finishing in
+             each place (the columns).
+    :raises ValueError: If the number of places or samples is invalid.
+    """
+    chips = tuple(chips)
+
+    if place_count is None:
+        place_count = len(chips)
+
+    if not 0 <= place_count <= len(chips):
+        raise ValueError(
+            (
+                f'The number of places {place_count} is not between 0 and'
+                f' the number of players {len(chips)}.'
+            ),
+        )
+
+    if sample_count is None:
+        probabilities, = __calculate_finish_probabilities_0(
+            [chips],
+            place_count,
+            model,
+        )
+    elif sample_count <= 0:
+        raise ValueError(
+            f'The number of samples {sample_count} is not positive.',
+        )
+    else:
+        probabilities = __sample_finish_probabilities(
+            chips,
+            place_count,
+            model,
+            sample_count,
+            Random(getrandbits(64)) if rng is None else rng,
+        )
+
+    return tuple(map(tuple, probabilities))
 
 
 def calculate_icm(
         payouts: Iterable[float],
         chips: Iterable[float],
+        *,
+        model: ICMModel = ICMModel.MALMUTH_HARVILLE,
+        sample_count: int | None = None,
+        rng: Random | None = None,
 ) -> tuple[float, ...]:
     """Calculate the independent chip model (ICM) values.
 
+    The values are the expected payouts under the probabilities of
+    the players finishing in each paid place. For more details, please
+    refer to :func:`pokerkit.analysis.calculate_finish_probabilities`.
+
     >>> calculate_icm([70, 30], [50, 30, 20])  # doctest: +ELLIPSIS
     (45.17..., 32.25, 22.57...)
     >>> calculate_icm([50, 30, 20], [25, 87, 88])  # doctest: +ELLIPSIS
@@ -530,26 +4094,440 @@ def calculate_icm(
     >>> calculate_icm([50, 30, 20], [198, 1, 1])  # doctest: +ELLIPSIS
     (49.79..., 25.10..., 25.10...)
 
+    Large fields, which are infeasible to calculate exactly, can be
+    approximated through Monte Carlo simulations.
+
+    >>> from random import Random
+    >>> icms = calculate_icm(
+    ...     [50, 30, 20],
+    ...     [10] * 30,
+    ...     sample_count=1000,
+    ...     rng=Random(0),
+    ... )
+    >>> round(sum(icms), 6)
+    100.0
+
+    The payouts beyond the number of players are never paid.
+
+    >>> calculate_icm([50, 30, 20], [50, 50])
+    (40.0, 40.0)
+
     :param payouts: The payouts.
     :param chips: The players' chips.
+    :param model: The model of the finishing orders, defaults to
+                  :attr:`pokerkit.analysis.ICMModel.MALMUTH_HARVILLE`.
+    :param sample_count: The optional number of finishing orders to
+                         sample, defaults to ``None`` which is the exact
+                         calculation.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
     :return: The ICM values.
     """
     payouts = tuple(payouts)
     chips = tuple(chips)
-    chip_sum = sum(chips)
-    chip_percentages = [chip / chip_sum for chip in chips]
-    icms = [0.0] * len(chips)
+    probabilities = calculate_finish_probabilities(
+        chips,
+        min(len(payouts), len(chips)),
+        model=model,
+        sample_count=sample_count,
+        rng=rng,
+    )
+
+    return tuple(
+        sum(map(mul, payouts, player_probabilities))
+        for player_probabilities in probabilities
+    )
+
+
+def calculate_icms(
+        payouts: Iterable[float],
+        chips: Iterable[Iterable[float]],
+        *,
+        model: ICMModel = ICMModel.MALMUTH_HARVILLE,
+        sample_count: int | None = None,
+        rng: Random | None = None,
+) -> list[tuple[float, ...]]:
+    """Calculate the independent chip model (ICM) values of many
+    distributions of the chips with the same payouts.
+
+    The distributions that only differ by the order of the players are
+    calculated once. The exact calculations of the distributions with
+    the same number of players share the tables of the subsets of the
+    players. For up to ``10`` players, the tables are also cached across
+    calls. For more details, please refer to
+    :func:`pokerkit.analysis.calculate_icm`.
+
+    >>> icms = calculate_icms(
+    ...     [50, 30, 20],
+    ...     [[50, 30, 20], [20, 50, 30], [5000, 3000, 2000, 1000]],
+    ... )
+    >>> [round(icm, 2) for icm in icms[0]]
+    [38.39, 32.75, 28.86]
+    >>> [round(icm, 2) for icm in icms[1]]
+    [28.86, 38.39, 32.75]
+    >>> [round(icm, 2) for icm in icms[2]]
+    [35.74, 28.62, 22.85, 12.79]
+
+    :param payouts: The payouts.
+    :param chips: The players' chips of each distribution.
+    :param model: The model of the finishing orders, defaults to
+                  :attr:`pokerkit.analysis.ICMModel.MALMUTH_HARVILLE`.
+    :param sample_count: The optional number of finishing orders to
+                         sample for each distribution, defaults to
+                         ``None`` which is the exact calculation.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
+    :return: The ICM values of each distribution.
+    """
+    payouts = tuple(payouts)
+    distributions = [tuple(chips_) for chips_ in chips]
+    sorted_distributions = defaultdict[
+        int,
+        dict[tuple[float, ...], None],
+    ](dict)
+
+    for distribution in distributions:
+        sorted_distributions[len(distribution)].setdefault(
+            tuple(sorted(distribution)),
+        )
+
+    sorted_icms = {}
+
+    for player_count, distributions_ in sorted_distributions.items():
+        place_count = min(len(payouts), player_count)
+        probabilities: list[list[list[float]]]
+
+        if sample_count is None:
+            probabilities = __calculate_finish_probabilities_0(
+                list(distributions_),
+                place_count,
+                model,
+            )
+        else:
+            probabilities = [
+                list(
+                    map(
+                        list,
+                        calculate_finish_probabilities(
+                            distribution,
+                            place_count,
+                            model=model,
+                            sample_count=sample_count,
+                            rng=rng,
+                        ),
+                    ),
+                ) for distribution in distributions_
+            ]
+
+        for distribution, probabilities_ in zip(
+                distributions_,
+                probabilities,
+        ):
+            sorted_icms[distribution] = [
+                sum(map(mul, payouts, player_probabilities))
+                for player_probabilities in probabilities_
+            ]
+
+    icms = []
+
+    for distribution in distributions:
+        icms_ = [0.0] * len(distribution)
+
+        for i, icm in zip(
+                sorted(range(len(distribution)), key=distribution.__getitem__),
+                sorted_icms[tuple(sorted(distribution))],
+        ):
+            icms_[i] = icm
+
+        icms.append(tuple(icms_))
+
+    return icms
+
+
+@dataclass(frozen=True)
+class PushFold:
+    """The class for ICM-aware push/fold situations.
+
+    Every player but the pusher and the caller has folded. The pusher
+    either folds, forfeiting the forced bets to the caller (e.g., as in
+    the small blind versus the big blind), or moves all-in. Then, the
+    caller either folds, forfeiting the forced bets to the pusher, or
+    calls. The values of the outcomes (the ICM values of the resulting
+    distributions of the chips) are calculated once, in a single batch,
+    and are combined with the equities of the hole cards to yield the
+    expected values of the decisions. The equities are taken from
+    equity matrices (see
+    :func:`pokerkit.analysis.calculate_equity_matrix`), which can be
+    calculated once and reused across the distributions of the chips.
+    The split pots are valued through the equities, as if they were
+    fractions of the wins.
+
+    >>> from random import Random
+    >>> from pokerkit import *
+    >>> push_fold = PushFold(
+    ...     (50, 30, 20),
+    ...     (5000, 3000, 2000),
+    ...     (0, 100, 200),
+    ...     1,
+    ...     2,
+    ... )
+    >>> round(push_fold.pusher_fold_ev, 2)
+    32.37
+    >>> round(push_fold.caller_fold_ev, 2)
+    28.05
+
+    The expected values of moving all-in with each combination against
+    a calling range, and of calling with each combination against a
+    pushing range, can be compared against those of folding.
+
+    >>> matrix = calculate_equity_matrix(
+    ...     parse_range('AsAh', '7c2d'),
+    ...     parse_range('22+ A2+ K2+ Q2s+ QTo+ J9s+'),
+    ...     (),
+    ...     2,
+    ...     5,
+    ...     Deck.STANDARD,
+    ...     (StandardHighHand,),
+    ...     sample_count=100,
+    ...     rng=Random(0),
+    ... )
+    >>> matrix.hole_cards
+    ((2d, 7c), (Ah, As))
+    >>> evs = push_fold.get_push_evs(matrix)
+    >>> evs[0] < push_fold.pusher_fold_ev < evs[1]
+    True
+
+    :param payouts: The payouts.
+    :param stacks: The players' chips before the forced bets.
+    :param forced_bets: The players' forced bets (e.g., antes and
+                        blinds).
+    :param pusher_index: The index of the pusher.
+    :param caller_index: The index of the caller.
+    :param model: The model of the finishing orders, defaults to
+                  :attr:`pokerkit.analysis.ICMModel.MALMUTH_HARVILLE`.
+    :raises ValueError: If the players or the forced bets are invalid.
+    """
+
+    payouts: tuple[float, ...]
+    """The payouts."""
+    stacks: tuple[float, ...]
+    """The players' chips before the forced bets."""
+    forced_bets: tuple[float, ...]
+    """The players' forced bets."""
+    pusher_index: int
+    """The index of the pusher."""
+    caller_index: int
+    """The index of the caller."""
+    model: ICMModel = ICMModel.MALMUTH_HARVILLE
+    """The model of the finishing orders."""
+
+    def __post_init__(self) -> None:
+        if len(self.stacks) != len(self.forced_bets):
+            raise ValueError(
+                'The numbers of the stacks and the forced bets differ.',
+            )
+
+        if not (
+                self.pusher_index != self.caller_index
+                and 0 <= self.pusher_index < len(self.stacks)
+                and 0 <= self.caller_index < len(self.stacks)
+        ):
+            raise ValueError(
+                (
+                    f'The pusher index {self.pusher_index} and the caller'
+                    f' index {self.caller_index} are not distinct indices'
+                    ' of the players.'
+                ),
+            )
+
+        for stack, forced_bet in zip(self.stacks, self.forced_bets):
+            if not 0 <= forced_bet <= stack:
+                raise ValueError(
+                    (
+                        f'The forced bet {forced_bet} is not between 0 and'
+                        f' the stack {stack}.'
+                    ),
+                )
+
+    @cached_property
+    def __icms(self) -> list[tuple[float, ...]]:
+        pot = sum(self.forced_bets)
+        amount = min(
+            self.stacks[self.pusher_index],
+            self.stacks[self.caller_index],
+        )
+        dead_pot = (
+            pot
+            - self.forced_bets[self.pusher_index]
+            - self.forced_bets[self.caller_index]
+        )
+        stacks = [
+            stack - forced_bet
+            for stack, forced_bet in zip(self.stacks, self.forced_bets)
+        ]
+        fold_stacks = stacks.copy()
+        fold_stacks[self.caller_index] += pot
+        steal_stacks = stacks.copy()
+        steal_stacks[self.pusher_index] += pot
+        win_stacks = list(self.stacks)
+        win_stacks[self.pusher_index] += amount + dead_pot
+        win_stacks[self.caller_index] -= amount
+        loss_stacks = list(self.stacks)
+        loss_stacks[self.pusher_index] -= amount
+        loss_stacks[self.caller_index] += amount + dead_pot
+
+        for i, stack in enumerate(stacks):
+            if i != self.pusher_index and i != self.caller_index:
+                win_stacks[i] = loss_stacks[i] = stack
+
+        return calculate_icms(
+            self.payouts,
+            (fold_stacks, steal_stacks, win_stacks, loss_stacks),
+            model=self.model,
+        )
+
+    @property
+    def fold_icms(self) -> tuple[float, ...]:
+        """Return the ICM values after the pusher folds.
+
+        :return: The ICM values.
+        """
+        return self.__icms[0]
+
+    @property
+    def steal_icms(self) -> tuple[float, ...]:
+        """Return the ICM values after the caller folds.
+
+        :return: The ICM values.
+        """
+        return self.__icms[1]
+
+    @property
+    def win_icms(self) -> tuple[float, ...]:
+        """Return the ICM values after the pusher wins the all-in.
 
-    for player_indices in permutations(range(len(chips)), len(payouts)):
-        probability = 1.0
-        denominator = 1.0
+        :return: The ICM values.
+        """
+        return self.__icms[2]
+
+    @property
+    def loss_icms(self) -> tuple[float, ...]:
+        """Return the ICM values after the pusher loses the all-in.
+
+        :return: The ICM values.
+        """
+        return self.__icms[3]
+
+    @property
+    def pusher_fold_ev(self) -> float:
+        """Return the expected value of folding for the pusher.
+
+        :return: The expected value.
+        """
+        return self.fold_icms[self.pusher_index]
+
+    @property
+    def caller_fold_ev(self) -> float:
+        """Return the expected value of folding for the caller.
+
+        :return: The expected value.
+        """
+        return self.steal_icms[self.caller_index]
+
+    def get_push_evs(
+            self,
+            equity_matrix: EquityMatrix,
+            deck: Deck = Deck.STANDARD,
+    ) -> list[float]:
+        """Return the expected values of moving all-in for the pusher.
+
+        The rows of the equity matrix are the combinations of the
+        pusher, and its columns are the combinations with which the
+        caller calls. The probability of a call is the fraction of the
+        combinations of the live cards (those not among the hole cards
+        of the pusher or the board cards) that are in the calling
+        range. The equity of a call is the mean of the equities against
+        the calling combinations, over those that are known (for a
+        sampled matrix, those covered by a sampled runout).
+
+        :param equity_matrix: The equities of the combinations of the
+                              pusher against the calling range.
+        :param deck: The deck, defaults to
+                     :attr:`pokerkit.utilities.Deck.STANDARD`.
+        :return: The expected values of each combination of the pusher.
+        :raises ValueError: If a combination of the pusher can be called
+                            but no equity against the calling
+                            combinations is known.
+        """
+        pusher_index = self.pusher_index
+        steal_ev = self.steal_icms[pusher_index]
+        win_ev = self.win_icms[pusher_index]
+        loss_ev = self.loss_icms[pusher_index]
+        card_count = len(deck)
+        board_mask = Card.get_mask(equity_matrix.board_cards)
+        other_masks = list(map(Card.get_mask, equity_matrix.other_hole_cards))
+        evs = []
+
+        for hole_cards, row in zip(
+                equity_matrix.hole_cards,
+                equity_matrix.equities,
+        ):
+            dead_mask = Card.get_mask(hole_cards) | board_mask
+            call_count = sum(
+                not other_mask & dead_mask for other_mask in other_masks
+            )
+            equities: list[float] = list(filter_none(row))
+
+            if call_count:
+                if not equities:
+                    raise ValueError(
+                        (
+                            f'No equity of the combination {repr(hole_cards)}'
+                            ' against the calling range is known.'
+                        ),
+                    )
+
+                call_probability = call_count / comb(
+                    card_count - dead_mask.bit_count(),
+                    len(equity_matrix.other_hole_cards[0]),
+                )
+                equity = mean(equities)
+            else:
+                call_probability = equity = 0
 
-        for player_index in player_indices:
-            chip_percentage = chip_percentages[player_index]
-            probability *= chip_percentage / denominator
-            denominator -= chip_percentage
+            evs.append(
+                (1 - call_probability) * steal_ev
+                + call_probability * (
+                    equity * win_ev + (1 - equity) * loss_ev
+                ),
+            )
+
+        return evs
+
+    def get_call_evs(self, equity_matrix: EquityMatrix) -> list[float | None]:
+        """Return the expected values of calling for the caller.
 
-        for payout, player_index in zip(payouts, player_indices):
-            icms[player_index] += payout * probability
+        The rows of the equity matrix are the combinations of the
+        caller, and its columns are the combinations with which the
+        pusher moves all-in.
+
+        :param equity_matrix: The equities of the combinations of the
+                              caller against the pushing range.
+        :return: The expected values of each combination of the caller,
+                 ``None`` for a combination that is incompatible with
+                 every combination of the pushing range.
+        """
+        caller_index = self.caller_index
+        win_ev = self.loss_icms[caller_index]
+        loss_ev = self.win_icms[caller_index]
+        evs: list[float | None] = []
+
+        for equity in equity_matrix.get_equities():
+            if equity is None:
+                evs.append(None)
+            else:
+                evs.append(equity * win_ev + (1 - equity) * loss_ev)
 
-    return tuple(icms)
+        return evs
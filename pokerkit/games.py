@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Callable
+from random import Random
 from typing import ClassVar
 
 from pokerkit.hands import (
@@ -173,6 +174,8 @@ class Poker(ABC):
             self,
             raw_starting_stacks: ValuesLike,
             player_count: int,
+            *,
+            rng: Random | None = None,
     ) -> State:
         """Create the poker state based on the game definition's
         attributes and the desired starting stacks.
@@ -184,8 +187,26 @@ class Poker(ABC):
         therefore this value is accepted as a separate parameter
         ``player_count``.
 
+        A seeded random number generator makes the dealt cards
+        reproducible.
+
+        >>> from random import Random
+        >>> game = NoLimitTexasHoldem(
+        ...     (Automation.ANTE_POSTING, Automation.BET_COLLECTION),
+        ...     True,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ... )
+        >>> state = game(200, 2, rng=Random(0))
+        >>> state.deck_cards == game(200, 2, rng=Random(0)).deck_cards
+        True
+
         :param raw_starting_stacks: The "raw" starting stacks.
         :param player_count: The number of players.
+        :param rng: The optional random number generator, defaults to
+                    ``None`` which is the global one of the
+                    :mod:`random` module.
         :return: The created poker game.
         """
         return State(
@@ -204,6 +225,7 @@ class Poker(ABC):
             starting_board_count=self.starting_board_count,
             divmod=self.divmod,
             rake=self.rake,
+            rng=rng,
         )
 
     @property
@@ -2153,8 +2175,10 @@ class KuhnPoker(FixedLimitPokerMixin, Poker):
             self,
             raw_starting_stacks: ValuesLike = 2,
             player_count: int = 2,
+            *,
+            rng: Random | None = None,
     ) -> State:
-        return super().__call__(raw_starting_stacks, player_count)
+        return super().__call__(raw_starting_stacks, player_count, rng=rng)
 
 
 class RhodeIslandHoldem(FixedLimitPokerMixin, Poker):
@@ -2266,8 +2290,10 @@ class RhodeIslandHoldem(FixedLimitPokerMixin, Poker):
             self,
             raw_starting_stacks: ValuesLike = 155,
             player_count: int = 2,
+            *,
+            rng: Random | None = None,
     ) -> State:
-        return super().__call__(raw_starting_stacks, player_count)
+        return super().__call__(raw_starting_stacks, player_count, rng=rng)
 
 
 class RoyalRhodeIslandHoldem(RoyalHoldemMixin, RhodeIslandHoldem):
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from functools import total_ordering
-from itertools import chain, combinations
-from typing import Any, ClassVar
+from itertools import chain, combinations, product, starmap
+from operator import add
+from typing import Any, ClassVar, TYPE_CHECKING
 
 from pokerkit.lookups import (
     BadugiLookup,
@@ -22,6 +23,10 @@ from pokerkit.lookups import (
 )
 from pokerkit.utilities import Card, CardsLike
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 
 @total_ordering
 class Hand(Hashable, ABC):
@@ -62,10 +67,15 @@ class Hand(Hashable, ABC):
     >>> h1 = ShortDeckHoldemHand('7c8c9cTcJc')
     >>> hands = {h0, h1}
 
+    The entry of the hand is looked up once, on construction. Hence,
+    comparing, sorting, and hashing hands only involve the entry
+    indices.
+
     :param cards: The cards that form the hand.
     :raises ValueError: If the cards form an invalid hand.
     """
 
+    __slots__ = '__cards', '__entry'
     lookup: ClassVar[Lookup]
     """The hand lookup."""
     low: ClassVar[bool]
@@ -114,10 +124,149 @@ class Hand(Hashable, ABC):
 
         return hand
 
+    @classmethod
+    def from_cards_or_none(cls, cards: CardsLike) -> Hand | None:
+        """Create a poker hand from the cards or return ``None`` if the
+        cards form an invalid hand.
+
+        Unlike the constructor, no exception is raised (and caught) for
+        invalid hands.
+
+        >>> StandardHighHand.from_cards_or_none('AsKsQsJsTs')
+        AsKsQsJsTs
+        >>> EightOrBetterLowHand.from_cards_or_none('AsAd2s3s4s') is None
+        True
+        >>> BadugiHand.from_cards_or_none('Ac2c') is None
+        True
+
+        :param cards: The cards that form the hand.
+        :return: The hand or ``None`` if the cards form an invalid hand.
+        """
+        cards = Card.clean(cards)
+        entry = cls.lookup.get_entry_or_none(cards)
+
+        if entry is None:
+            return None
+
+        hand = cls.__new__(cls)
+        hand.__cards = cards
+        hand.__entry = entry
+
+        return hand
+
+    @classmethod
+    def batch_from_game(
+            cls,
+            hole_card_indices: npt.ArrayLike,
+            board_card_indices: npt.ArrayLike = (),
+    ) -> npt.NDArray[np.int64]:
+        """Return the entry indices of the strongest hands formed in a
+        batch of game settings.
+
+        This is the vectorized counterpart of :meth:`from_game`. The
+        cards are denoted by their integer indices (see
+        :attr:`pokerkit.utilities.Card.index`), with one game setting
+        per row of the ``(N, k)`` arrays. A one-dimensional array is
+        shared by all game settings (e.g., a fixed board). The hands are
+        evaluated with :meth:`pokerkit.lookups.Lookup.get_entry_indices`
+        without creating any card or hand objects.
+
+        The returned entry indices can be compared like the hands: for
+        low hands (see :attr:`low`), a smaller index denotes a stronger
+        hand. The settings from which no valid hand can be formed are
+        denoted by ``-1``.
+
+        This method requires NumPy.
+
+        >>> import numpy as np
+        >>> hole_card_indices = np.array(
+        ...     [
+        ...         [card.index for card in Card.parse('AcAd')],
+        ...         [card.index for card in Card.parse('Ac9c')],
+        ...     ],
+        ...     dtype=np.uint8,
+        ... )
+        >>> board_card_indices = np.array(
+        ...     [card.index for card in Card.parse('AhKhQhJs2h')],
+        ...     dtype=np.uint8,
+        ... )
+        >>> indices = StandardHighHand.batch_from_game(
+        ...     hole_card_indices,
+        ...     board_card_indices,
+        ... )
+        >>> indices.tolist() == [
+        ...     StandardHighHand.from_game('AcAd', 'AhKhQhJs2h').entry.index,
+        ...     StandardHighHand.from_game('Ac9c', 'AhKhQhJs2h').entry.index,
+        ... ]
+        True
+        >>> EightOrBetterLowHand.batch_from_game(
+        ...     hole_card_indices,
+        ...     board_card_indices,
+        ... ).tolist()
+        [-1, -1]
+
+        :param hole_card_indices: The indices of the hole cards.
+        :param board_card_indices: The optional indices of the board
+                                   cards.
+        :return: The ``(N,)`` array of the entry indices of the
+                 strongest hands, with ``-1`` if no valid hand can be
+                 formed.
+        """
+        import numpy as np
+
+        hole_card_indices = np.atleast_2d(
+            np.asarray(hole_card_indices, dtype=np.intp),
+        )
+        board_card_indices = np.atleast_2d(
+            np.asarray(board_card_indices, dtype=np.intp),
+        )
+        count = max(len(hole_card_indices), len(board_card_indices))
+        hole_card_count = hole_card_indices.shape[1]
+        board_card_count = board_card_indices.shape[1]
+        card_indices = np.concatenate(
+            (
+                np.broadcast_to(hole_card_indices, (count, hole_card_count)),
+                np.broadcast_to(
+                    board_card_indices,
+                    (count, board_card_count),
+                ),
+            ),
+            axis=1,
+        )
+        best_indices = np.full(count, -1, dtype=np.int64)
+
+        for positions in cls._get_position_combinations(
+                hole_card_count,
+                board_card_count,
+        ):
+            indices = cls.lookup.get_entry_indices(
+                card_indices[:, list(positions)],
+            )
+
+            if cls.low:
+                statuses = (indices != -1) & (
+                    (best_indices == -1) | (indices < best_indices)
+                )
+            else:
+                statuses = indices > best_indices
+
+            best_indices = np.where(statuses, indices, best_indices)
+
+        return best_indices
+
+    @classmethod
+    def _get_position_combinations(
+            cls,
+            hole_card_count: int,
+            board_card_count: int,
+    ) -> Iterable[tuple[int, ...]]:
+        return (tuple(range(hole_card_count + board_card_count)),)
+
     def __init__(self, cards: CardsLike) -> None:
         self.__cards = Card.clean(cards)
+        entry = self.lookup.get_entry_or_none(self.__cards)
 
-        if not self.lookup.has_entry(self.cards):
+        if entry is None:
             raise ValueError(
                 (
                     f'The cards {repr(cards)} form an invalid'
@@ -125,16 +274,18 @@ class Hand(Hashable, ABC):
                 ),
             )
 
+        self.__entry = entry
+
     def __eq__(self, other: Any) -> bool:
         if type(self) != type(other):  # noqa: E721
             return NotImplemented
 
         assert isinstance(other, Hand)
 
-        return self.entry == other.entry
+        return self.__entry.index == other.__entry.index
 
     def __hash__(self) -> int:
-        return hash(self.entry)
+        return hash(self.__entry)
 
     def __lt__(self, other: Hand) -> bool:
         if type(self) != type(other):  # noqa: E721
@@ -143,9 +294,9 @@ class Hand(Hashable, ABC):
         assert isinstance(other, Hand)
 
         if self.low:
-            ordering = self.entry > other.entry
+            ordering = self.__entry.index > other.__entry.index
         else:
-            ordering = self.entry < other.entry
+            ordering = self.__entry.index < other.__entry.index
 
         return ordering
 
@@ -181,7 +332,7 @@ class Hand(Hashable, ABC):
 
         :return: The hand entry.
         """
-        return self.lookup.get_entry(self.cards)
+        return self.__entry
 
 
 class CombinationHand(Hand, ABC):
@@ -191,6 +342,7 @@ class CombinationHand(Hand, ABC):
     in whatever way possible.
     """
 
+    __slots__ = ()
     card_count: ClassVar[int]
     """The number of cards."""
 
@@ -259,22 +411,11 @@ class CombinationHand(Hand, ABC):
         :param hole_cards: The hole cards.
         :param board_cards: The optional board cards.
         :return: The strongest hand from possible card combinations.
+        :raises ValueError: If no valid hand can be formed.
         """
-        max_hand = None
+        hand = cls.from_game_or_none(hole_cards, board_cards)
 
-        for combination in combinations(
-                chain(Card.clean(hole_cards), Card.clean(board_cards)),
-                cls.card_count,
-        ):
-            try:
-                hand = cls(combination)
-            except ValueError:
-                pass
-            else:
-                if max_hand is None or hand > max_hand:
-                    max_hand = hand
-
-        if max_hand is None:
+        if hand is None:
             raise ValueError(
                 (
                     f'No valid {cls.__qualname__} hand can be formed'
@@ -282,12 +423,64 @@ class CombinationHand(Hand, ABC):
                 ),
             )
 
-        return max_hand
+        return hand
+
+    @classmethod
+    def from_game_or_none(
+            cls,
+            hole_cards: CardsLike,
+            board_cards: CardsLike = (),
+    ) -> Hand | None:
+        """Create a poker hand from a game setting or return ``None``
+        if no valid hand can be formed.
+
+        In a game setting, a player uses private cards from their hole
+        and the public cards from the board to make their hand.
+
+        No exception is raised (and caught) for the invalid
+        combinations of cards.
+
+        >>> EightOrBetterLowHand.from_game_or_none('AsKs', '2c3c4c5c6c')
+        As2c3c4c5c
+        >>> hand = EightOrBetterLowHand.from_game_or_none('AsKs', '2c3cJcQc')
+        >>> hand is None
+        True
+        >>> ShortDeckHoldemHand.from_game_or_none('AsKs', 'Qd') is None
+        True
+
+        :param hole_cards: The hole cards.
+        :param board_cards: The optional board cards.
+        :return: The strongest hand from possible card combinations, or
+                 ``None`` if no valid hand can be formed.
+        """
+        cards = tuple(chain(Card.clean(hole_cards), Card.clean(board_cards)))
+        positions = cls.lookup.get_best_positions(
+            [card.index for card in cards],
+            cls.card_count,
+            cls.low,
+        )
+
+        if positions is None:
+            return None
+
+        return cls(map(cards.__getitem__, positions))
+
+    @classmethod
+    def _get_position_combinations(
+            cls,
+            hole_card_count: int,
+            board_card_count: int,
+    ) -> Iterable[tuple[int, ...]]:
+        return combinations(
+            range(hole_card_count + board_card_count),
+            cls.card_count,
+        )
 
 
 class StandardHand(CombinationHand, ABC):
     """The abstract base class for standard hands."""
 
+    __slots__ = ()
     lookup = StandardLookup()
     card_count = 5
 
@@ -317,6 +510,7 @@ class StandardHighHand(StandardHand):
     ValueError: The cards () form an invalid StandardHighHand hand.
     """
 
+    __slots__ = ()
     low = False
 
 
@@ -345,6 +539,7 @@ class StandardLowHand(StandardHand):
     ValueError: The cards () form an invalid StandardLowHand hand.
     """
 
+    __slots__ = ()
     low = True
 
 
@@ -375,6 +570,7 @@ class ShortDeckHoldemHand(CombinationHand):
     ValueError: The cards () form an invalid ShortDeckHoldemHand hand.
     """
 
+    __slots__ = ()
     lookup = ShortDeckHoldemLookup()
     low = False
     card_count = 5
@@ -411,6 +607,7 @@ class EightOrBetterLowHand(CombinationHand):
     ValueError: The cards () form an invalid EightOrBetterLowHand hand.
     """
 
+    __slots__ = ()
     lookup = EightOrBetterLookup()
     low = True
     card_count = 5
@@ -438,6 +635,7 @@ class RegularLowHand(CombinationHand):
     ValueError: The cards () form an invalid RegularLowHand hand.
     """
 
+    __slots__ = ()
     lookup = RegularLookup()
     low = True
     card_count = 5
@@ -446,16 +644,18 @@ class RegularLowHand(CombinationHand):
 class BoardCombinationHand(CombinationHand, ABC):
     """The abstract base class for board-combination hands."""
 
+    __slots__ = ()
     board_card_count: ClassVar[int]
     """The number of board cards."""
 
     @classmethod
-    def from_game(
+    def from_game_or_none(
             cls,
             hole_cards: CardsLike,
             board_cards: CardsLike = (),
-    ) -> Hand:
-        """Create a poker hand from a game setting.
+    ) -> Hand | None:
+        """Create a poker hand from a game setting or return ``None``
+        if no valid hand can be formed.
 
         In a game setting, a player uses private cards from their hole
         and the public cards from the board to make their hand.
@@ -472,34 +672,41 @@ class BoardCombinationHand(CombinationHand, ABC):
         >>> h1 = GreekHoldemHand('AcAhKhQh9c')
         >>> h0 == h1
         True
+        >>> GreekHoldemHand.from_game_or_none('Ac9c', 'AhKh') is None
+        True
 
         :param hole_cards: The hole cards.
         :param board_cards: The optional board cards.
-        :return: The strongest hand from possible card combinations.
+        :return: The strongest hand from possible card combinations, or
+                 ``None`` if no valid hand can be formed.
         """
         hole_cards = Card.clean(hole_cards)
         board_cards = Card.clean(board_cards)
         max_hand = None
 
         for combination in combinations(board_cards, cls.board_card_count):
-            try:
-                hand = super().from_game(hole_cards, combination)
-            except ValueError:
-                pass
-            else:
-                if max_hand is None or hand > max_hand:
-                    max_hand = hand
+            hand = super().from_game_or_none(hole_cards, combination)
 
-        if max_hand is None:
-            raise ValueError(
-                (
-                    f'No valid {cls.__qualname__} hand can be formed'
-                    ' from the hole and board cards.'
-                ),
-            )
+            if hand is not None and (max_hand is None or hand > max_hand):
+                max_hand = hand
 
         return max_hand
 
+    @classmethod
+    def _get_position_combinations(
+            cls,
+            hole_card_count: int,
+            board_card_count: int,
+    ) -> Iterable[tuple[int, ...]]:
+        for board_positions in combinations(
+                range(hole_card_count, hole_card_count + board_card_count),
+                cls.board_card_count,
+        ):
+            yield from combinations(
+                chain(range(hole_card_count), board_positions),
+                cls.card_count,
+            )
+
 
 class GreekHoldemHand(BoardCombinationHand):
     """The class for Greek hold'em hands.
@@ -516,6 +723,7 @@ class GreekHoldemHand(BoardCombinationHand):
     True
     """
 
+    __slots__ = ()
     lookup = StandardLookup()
     low = False
     card_count = 5
@@ -529,16 +737,18 @@ class HoleBoardCombinationHand(BoardCombinationHand, ABC):
     cards and board cards.
     """
 
+    __slots__ = ()
     hole_card_count: ClassVar[int]
     """The number of hole cards."""
 
     @classmethod
-    def from_game(
+    def from_game_or_none(
             cls,
             hole_cards: CardsLike,
             board_cards: CardsLike = (),
-    ) -> Hand:
-        """Create a poker hand from a game setting.
+    ) -> Hand | None:
+        """Create a poker hand from a game setting or return ``None``
+        if no valid hand can be formed.
 
         In a game setting, a player uses private cards from their hole
         and the public cards from the board to make their hand.
@@ -568,33 +778,55 @@ class HoleBoardCombinationHand(BoardCombinationHand, ABC):
         >>> h1 = OmahaEightOrBetterLowHand('Ad2d3d4d6d')
         >>> h0 == h1
         True
+        >>> OmahaEightOrBetterLowHand.from_game_or_none(
+        ...     'As6s7s8s',
+        ...     '2c3c9cTcJc',
+        ... ) is None
+        True
 
         :param hole_cards: The hole cards.
         :param board_cards: The optional board cards.
-        :return: The strongest hand from possible card combinations.
+        :return: The strongest hand from possible card combinations, or
+                 ``None`` if no valid hand can be formed.
         """
         hole_cards = Card.clean(hole_cards)
         board_cards = Card.clean(board_cards)
-        max_hand = None
+        positions = cls.lookup.get_best_hole_board_positions(
+            [card.index for card in hole_cards],
+            [card.index for card in board_cards],
+            cls.hole_card_count,
+            cls.board_card_count,
+            cls.low,
+        )
+
+        if positions is None:
+            return None
+
+        hole_positions, board_positions = positions
+
+        return cls(
+            chain(
+                map(hole_cards.__getitem__, hole_positions),
+                map(board_cards.__getitem__, board_positions),
+            ),
+        )
 
-        for combination in combinations(hole_cards, cls.hole_card_count):
-            try:
-                hand = super().from_game(combination, board_cards)
-            except ValueError:
-                pass
-            else:
-                if max_hand is None or hand > max_hand:
-                    max_hand = hand
-
-        if max_hand is None:
-            raise ValueError(
-                (
-                    f'No valid {cls.__qualname__} hand can be formed'
-                    ' from the hole and board cards.'
+    @classmethod
+    def _get_position_combinations(
+            cls,
+            hole_card_count: int,
+            board_card_count: int,
+    ) -> Iterable[tuple[int, ...]]:
+        return starmap(
+            add,
+            product(
+                combinations(range(hole_card_count), cls.hole_card_count),
+                combinations(
+                    range(hole_card_count, hole_card_count + board_card_count),
+                    cls.board_card_count,
                 ),
-            )
-
-        return max_hand
+            ),
+        )
 
 
 class OmahaHoldemHand(HoleBoardCombinationHand):
@@ -612,6 +844,7 @@ class OmahaHoldemHand(HoleBoardCombinationHand):
     True
     """
 
+    __slots__ = ()
     lookup = StandardLookup()
     low = False
     card_count = 5
@@ -629,6 +862,7 @@ class OmahaEightOrBetterLowHand(HoleBoardCombinationHand):
     True
     """
 
+    __slots__ = ()
     lookup = EightOrBetterLookup()
     low = True
     card_count = 5
@@ -669,7 +903,8 @@ class BadugiHand(Hand):
     ValueError: The cards () form an invalid BadugiHand hand.
     """
 
-    lookup = BadugiLookup()
+    __slots__ = ()
+    lookup: ClassVar[BadugiLookup] = BadugiLookup()
     low = True
 
     @classmethod
@@ -717,24 +952,11 @@ class BadugiHand(Hand):
         :param hole_cards: The hole cards.
         :param board_cards: The optional board cards.
         :return: The strongest hand from possible card combinations.
+        :raises ValueError: If no valid hand can be formed.
         """
-        cards = tuple(chain(Card.clean(hole_cards), Card.clean(board_cards)))
-        max_hand = None
+        hand = cls.from_game_or_none(hole_cards, board_cards)
 
-        for count in range(4, 0, -1):
-            for combination in combinations(cards, count):
-                try:
-                    hand = cls(combination)
-                except ValueError:
-                    pass
-                else:
-                    if max_hand is None or hand > max_hand:
-                        max_hand = hand
-
-            if max_hand is not None:
-                break
-
-        if max_hand is None:
+        if hand is None:
             raise ValueError(
                 (
                     f'No valid {cls.__qualname__} hand can be formed'
@@ -742,12 +964,57 @@ class BadugiHand(Hand):
                 ),
             )
 
-        return max_hand
+        return hand
+
+    @classmethod
+    def from_game_or_none(
+            cls,
+            hole_cards: CardsLike,
+            board_cards: CardsLike = (),
+    ) -> Hand | None:
+        """Create a poker hand from a game setting or return ``None``
+        if no valid hand can be formed.
+
+        In a game setting, a player uses private cards from their hole
+        and the public cards from the board to make their hand.
+
+        >>> BadugiHand.from_game_or_none('2s3s4d7h')
+        2s4d7h
+        >>> BadugiHand.from_game_or_none('??') is None
+        True
+
+        :param hole_cards: The hole cards.
+        :param board_cards: The optional board cards.
+        :return: The strongest hand from possible card combinations, or
+                 ``None`` if no valid hand can be formed.
+        """
+        cards = tuple(chain(Card.clean(hole_cards), Card.clean(board_cards)))
+        positions = cls.lookup.get_best_rainbow_positions(
+            [card.index for card in cards],
+        )
+
+        if positions is None:
+            return None
+
+        return cls(map(cards.__getitem__, positions))
+
+    @classmethod
+    def _get_position_combinations(
+            cls,
+            hole_card_count: int,
+            board_card_count: int,
+    ) -> Iterable[tuple[int, ...]]:
+        for count in range(4, 0, -1):
+            yield from combinations(
+                range(hole_card_count + board_card_count),
+                count,
+            )
 
 
 class StandardBadugiHand(BadugiHand):
     """The class for standard badugi hands (deuce-to-seven)."""
 
+    __slots__ = ()
     lookup = StandardBadugiLookup()
 
 
@@ -766,6 +1033,7 @@ class KuhnPokerHand(CombinationHand):
     ValueError: The cards 'As' form an invalid KuhnPokerHand hand.
     """
 
+    __slots__ = ()
     lookup = KuhnPokerLookup()
     low = False
     card_count = 1
@@ -787,6 +1055,7 @@ class RhodeIslandHoldemHand(CombinationHand):
     ValueError: The cards 'AsKh' form an invalid RhodeIslandHoldemHand hand.
     """
 
+    __slots__ = ()
     lookup = RhodeIslandHoldemLookup()
     low = False
     card_count = 3
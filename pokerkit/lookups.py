@@ -4,18 +4,31 @@ lookups.
 Lookups are used by PokerKit's hand types to discern hand strengths.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Reversible, Sequence
+from array import array
+from collections.abc import Callable, Iterable, Reversible, Sequence
 from collections import Counter
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from enum import StrEnum, unique
-from functools import partial
-from itertools import combinations, filterfalse
-from math import prod
-from operator import contains
-from typing import ClassVar
+from functools import cache, cached_property, partial
+from hashlib import md5
+from inspect import getsource
+from itertools import combinations, filterfalse, product, repeat, starmap
+from math import comb, perm, prod
+from mmap import ACCESS_READ, mmap
+from operator import attrgetter, contains, lshift
+from os import environ, getpid, makedirs, path, replace
+from struct import Struct
+from sys import modules
+from typing import Any, ClassVar, TYPE_CHECKING
+
+from pokerkit.utilities import Card, CardsLike, Rank, RankOrder, Suit
 
-from pokerkit.utilities import Card, CardsLike, Rank, RankOrder
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 
 @unique
@@ -50,7 +63,7 @@ class Label(StrEnum):
     """The label of straight flush."""
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Entry:
     """The class for hand lookup entries.
 
@@ -60,7 +73,8 @@ class Entry:
     on whether using a high/low hand) index with which different entries
     and hands are compared.
 
-    The attributes are read-only.
+    The attributes are read-only. The entries are slotted and are
+    ordered (and hashed) by their indices alone.
 
     Note that the entries in the example below are meaningless. They
     are only meant to show how entries are used by other poker
@@ -115,14 +129,62 @@ class Lookup(ABC):
     assert len(__primes) >= len(tuple(Rank)) - 1  # except unknown
 
     __multipliers = dict(zip(Rank, __primes))
+    __suit_count = len(tuple(Suit)) - 1  # except unknown
+    __max_selection_margin = 2
+    __cards = sorted(
+        starmap(Card, product(Rank, Suit)),
+        key=attrgetter('index'),
+    )
+    __card_multipliers = tuple(
+        map(__multipliers.get, map(attrgetter('rank'), __cards), repeat(0)),
+    )
+    __card_suits = tuple(
+        map(
+            lshift,
+            repeat(1),
+            map(tuple(Suit).index, map(attrgetter('suit'), __cards)),
+        ),
+    )
+
+    assert list(map(attrgetter('index'), __cards)) == list(range(len(__cards)))
+
+    __table_magic = b'PKLT'
+    __table_version = 1
+    __table_header = Struct('=4sIQ')
     rank_order: ClassVar[RankOrder]
     """The rank order."""
-    __entries: dict[tuple[int, bool], Entry] = field(
+    cache_directory: ClassVar[str | None] = (
+        environ.get('POKERKIT_CACHE_DIRECTORY') or None
+    )
+    """The optional directory in which the generated tables are
+    persisted.
+
+    By default, this is the value of the ``POKERKIT_CACHE_DIRECTORY``
+    environment variable, if set, and ``None`` otherwise. If ``None``,
+    the tables are not persisted and are generated in memory by every
+    process.
+
+    The names of the files include a digest of the sources of the
+    modules that define the lookup and the cards, so that the tables
+    generated by other versions of the code are never reused. If the
+    sources are unavailable, the tables are not persisted.
+
+    Persisting the tables saves their generation time, not memory. The
+    entries are still looked up through a dictionary that each process
+    builds from the mapped tables. Only the vectorized lookups
+    (:meth:`get_entry_indices`) read the mapped tables directly.
+    """
+    __added_entries: dict[int, Entry] = field(
         default_factory=dict,
         init=False,
         repr=False,
     )
     __entry_count: int = field(default=0, init=False, repr=False)
+    __selection_statuses: dict[tuple[int, bool], bool] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     @classmethod
     def __hash(cls, ranks: Iterable[Rank]) -> int:
@@ -154,29 +216,259 @@ class Lookup(ABC):
 
         return hashes
 
-    def __post_init__(self) -> None:
-        self._add_entries()
-        self.__reset_ranks()
+    @classmethod
+    @cache
+    def __get_table_digest(cls) -> str | None:
+        module_names = dict.fromkeys(
+            class_.__module__
+            for class_ in cls.__mro__ if issubclass(class_, Lookup)
+        )
+        module_names[Card.__module__] = None
+        algorithm = md5(usedforsecurity=False)
 
-    @abstractmethod
-    def _add_entries(self) -> None:
-        pass  # pragma: no cover
+        algorithm.update(
+            repr(
+                (
+                    cls.__table_version,
+                    tuple(cls.rank_order),
+                    tuple(Label),
+                    cls.__card_multipliers,
+                    cls.__card_suits,
+                ),
+            ).encode(),
+        )
+
+        for module_name in module_names:
+            try:
+                source = getsource(modules[module_name])
+            except (KeyError, OSError, TypeError):
+                return None
+
+            algorithm.update(source.encode())
+
+        return algorithm.hexdigest()
+
+    @classmethod
+    @cache
+    def __get_count_digest(cls, ranks: RankOrder) -> str | None:
+        algorithm = md5(usedforsecurity=False)
+
+        algorithm.update(repr(tuple(ranks)).encode())
+
+        for function in (
+                cls.__dump_cumulative_counts,
+                cls.__count_hands,
+                cls._count_combinations,
+                cls.__get_multiplicities,
+                cls.__get_selection_status,
+                cls.__get_selection_level,
+                cls.__extend_selection_level,
+        ):
+            try:
+                source = getsource(function)
+            except (OSError, TypeError):
+                return None
+
+            algorithm.update(source.encode())
+
+        return algorithm.hexdigest()
+
+    @classmethod
+    def __load_table(
+            cls,
+            name: str | None,
+            build: Callable[[], dict[int, int]],
+    ) -> tuple[memoryview, memoryview]:
+        if cls.cache_directory is None or name is None:
+            digest = None
+        else:
+            digest = cls.__get_table_digest()
+
+        if cls.cache_directory is None or digest is None or name is None:
+            pathname = None
+        else:
+            pathname = path.join(
+                cls.cache_directory,
+                f'{cls.__module__}.{cls.__qualname__}.{digest}.{name}',
+            )
+
+            try:
+                with open(pathname, 'rb') as file:
+                    buffer = memoryview(
+                        mmap(file.fileno(), 0, access=ACCESS_READ),
+                    )
+            except (OSError, ValueError):
+                pass
+            else:
+                header_size = cls.__table_header.size
+
+                if len(buffer) >= header_size:
+                    magic, version, count = cls.__table_header.unpack_from(
+                        buffer,
+                    )
+                else:
+                    magic, version, count = b'', 0, 0
+
+                if (
+                        magic == cls.__table_magic
+                        and version == cls.__table_version
+                        and len(buffer) == header_size + 16 * count
+                ):
+                    split = header_size + 8 * count
+
+                    return (
+                        buffer[header_size:split].cast('Q'),
+                        buffer[split:].cast('Q'),
+                    )
+
+        table = build()
+        keys = array('Q', sorted(table))
+        values = array('Q', map(table.__getitem__, keys))
+
+        if pathname is not None:
+            temporary_pathname = f'{pathname}.{getpid()}'
+
+            try:
+                makedirs(path.dirname(pathname), exist_ok=True)
+
+                with open(temporary_pathname, 'wb') as file:
+                    file.write(
+                        cls.__table_header.pack(
+                            cls.__table_magic,
+                            cls.__table_version,
+                            len(keys),
+                        ),
+                    )
+                    file.write(keys.tobytes())
+                    file.write(values.tobytes())
+
+                replace(temporary_pathname, pathname)
+            except OSError:
+                pass
+
+        return memoryview(keys), memoryview(values)
+
+    @classmethod
+    @cache
+    def __load_entry_table(cls) -> tuple[memoryview, memoryview]:
+        return cls.__load_table('entries', cls().__dump_entries)
 
-    def __reset_ranks(self) -> None:
-        indices = set()
+    @classmethod
+    @cache
+    def __load_entry_arrays(
+            cls,
+    ) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.int64]]:
+        import numpy as np
 
-        for entry in self.__entries.values():
-            indices.add(entry.index)
+        keys, values = cls.__load_entry_table()
+
+        return (
+            np.frombuffer(keys, dtype=np.uint64),
+            (np.frombuffer(values, dtype=np.uint64) >> 8).astype(np.int64),
+        )
 
-        sorted_indices = sorted(indices)
-        reset_indices = dict(zip(sorted_indices, range(len(indices))))
+    @classmethod
+    @cache
+    def __load_card_arrays(
+            cls,
+    ) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+        import numpy as np
+
+        return (
+            np.array(cls.__card_multipliers, dtype=np.uint64),
+            np.array(cls.__card_suits, dtype=np.uint64),
+        )
 
-        for key, value in self.__entries.items():
-            self.__entries[key] = replace(
-                value,
-                index=reset_indices[value.index],
+    @classmethod
+    @cache
+    def __load_entries(cls) -> dict[int, Entry]:
+        keys, values = cls.__load_entry_table()
+        labels = tuple(Label)
+        entries = {}
+        shared_entries = dict[int, Entry]()
+
+        for key, value in zip(keys, values):
+            entry = shared_entries.get(value)
+
+            if entry is None:
+                entry = Entry(value >> 8, labels[value & 0xFF])
+                shared_entries[value] = entry
+
+            entries[key] = entry
+
+        return entries
+
+    @classmethod
+    @cache
+    def __load_cumulative_counts(
+            cls,
+            card_count: int | None,
+            low: bool,
+            ranks: RankOrder,
+    ) -> memoryview:
+        digest: str | None
+        name: str | None
+
+        if cls.cache_directory is None:
+            digest = None
+        else:
+            digest = cls.__get_count_digest(ranks)
+
+        if digest is None:
+            name = None
+        elif card_count is None:
+            name = f'cumulative-counts-{ranks.name}-{digest}'
+        else:
+            name = (
+                f'cumulative-counts-{card_count}-{low:d}-{ranks.name}'
+                f'-{digest}'
             )
 
+        _, cumulative_counts = cls.__load_table(
+            name,
+            partial(cls().__dump_cumulative_counts, card_count, low, ranks),
+        )
+
+        return cumulative_counts
+
+    @classmethod
+    @cache
+    def __load_selection_levels(
+            cls,
+    ) -> dict[tuple[int, bool, bool], list[dict[int, int]]]:
+        return {}
+
+    @cached_property
+    def __entries(self) -> dict[int, Entry]:
+        return self.__load_entries()
+
+    @cached_property
+    def __selection_levels(
+            self,
+    ) -> dict[tuple[int, bool, bool], list[dict[int, int]]]:
+        return self.__load_selection_levels()
+
+    def __dump_entries(self) -> dict[int, int]:
+        self._add_entries()
+
+        labels = tuple(Label)
+        indices = sorted(
+            set(map(attrgetter('index'), self.__added_entries.values())),
+        )
+        reset_indices = dict(zip(indices, range(len(indices))))
+        table = {}
+
+        for key, entry in self.__added_entries.items():
+            table[key] = (
+                reset_indices[entry.index] << 8 | labels.index(entry.label)
+            )
+
+        return table
+
+    @abstractmethod
+    def _add_entries(self) -> None:
+        pass  # pragma: no cover
+
     def has_entry(self, cards: CardsLike) -> bool:
         """Return whether the cards can be looked up.
 
@@ -193,12 +485,9 @@ class Lookup(ABC):
         :return: ``True`` if the cards can looked up, otherwise
                  ``False``.
         """
-        try:
-            key = self._get_key(cards)
-        except ValueError:
-            key = None
+        key = self._get_key_or_none(self.__get_card_indices(cards))
 
-        return key in self.__entries
+        return key is not None and key in self.__entries
 
     def get_entry(self, cards: CardsLike) -> Entry:
         """Return the corresponding lookup entry of the hand that the
@@ -219,7 +508,7 @@ class Lookup(ABC):
         :return: The corresponding lookup entry.
         :raises ValueError: If cards do not form a valid hand.
         """
-        key = self._get_key(cards)
+        key = self._get_key(self.__get_card_indices(cards))
 
         if key not in self.__entries:
             raise ValueError(f'The cards {repr(cards)} form an invalid hand.')
@@ -238,17 +527,893 @@ class Lookup(ABC):
         >>> lookup.get_entry_or_none('Ah6h7s8c2s') is None
         True
 
+        No exception is raised for the cards that cannot be keyed.
+
+        >>> BadugiLookup().get_entry_or_none('2s3s') is None
+        True
+
         :param cards: The cards to look up.
         :return: The optional corresponding lookup entry.
         """
-        return self.__entries.get(self._get_key(cards))
+        key = self._get_key_or_none(self.__get_card_indices(cards))
+
+        if key is None:
+            return None
+
+        return self.__entries.get(key)
 
-    def _get_key(self, cards: CardsLike) -> tuple[int, bool]:
-        cards = Card.clean(cards)
-        hash_ = self.__hash(Card.get_ranks(cards))
-        suitedness = Card.are_suited(cards)
+    def get_entry_index(self, card_indices: Iterable[int]) -> int:
+        """Return the index of the lookup entry of the hand that the
+        cards with the given indices form.
 
-        return hash_, suitedness
+        Unlike :meth:`get_entry`, the cards are denoted by their
+        integer indices (see :attr:`pokerkit.utilities.Card.index`).
+        This avoids the overhead of cleaning the cards and is intended
+        for tight evaluation loops.
+
+        >>> lookup = StandardLookup()
+        >>> cards = tuple(Card.parse('Ah6h7s8c9s'))
+        >>> lookup.get_entry_index(card.index for card in cards)
+        852
+        >>> lookup.get_entry(cards).index
+        852
+        >>> lookup.get_entry_index((0, 4, 8, 12))
+        Traceback (most recent call last):
+            ...
+        ValueError: The cards (0, 4, 8, 12) form an invalid hand.
+
+        :param card_indices: The indices of the cards to look up.
+        :return: The index of the corresponding lookup entry.
+        :raises ValueError: If cards do not form a valid hand.
+        """
+        card_indices = tuple(card_indices)
+        key = self._get_key_or_none(card_indices)
+        entry = None if key is None else self.__entries.get(key)
+
+        if entry is None:
+            raise ValueError(
+                f'The cards {repr(card_indices)} form an invalid hand.',
+            )
+
+        return entry.index
+
+    def get_entry_indices(
+            self,
+            card_indices: npt.ArrayLike,
+    ) -> npt.NDArray[np.int64]:
+        """Return the indices of the lookup entries of the hands that
+        the rows of the given card indices form.
+
+        This is the vectorized counterpart of :meth:`get_entry_index`.
+        Each row of the ``(N, k)`` array of card indices (see
+        :attr:`pokerkit.utilities.Card.index`) denotes a hand. The hands
+        are keyed and looked up with NumPy gather operations on the
+        precomputed tables, without creating any card or entry objects.
+        Instead of raising an error, ``-1`` is returned for the rows
+        that do not form valid hands.
+
+        This method requires NumPy.
+
+        >>> import numpy as np
+        >>> lookup = StandardLookup()
+        >>> card_indices = np.array(
+        ...     [
+        ...         [card.index for card in Card.parse('Ah6h7s8c9s')],
+        ...         [card.index for card in Card.parse('AsKsQsJsTs')],
+        ...         [0, 4, 8, 12, 0],
+        ...     ],
+        ...     dtype=np.uint8,
+        ... )
+        >>> lookup.get_entry_indices(card_indices).tolist()
+        [852, 7461, -1]
+
+        :param card_indices: The ``(N, k)`` array of card indices.
+        :return: The ``(N,)`` array of entry indices, with ``-1`` for
+                 the invalid hands.
+        :raises ValueError: If the card indices are not two-dimensional.
+        """
+        import numpy as np
+
+        array_ = np.asarray(card_indices)
+
+        if array_.ndim != 2:
+            raise ValueError(
+                (
+                    'The card indices must form a two-dimensional array'
+                    f' but the array has {array_.ndim} dimensions.'
+                ),
+            )
+
+        keys, indices = self.__load_entry_arrays()
+        batch_keys = self._get_keys(array_)
+        positions = np.minimum(
+            np.searchsorted(keys, batch_keys),
+            len(keys) - 1,
+        )
+
+        return np.where(keys[positions] == batch_keys, indices[positions], -1)
+
+    def get_best_positions(
+            self,
+            card_indices: Sequence[int],
+            card_count: int,
+            low: bool = False,
+    ) -> tuple[int, ...] | None:
+        """Return the positions of the cards that form the strongest
+        hand with the given number of cards.
+
+        The strongest hand is found without enumerating the card
+        combinations. Instead, tables mapping the rank product of every
+        rank multiset (and of every suit's cards, for flushes) to its
+        strongest sub-multiset are built lazily, and the cards are then
+        matched against the selected ranks. If several combinations form
+        equally strong hands, the first combination (in the order
+        produced by ``itertools.combinations``) is chosen.
+
+        Some lookups and orderings cannot be handled this way (e.g.,
+        standard low hands, where flushes are undesirable). In such
+        cases, the combinations are scanned instead.
+
+        >>> lookup = StandardLookup()
+        >>> cards = tuple(Card.parse('AsAcKh3sAdAh2c'))
+        >>> lookup.get_best_positions([card.index for card in cards], 5)
+        (0, 1, 2, 4, 5)
+        >>> cards = tuple(Card.parse('8h7h6h5h4h3h2h'))
+        >>> card_indices = [card.index for card in cards]
+        >>> lookup.get_best_positions(card_indices, 5)
+        (0, 1, 2, 3, 4)
+        >>> lookup.get_best_positions(card_indices, 5, True)
+        (1, 3, 4, 5, 6)
+        >>> lookup.get_best_positions(card_indices[:4], 5) is None
+        True
+
+        :param card_indices: The indices of the cards.
+        :param card_count: The number of cards that form a hand.
+        :param low: ``True`` if weaker entries are stronger hands,
+                    otherwise ``False``. Defaults to ``False``.
+        :return: The sorted positions of the selected cards in
+                 ``card_indices`` or ``None`` if no valid hand can be
+                 formed.
+        """
+        count = len(card_indices)
+
+        if count < card_count:
+            return None
+        elif count == card_count:
+            if self._get_key_or_none(card_indices) in self.__entries:
+                return tuple(range(count))
+
+            return None
+        elif (
+                count > card_count + self.__max_selection_margin
+                or not self.__get_selection_status(card_count, low)
+        ):
+            return self.__scan(card_indices, card_count, low)
+
+        multipliers = self.__card_multipliers
+        suits = self.__card_suits
+        hash_ = 1
+        suit_hashes = dict[int, int]()
+        suit_counts = dict[int, int]()
+
+        for index in card_indices:
+            multiplier = multipliers[index]
+            suit = suits[index]
+            hash_ *= multiplier
+            suit_hashes[suit] = suit_hashes.get(suit, 1) * multiplier
+            suit_counts[suit] = suit_counts.get(suit, 0) + 1
+
+        if not hash_:
+            return self.__scan(card_indices, card_count, low)
+
+        best_hash = self.__get_selection_level(
+            card_count,
+            low,
+            False,
+            count - card_count,
+        ).get(hash_)
+        best_suit = None
+        best_index = None
+
+        if best_hash is not None:
+            best_index = self.__entries[best_hash << 1].index
+
+        for suit, suit_count in suit_counts.items():
+            if suit_count < card_count:
+                continue
+
+            suited_hash = self.__get_selection_level(
+                card_count,
+                low,
+                True,
+                suit_count - card_count,
+            ).get(suit_hashes[suit])
+
+            if suited_hash is None:
+                continue
+
+            index = self.__entries[suited_hash << 1 | True].index
+
+            if best_index is None or (
+                    index < best_index if low else index > best_index
+            ):
+                best_hash = suited_hash
+                best_suit = suit
+                best_index = index
+
+        if best_hash is None:
+            return None
+
+        positions = []
+
+        for i, index in enumerate(card_indices):
+            multiplier = multipliers[index]
+
+            if (
+                    not best_hash % multiplier
+                    and (best_suit is None or suits[index] == best_suit)
+            ):
+                best_hash //= multiplier
+
+                positions.append(i)
+
+        assert len(positions) == card_count
+
+        return tuple(positions)
+
+    def get_best_hole_board_positions(
+            self,
+            hole_card_indices: Sequence[int],
+            board_card_indices: Sequence[int],
+            hole_card_count: int,
+            board_card_count: int,
+            low: bool = False,
+    ) -> tuple[tuple[int, ...], tuple[int, ...]] | None:
+        """Return the positions of the hole and board cards that form
+        the strongest hand when exactly the given numbers of hole and
+        board cards must be used (e.g., as in Omaha hold'em).
+
+        The rank products and suits of each combination of hole cards
+        and each combination of board cards are computed once. Each
+        pair of combinations is then looked up with a single
+        multiplication. If several pairs form equally strong hands, the
+        first pair (with the hole combinations in the outer loop) is
+        chosen.
+
+        >>> lookup = StandardLookup()
+        >>> hole_cards = tuple(Card.parse('6c7c8sAh'))
+        >>> board_cards = tuple(Card.parse('As9cTc2sKs'))
+        >>> lookup.get_best_hole_board_positions(
+        ...     [card.index for card in hole_cards],
+        ...     [card.index for card in board_cards],
+        ...     2,
+        ...     3,
+        ... )
+        ((2, 3), (0, 2, 4))
+        >>> lookup.get_best_hole_board_positions(
+        ...     [card.index for card in hole_cards],
+        ...     [card.index for card in board_cards[:2]],
+        ...     2,
+        ...     3,
+        ... ) is None
+        True
+
+        :param hole_card_indices: The indices of the hole cards.
+        :param board_card_indices: The indices of the board cards.
+        :param hole_card_count: The number of hole cards to use.
+        :param board_card_count: The number of board cards to use.
+        :param low: ``True`` if weaker entries are stronger hands,
+                    otherwise ``False``. Defaults to ``False``.
+        :return: The sorted positions of the selected hole cards and
+                 board cards or ``None`` if no valid hand can be formed.
+        """
+        hole_signatures = self.__get_signatures(
+            hole_card_indices,
+            hole_card_count,
+        )
+        board_signatures = self.__get_signatures(
+            board_card_indices,
+            board_card_count,
+        )
+        entries = self.__entries
+        best_positions = None
+        best_index = None
+
+        for hole_hash, hole_mask, hole_positions in hole_signatures:
+            for board_hash, board_mask, board_positions in board_signatures:
+                mask = hole_mask | board_mask
+                entry = entries.get(
+                    hole_hash * board_hash << 1 | (not mask & (mask - 1)),
+                )
+
+                if entry is not None and (
+                        best_index is None
+                        or (
+                            entry.index < best_index
+                            if low
+                            else entry.index > best_index
+                        )
+                ):
+                    best_positions = hole_positions, board_positions
+                    best_index = entry.index
+
+        return best_positions
+
+    def get_cumulative_counts(
+            self,
+            card_count: int | None = None,
+            low: bool = False,
+            ranks: RankOrder | None = None,
+    ) -> Sequence[int]:
+        """Return the cumulative frequencies of the entry indices.
+
+        The ``i``-th element is the number of card combinations whose
+        hands have entry indices of at most ``i``. The cards are drawn
+        from a deck with the given ranks (by default, those of
+        :attr:`rank_order`) in each of the four suits.
+
+        If ``card_count`` is ``None``, each combination is a hand on its
+        own. Otherwise, the combinations consist of ``card_count``
+        cards, each of which is represented by its strongest hand (as
+        in :meth:`get_best_positions`). The frequencies are counted per
+        rank multiset, without enumerating the combinations, and the
+        combinations that form no valid hand are not counted.
+
+        The tables are built once and are persisted like the lookup
+        tables (see :attr:`cache_directory`).
+
+        >>> lookup = StandardLookup()
+        >>> cumulative_counts = lookup.get_cumulative_counts()
+        >>> cumulative_counts[-1]
+        2598960
+        >>> cumulative_counts[0]
+        1020
+        >>> cumulative_counts = lookup.get_cumulative_counts(7)
+        >>> cumulative_counts[-1]
+        133784560
+        >>> cumulative_counts[-1] - cumulative_counts[-2]
+        4324
+
+        The ranks of the deck may differ from those of the hands.
+
+        >>> lookup = EightOrBetterLookup()
+        >>> cumulative_counts = lookup.get_cumulative_counts(
+        ...     7,
+        ...     True,
+        ...     RankOrder.STANDARD,
+        ... )
+        >>> cumulative_counts[-1]
+        24530944
+
+        :param card_count: The optional number of cards from which the
+                           hands are formed.
+        :param low: ``True`` if weaker entries are stronger hands,
+                    otherwise ``False``. Only relevant if
+                    ``card_count`` is given. Defaults to ``False``.
+        :param ranks: The optional ranks of the deck. Defaults to
+                      :attr:`rank_order`.
+        :return: The cumulative frequencies indexed by entry indices.
+        :raises ValueError: If the hands cannot be counted for the
+                            number of cards.
+        """
+        if card_count is None:
+            low = False
+
+        if ranks is None:
+            ranks = self.rank_order
+
+        return self.__load_cumulative_counts(card_count, low, ranks)
+
+    def get_stronger_hand_count(
+            self,
+            index: int,
+            card_count: int | None = None,
+            low: bool = False,
+            ranks: RankOrder | None = None,
+    ) -> int:
+        """Return the number of card combinations whose hands are
+        stronger than the hand of the given entry index.
+
+        See :meth:`get_cumulative_counts` for how the combinations are
+        counted.
+
+        >>> lookup = StandardLookup()
+        >>> index = lookup.get_entry('AsKsQsJsTs').index
+        >>> lookup.get_stronger_hand_count(index)
+        0
+        >>> lookup.get_stronger_hand_count(index, low=True)
+        2598956
+        >>> index = lookup.get_entry('AcAdAhAsKs').index
+        >>> lookup.get_stronger_hand_count(index)
+        40
+        >>> lookup.get_stronger_hand_count(index, 7)
+        41584
+
+        :param index: The entry index.
+        :param card_count: The optional number of cards from which the
+                           hands are formed.
+        :param low: ``True`` if weaker entries are stronger hands,
+                    otherwise ``False``. Defaults to ``False``.
+        :param ranks: The optional ranks of the deck. Defaults to
+                      :attr:`rank_order`.
+        :return: The number of stronger hands.
+        :raises ValueError: If the hands cannot be counted for the
+                            number of cards.
+        """
+        cumulative_counts = self.get_cumulative_counts(
+            card_count,
+            low,
+            ranks,
+        )
+
+        if low:
+            count = cumulative_counts[index - 1] if index else 0
+        else:
+            count = cumulative_counts[-1] - cumulative_counts[index]
+
+        return count
+
+    def get_percentile(
+            self,
+            index: int,
+            card_count: int | None = None,
+            low: bool = False,
+            ranks: RankOrder | None = None,
+    ) -> float:
+        """Return the fraction of card combinations whose hands are not
+        stronger than the hand of the given entry index.
+
+        See :meth:`get_cumulative_counts` for how the combinations are
+        counted.
+
+        >>> lookup = StandardLookup()
+        >>> index = lookup.get_entry('AsKsQsJsTs').index
+        >>> lookup.get_percentile(index)
+        1.0
+        >>> index = lookup.get_entry('7c5d4h3s2c').index
+        >>> round(lookup.get_percentile(index), 6)
+        0.000392
+        >>> round(lookup.get_percentile(index, low=True), 6)
+        1.0
+        >>> index = lookup.get_entry('AcAdKhKsQs').index
+        >>> round(lookup.get_percentile(index, 7), 3)
+        0.847
+
+        :param index: The entry index.
+        :param card_count: The optional number of cards from which the
+                           hands are formed.
+        :param low: ``True`` if weaker entries are stronger hands,
+                    otherwise ``False``. Defaults to ``False``.
+        :param ranks: The optional ranks of the deck. Defaults to
+                      :attr:`rank_order`.
+        :return: The percentile of the hand (between ``0`` and ``1``).
+        :raises ValueError: If the hands cannot be counted for the
+                            number of cards.
+        """
+        cumulative_counts = self.get_cumulative_counts(
+            card_count,
+            low,
+            ranks,
+        )
+        count = self.get_stronger_hand_count(index, card_count, low, ranks)
+
+        return 1 - count / cumulative_counts[-1]
+
+    def __dump_cumulative_counts(
+            self,
+            card_count: int | None,
+            low: bool,
+            ranks: RankOrder,
+    ) -> dict[int, int]:
+        counts = self.__count_hands(card_count, low, ranks)
+        cumulative_counts = {}
+        cumulative_count = 0
+
+        for index in range(max(counts) + 1):
+            cumulative_count += counts.get(index, 0)
+            cumulative_counts[index] = cumulative_count
+
+        return cumulative_counts
+
+    def __count_hands(
+            self,
+            card_count: int | None,
+            low: bool,
+            ranks: RankOrder,
+    ) -> dict[int, int]:
+        counts = dict.fromkeys(
+            map(attrgetter('index'), self.__entries.values()),
+            0,
+        )
+
+        if card_count is None:
+            excluded_multipliers = [
+                self.__multipliers[rank]
+                for rank in RankOrder.STANDARD
+                if rank not in ranks
+            ]
+
+            for key, entry in self.__entries.items():
+                if any(
+                        not (key >> 1) % multiplier
+                        for multiplier in excluded_multipliers
+                ):
+                    continue
+
+                counts[entry.index] += self._count_combinations(
+                    self.__get_multiplicities(key >> 1),
+                    bool(key & 1),
+                )
+
+            return counts
+
+        hand_card_counts = {
+            sum(self.__get_multiplicities(key >> 1)) for key in self.__entries
+        }
+
+        if len(hand_card_counts) != 1:
+            raise ValueError(
+                (
+                    'The hands of the lookup must consist of a fixed number'
+                    ' of cards to be counted for a number of cards.'
+                ),
+            )
+
+        hand_card_count, = hand_card_counts
+        margin = card_count - hand_card_count
+
+        if margin == 0:
+            return self.__count_hands(None, low, ranks)
+        elif (
+                margin < 0
+                or margin > self.__max_selection_margin
+                or card_count >= 2 * hand_card_count
+                or not self.__get_selection_status(hand_card_count, low)
+        ):
+            raise ValueError(
+                (
+                    f'The hands cannot be counted for {card_count} cards'
+                    f' with {type(self).__qualname__}.'
+                ),
+            )
+
+        unsuited_level = self.__get_selection_level(
+            hand_card_count,
+            low,
+            False,
+            margin,
+        )
+        suited_levels = [
+            self.__get_selection_level(hand_card_count, low, True, i)
+            for i in range(margin + 1)
+        ]
+        multisets: list[tuple[tuple[int, int], ...]] = [()]
+
+        for rank in ranks:
+            multiplier = self.__multipliers[rank]
+            next_multisets = []
+
+            for multiset in multisets:
+                size = sum(multiplicity for _, multiplicity in multiset)
+
+                next_multisets.append(multiset)
+
+                for multiplicity in range(
+                        1,
+                        min(self.__suit_count, card_count - size) + 1,
+                ):
+                    next_multisets.append(
+                        multiset + ((multiplier, multiplicity),),
+                    )
+
+            multisets = next_multisets
+
+        for multiset in multisets:
+            if sum(multiplicity for _, multiplicity in multiset) != card_count:
+                continue
+
+            total_count = prod(
+                comb(self.__suit_count, multiplicity)
+                for _, multiplicity in multiset
+            )
+            best_hash = unsuited_level.get(
+                prod(
+                    multiplier ** multiplicity
+                    for multiplier, multiplicity in multiset
+                ),
+            )
+
+            if best_hash is None:
+                unsuited_index = None
+            else:
+                unsuited_index = self.__entries[best_hash << 1].index
+
+            for suited_card_count in range(
+                    hand_card_count,
+                    min(len(multiset), card_count) + 1,
+            ):
+                for suited_multipliers in combinations(
+                        (multiplier for multiplier, _ in multiset),
+                        suited_card_count,
+                ):
+                    count = self.__suit_count * prod(
+                        comb(
+                            self.__suit_count - 1,
+                            multiplicity - (multiplier in suited_multipliers),
+                        ) for multiplier, multiplicity in multiset
+                    )
+
+                    if not count:
+                        continue
+
+                    total_count -= count
+                    suited_hash = suited_levels[
+                        suited_card_count - hand_card_count
+                    ].get(prod(suited_multipliers))
+                    index = unsuited_index
+
+                    if suited_hash is not None:
+                        suited_index = self.__entries[
+                            suited_hash << 1 | True
+                        ].index
+
+                        if index is None or (
+                                suited_index < index
+                                if low
+                                else suited_index > index
+                        ):
+                            index = suited_index
+
+                    if index is not None:
+                        counts[index] += count
+
+            if unsuited_index is not None:
+                counts[unsuited_index] += total_count
+
+        return counts
+
+    def __get_signatures(
+            self,
+            card_indices: Sequence[int],
+            card_count: int,
+    ) -> list[tuple[int, int, tuple[int, ...]]]:
+        multipliers = self.__card_multipliers
+        suits = self.__card_suits
+        signatures = []
+
+        for positions in combinations(range(len(card_indices)), card_count):
+            hash_ = 1
+            mask = 0
+
+            for position in positions:
+                index = card_indices[position]
+                hash_ *= multipliers[index]
+                mask |= suits[index]
+
+            signatures.append((hash_, mask, positions))
+
+        return signatures
+
+    def __scan(
+            self,
+            card_indices: Sequence[int],
+            card_count: int,
+            low: bool,
+    ) -> tuple[int, ...] | None:
+        best_positions = None
+        best_index = None
+
+        for positions in combinations(range(len(card_indices)), card_count):
+            key = self._get_key_or_none(
+                tuple(map(card_indices.__getitem__, positions)),
+            )
+
+            if key is None:
+                continue
+
+            entry = self.__entries.get(key)
+
+            if entry is not None and (
+                    best_index is None
+                    or (
+                        entry.index < best_index
+                        if low
+                        else entry.index > best_index
+                    )
+            ):
+                best_positions = positions
+                best_index = entry.index
+
+        return best_positions
+
+    def __get_selection_status(self, card_count: int, low: bool) -> bool:
+        key = card_count, low
+
+        if key not in self.__selection_statuses:
+            status = True
+
+            for hash_ in self.__get_selection_level(card_count, low, False, 0):
+                multiplicities = self.__get_multiplicities(hash_)
+
+                if max(multiplicities) > 1:
+                    continue
+
+                index = self.__entries[hash_ << 1].index
+                suited_entry = self.__entries.get(hash_ << 1 | True)
+
+                if suited_entry is None or (
+                        suited_entry.index > index
+                        if low
+                        else suited_entry.index < index
+                ):
+                    status = False
+
+                    break
+
+            self.__selection_statuses[key] = status
+
+        return self.__selection_statuses[key]
+
+    def __get_selection_level(
+            self,
+            card_count: int,
+            low: bool,
+            suitedness: bool,
+            margin: int,
+    ) -> dict[int, int]:
+        key = card_count, low, suitedness
+
+        if key not in self.__selection_levels:
+            level = dict[int, int]()
+
+            for entry_key in self.__entries:
+                hash_ = entry_key >> 1
+
+                if (
+                        entry_key & 1 == suitedness
+                        and sum(self.__get_multiplicities(hash_)) == card_count
+                ):
+                    level[hash_] = hash_
+
+            self.__selection_levels[key] = [level]
+
+        levels = self.__selection_levels[key]
+
+        while len(levels) <= margin:
+            keys, values = self.__load_table(
+                (
+                    f'selection-{card_count}-{low:d}-{suitedness:d}'
+                    f'-{len(levels)}'
+                ),
+                partial(
+                    self.__extend_selection_level,
+                    levels[-1],
+                    low,
+                    suitedness,
+                ),
+            )
+
+            levels.append(dict(zip(keys, values)))
+
+        return levels[margin]
+
+    def __extend_selection_level(
+            self,
+            previous_level: dict[int, int],
+            low: bool,
+            suitedness: bool,
+    ) -> dict[int, int]:
+        level = dict[int, int]()
+        indices = dict[int, int]()
+
+        for hash_, best_hash in previous_level.items():
+            index = indices.get(best_hash)
+
+            if index is None:
+                index = self.__entries[best_hash << 1 | suitedness].index
+                indices[best_hash] = index
+
+            for prime in self.__primes:
+                if suitedness and not hash_ % prime:
+                    continue
+
+                next_hash = hash_ * prime
+                next_best_hash = level.get(next_hash)
+
+                if next_best_hash is None or (
+                        index < indices[next_best_hash]
+                        if low
+                        else index > indices[next_best_hash]
+                ):
+                    level[next_hash] = best_hash
+
+        return level
+
+    @classmethod
+    def __get_multiplicities(cls, hash_: int) -> list[int]:
+        multiplicities = []
+
+        for prime in cls.__primes:
+            multiplicity = 0
+
+            while hash_ and not hash_ % prime:
+                hash_ //= prime
+                multiplicity += 1
+
+            if multiplicity:
+                multiplicities.append(multiplicity)
+
+        return multiplicities
+
+    @staticmethod
+    def __get_card_indices(cards: CardsLike) -> tuple[int, ...]:
+        return tuple(card.index for card in Card.clean(cards))
+
+    def _get_suit_mask(self, card_indices: Iterable[int]) -> int:
+        mask = 0
+
+        for index in card_indices:
+            mask |= self.__card_suits[index]
+
+        return mask
+
+    def _get_key(self, card_indices: Sequence[int]) -> int:
+        hash_ = 1
+        mask = 0
+
+        for index in card_indices:
+            hash_ *= self.__card_multipliers[index]
+            mask |= self.__card_suits[index]
+
+        return hash_ << 1 | (not mask & (mask - 1))
+
+    def _get_key_or_none(self, card_indices: Sequence[int]) -> int | None:
+        return self._get_key(card_indices)
+
+    def _get_suits(
+            self,
+            card_indices: npt.NDArray[np.integer[Any]],
+    ) -> npt.NDArray[np.uint64]:
+        import numpy as np
+
+        _, suits = self.__load_card_arrays()
+
+        return np.take(suits, card_indices)
+
+    def _get_keys(
+            self,
+            card_indices: npt.NDArray[np.integer[Any]],
+    ) -> npt.NDArray[np.uint64]:
+        import numpy as np
+
+        multipliers, _ = self.__load_card_arrays()
+        hashes = np.prod(
+            np.take(multipliers, card_indices),
+            axis=1,
+            dtype=np.uint64,
+        )
+        masks = np.bitwise_or.reduce(self._get_suits(card_indices), axis=1)
+        suitednesses = (masks & (masks - np.uint64(1))) == 0
+        keys: npt.NDArray[np.uint64] = (
+            hashes << np.uint64(1) | suitednesses.astype(np.uint64)
+        )
+
+        return keys
+
+    def _count_combinations(
+            self,
+            multiplicities: Sequence[int],
+            suitedness: bool,
+    ) -> int:
+        suit_count = self.__suit_count
+        suited_count = suit_count if max(multiplicities) == 1 else 0
+
+        if suitedness:
+            return suited_count
+
+        return prod(
+            comb(suit_count, multiplicity) for multiplicity in multiplicities
+        ) - suited_count
 
     def _add_multisets(
             self,
@@ -290,7 +1455,7 @@ class Lookup(ABC):
         self.__entry_count += 1
 
         for suitedness in suitednesses:
-            self.__entries[hash_, suitedness] = entry
+            self.__added_entries[hash_ << 1 | suitedness] = entry
 
 
 @dataclass
@@ -464,23 +1629,158 @@ class BadugiLookup(Lookup):
     """
 
     rank_order = RankOrder.REGULAR
+    __max_card_count = 4
+    __suit_count = len(tuple(Suit)) - 1  # except unknown
+
+    @classmethod
+    @cache
+    def __get_card_masks(cls) -> tuple[tuple[int, int], ...]:
+        suits = tuple(Suit)
+        card_masks = []
+
+        for card in sorted(
+                starmap(Card, product(Rank, Suit)),
+                key=attrgetter('index'),
+        ):
+            if card.rank in cls.rank_order:
+                rank_mask = 1 << cls.rank_order.index(card.rank)
+            else:
+                rank_mask = 0
+
+            card_masks.append((rank_mask, 1 << suits.index(card.suit)))
+
+        return tuple(card_masks)
+
+    def get_best_rainbow_positions(
+            self,
+            card_indices: Sequence[int],
+    ) -> tuple[int, ...] | None:
+        """Return the positions of the cards that form the strongest
+        badugi hand.
+
+        Badugi hands consist of up to four cards of distinct ranks and
+        suits, and a hand with more cards is stronger than any hand
+        with fewer cards. The combinations are checked with rank and
+        suit bitmasks, from the largest to the smallest, without
+        creating or looking up any invalid hands. Among the hands with
+        the most cards, the one whose highest rank (and then the next
+        highest rank, and so on) is the lowest is chosen. If several
+        combinations form equally strong hands, the first combination
+        (in the order produced by ``itertools.combinations``) is chosen.
+
+        >>> lookup = BadugiLookup()
+        >>> cards = tuple(Card.parse('2s3s4d7h'))
+        >>> lookup.get_best_rainbow_positions([card.index for card in cards])
+        (0, 2, 3)
+        >>> cards = tuple(Card.parse('KcKdKhKs'))
+        >>> lookup.get_best_rainbow_positions([card.index for card in cards])
+        (0,)
+        >>> lookup.get_best_rainbow_positions(()) is None
+        True
+
+        :param card_indices: The indices of the cards.
+        :return: The sorted positions of the selected cards in
+                 ``card_indices`` or ``None`` if no valid hand can be
+                 formed.
+        """
+        card_masks = self.__get_card_masks()
+        rank_masks = []
+        suit_masks = []
+        total_rank_mask = 0
+        total_suit_mask = 0
+
+        for index in card_indices:
+            rank_mask, suit_mask = card_masks[index]
+            total_rank_mask |= rank_mask
+            total_suit_mask |= suit_mask
+
+            rank_masks.append(rank_mask)
+            suit_masks.append(suit_mask)
+
+        max_count = min(
+            self.__max_card_count,
+            total_rank_mask.bit_count(),
+            total_suit_mask.bit_count(),
+        )
+
+        for count in range(max_count, 0, -1):
+            best_positions = None
+            best_rank_mask = None
+
+            for positions in combinations(range(len(rank_masks)), count):
+                rank_mask = 0
+                suit_mask = 0
+
+                for position in positions:
+                    rank_mask |= rank_masks[position]
+                    suit_mask |= suit_masks[position]
+
+                if (
+                        rank_mask.bit_count() == suit_mask.bit_count() == count
+                        and (
+                            best_rank_mask is None
+                            or rank_mask < best_rank_mask
+                        )
+                ):
+                    best_positions = positions
+                    best_rank_mask = rank_mask
+
+            if best_positions is not None:
+                return best_positions
+
+        return None
 
     def _add_entries(self) -> None:
-        for i in range(4, 0, -1):
+        for i in range(self.__max_card_count, 0, -1):
             self._add_multisets(Counter({1: i}), (i == 1,), Label.HIGH_CARD)
 
-    def _get_key(self, cards: CardsLike) -> tuple[int, bool]:
-        cards = Card.clean(cards)
+    def _get_key(self, card_indices: Sequence[int]) -> int:
+        key = self._get_key_or_none(card_indices)
 
-        if not Card.are_rainbow(cards):
+        if key is None:
             raise ValueError(
                 (
                     'Badugi hands must be rainbow (i.e., of distinct suits)'
-                    f' but the cards {repr(cards)} are not.'
+                    f' but the cards {repr(card_indices)} are not.'
                 ),
             )
 
-        return super()._get_key(cards)
+        return key
+
+    def _get_key_or_none(self, card_indices: Sequence[int]) -> int | None:
+        mask = self._get_suit_mask(card_indices)
+
+        if mask.bit_count() != len(card_indices):
+            return None
+
+        return super()._get_key(card_indices)
+
+    def _get_keys(
+            self,
+            card_indices: npt.NDArray[np.integer[Any]],
+    ) -> npt.NDArray[np.uint64]:
+        import numpy as np
+
+        suits = self._get_suits(card_indices)
+        rainbows = (
+            suits.sum(axis=1, dtype=np.uint64)
+            == np.bitwise_or.reduce(suits, axis=1)
+        )
+
+        return np.where(rainbows, super()._get_keys(card_indices), 0)
+
+    def _count_combinations(
+            self,
+            multiplicities: Sequence[int],
+            suitedness: bool,
+    ) -> int:
+        if (
+                max(multiplicities) != 1
+                or suitedness != (len(multiplicities) == 1)
+        ):
+            return 0
+
+        return perm(self.__suit_count, len(multiplicities))
 
 
 @dataclass
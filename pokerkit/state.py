@@ -10,7 +10,7 @@ from enum import StrEnum, unique
 from functools import partial
 from itertools import chain, filterfalse, islice, starmap
 from operator import getitem, gt, sub
-from random import shuffle
+from random import Random, shuffle
 from warnings import warn
 
 from pokerkit.hands import Hand
@@ -891,6 +891,8 @@ class State:
                    to :attr:`pokerkit.state.State.divmod`.
     :param rake: The rake function. For more details, please refer to
                  :attr:`pokerkit.state.State.rake`.
+    :param rng: The random number generator. For more details, please
+                refer to :attr:`pokerkit.state.State.rng`.
     :raises ValueError: If the arguments are invalid.
     """
 
@@ -1040,6 +1042,14 @@ class State:
     raked. Its return value should be a tuple consisting of two values:
     the raked amount and the remaining, unraked amount.
     """
+    rng: Random | None = field(default=None, compare=False)
+    """The random number generator. Defaults to ``None`` which is the
+    global one of the :mod:`random` module.
+
+    It is used to shuffle the deck and the reserved (mucked, etc.)
+    cards. Supplying a seeded generator (e.g., ``Random(0)``) makes the
+    dealt cards reproducible.
+    """
     antes: tuple[int, ...] = field(init=False)
     """The antes.
 
@@ -1238,7 +1248,10 @@ class State:
     def _setup(self) -> None:
         self.deck_cards.extend(self.deck)
 
-        shuffle(self.deck_cards)
+        if self.rng is None:
+            shuffle(self.deck_cards)
+        else:
+            self.rng.shuffle(self.deck_cards)
 
         for i in self.player_indices:
             self.statuses.append(True)
@@ -1976,15 +1989,10 @@ class State:
         if not self.statuses[player_index]:
             return None
 
-        try:
-            hand = self.hand_types[hand_type_index].from_game(
-                filter(None, self.hole_cards[player_index]),
-                self.get_board_cards(board_index),
-            )
-        except (KeyError, ValueError):
-            hand = None
-
-        return hand
+        return self.hand_types[hand_type_index].from_game_or_none(
+            filter(None, self.hole_cards[player_index]),
+            self.get_board_cards(board_index),
+        )
 
     def get_up_hand(
             self,
@@ -2098,15 +2106,10 @@ class State:
         if not self.statuses[player_index]:
             return None
 
-        try:
-            hand = self.hand_types[hand_type_index].from_game(
-                self.get_up_cards(player_index),
-                self.get_board_cards(board_index),
-            )
-        except ValueError:
-            hand = None
-
-        return hand
+        return self.hand_types[hand_type_index].from_game_or_none(
+            self.get_up_cards(player_index),
+            self.get_board_cards(board_index),
+        )
 
     def get_up_hands(
             self,
@@ -2404,7 +2407,7 @@ class State:
             if warning_status:
                 warn('Returning reserved (mucked, etc.) cards as dealable.')
 
-            cards += tuple(shuffled(self.reserved_cards))
+            cards += tuple(shuffled(self.reserved_cards, self.rng))
 
         yield from cards
 
@@ -2453,7 +2456,7 @@ class State:
 
     def _consume_cards(self, cards: tuple[Card, ...]) -> None:
         if set(cards) > set(self.deck_cards):
-            self._produce_cards(shuffled(self.reserved_cards))
+            self._produce_cards(shuffled(self.reserved_cards, self.rng))
 
             self.mucked_cards.clear()
             self.burn_cards.clear()
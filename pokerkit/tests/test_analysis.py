@@ -2,12 +2,43 @@
 analysis related tools on PokerKit.
 """
 
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from random import Random
+from statistics import mean, stdev
+from itertools import combinations, permutations
+from operator import attrgetter
+from os import path
+from tempfile import TemporaryDirectory
 from unittest import TestCase, main
 
-from pokerkit.analysis import calculate_equities, parse_range
-from pokerkit.hands import StandardHighHand
-from pokerkit.utilities import Card, Deck
+from pokerkit import analysis
+from pokerkit.analysis import (
+    ActionStatistics,
+    calculate_equities,
+    calculate_equity_matrix,
+    calculate_finish_probabilities,
+    calculate_hand_potential,
+    calculate_hand_potentials,
+    calculate_hand_strength,
+    calculate_icm,
+    calculate_icms,
+    compile_range,
+    CompiledRange,
+    EquityCache,
+    EquityMatrix,
+    EquityResult,
+    estimate_equities,
+    HandHistoryStatistics,
+    ICMModel,
+    parse_range,
+    parse_weighted_range,
+    PushFold,
+    Statistics,
+    WeightedRange,
+)
+from pokerkit.hands import EightOrBetterLowHand, Hand, StandardHighHand
+from pokerkit.notation import HandHistory
+from pokerkit.utilities import Card, Deck, filter_none, RankOrder
 
 
 class HandHistoryTestCase(TestCase):
@@ -491,6 +522,1712 @@ class HandHistoryTestCase(TestCase):
             self.assertAlmostEqual(equities[0], 0.5)
             self.assertAlmostEqual(equities[1], 0.5)
 
+    def test_calculate_equities_in_blocks(self) -> None:
+        with ProcessPoolExecutor() as executor:
+            for block_size in (None, 1, 7, 1000):
+                equities = calculate_equities(
+                    (parse_range('2h2c'), parse_range('AsKs')),
+                    Card.parse('QsJsTs'),
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    sample_count=100,
+                    executor=executor,
+                    block_size=block_size,
+                )
+
+                self.assertEqual(equities, [0.0, 1.0])
+
+                equities = calculate_equities(
+                    (parse_range('AK'), parse_range('QQ')),
+                    Card.parse('Ts8s2c'),
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    sample_count=1000,
+                    executor=executor,
+                    block_size=block_size,
+                )
+
+                self.assertAlmostEqual(sum(equities), 1)
+                self.assertAlmostEqual(equities[0], 0.275, delta=0.07)
+
+    def test_calculate_equities_with_rng(self) -> None:
+        args = (
+            (parse_range('AK'), parse_range('QQ', 'JJ')),
+            tuple(Card.parse('Ts8s2c')),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+        equities = calculate_equities(
+            *args,
+            sample_count=500,
+            block_size=50,
+            rng=Random(0),
+        )
+
+        with ProcessPoolExecutor() as executor:
+            self.assertEqual(
+                calculate_equities(
+                    *args,
+                    sample_count=500,
+                    executor=executor,
+                    block_size=50,
+                    rng=Random(0),
+                ),
+                equities,
+            )
+
+        self.assertNotEqual(
+            calculate_equities(
+                *args,
+                sample_count=500,
+                block_size=50,
+                rng=Random(1),
+            ),
+            equities,
+        )
+        self.assertEqual(
+            calculate_hand_strength(
+                3,
+                parse_range('AK'),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                sample_count=500,
+                rng=Random(0),
+            ),
+            calculate_hand_strength(
+                3,
+                parse_range('AK'),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                sample_count=500,
+                rng=Random(0),
+            ),
+        )
+
+    def test_estimate_equities(self) -> None:
+        args = (
+            (parse_range('AK'), parse_range('QQ')),
+            tuple(Card.parse('Ts8s2c')),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+
+        for standard_error in (0.02, 0.01):
+            equities, standard_errors = estimate_equities(
+                *args,
+                rng=Random(0),
+                standard_error=standard_error,
+                time_limit=60,
+            )
+
+            self.assertAlmostEqual(sum(equities), 1)
+            self.assertLessEqual(max(standard_errors), standard_error)
+            self.assertAlmostEqual(
+                equities[0],
+                0.2746,
+                delta=4 * standard_error,
+            )
+
+        equities, standard_errors = estimate_equities(
+            *args,
+            sample_count=300,
+            block_size=100,
+            rng=Random(0),
+            standard_error=0,
+        )
+
+        self.assertAlmostEqual(
+            standard_errors[0],
+            (equities[0] * (1 - equities[0]) / 299) ** 0.5,
+            delta=0.005,
+        )
+        self.assertEqual(
+            calculate_equities(
+                *args,
+                sample_count=300,
+                block_size=100,
+                rng=Random(0),
+                standard_error=0,
+            ),
+            equities,
+        )
+
+        self.assertRaises(
+            ValueError,
+            estimate_equities,
+            *args,
+            standard_error=0,
+        )
+        self.assertRaises(
+            ValueError,
+            calculate_equities,
+            *args,
+            standard_error=0.01,
+        )
+
+        equities, standard_errors = estimate_equities(
+            *args,
+            time_limit=0,
+        )
+
+        self.assertAlmostEqual(sum(equities), 1)
+        self.assertGreater(min(standard_errors), 0)
+        self.assertEqual(
+            estimate_equities(
+                (parse_range('AsKs'), parse_range('QhQd')),
+                Card.parse('Ts8s2c3d'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                exhaustive=True,
+            )[1],
+            [0.0, 0.0],
+        )
+        self.assertRaises(ValueError, estimate_equities, *args)
+
+    def test_calculate_equities_exhaustively(self) -> None:
+        hole_cards = tuple(Card.parse('AsKs')), tuple(Card.parse('QhQd'))
+        board_cards = tuple(Card.parse('Ts8s2c3d'))
+        expected_equities = [0.0, 0.0]
+        river_cards = [
+            card for card in Deck.STANDARD
+            if card not in (*hole_cards[0], *hole_cards[1], *board_cards)
+        ]
+
+        for card in river_cards:
+            hands = [
+                StandardHighHand.from_game(cards, (*board_cards, card))
+                for cards in hole_cards
+            ]
+
+            if hands[0] == hands[1]:
+                expected_equities[0] += 0.5 / len(river_cards)
+                expected_equities[1] += 0.5 / len(river_cards)
+            else:
+                expected_equities[hands[1] > hands[0]] += 1 / len(river_cards)
+
+        equities = calculate_equities(
+            ({hole_cards[0]}, {hole_cards[1]}),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+
+        for equity, expected_equity in zip(equities, expected_equities):
+            self.assertAlmostEqual(equity, expected_equity)
+
+        self.assertEqual(
+            calculate_equities(
+                ({hole_cards[0]}, {hole_cards[1]}),
+                board_cards,
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                sample_count=1,
+                exhaustive_deal_count=44,
+            ),
+            equities,
+        )
+
+        equities = calculate_equities(
+            (parse_range('AK'), parse_range('QQ')),
+            Card.parse('Ts8s2c'),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+
+        self.assertAlmostEqual(sum(equities), 1)
+        self.assertAlmostEqual(equities[0], 0.27462, places=5)
+
+        equities = calculate_equities(
+            ([()], parse_range('AsKs')),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+
+        self.assertAlmostEqual(sum(equities), 1)
+        self.assertAlmostEqual(equities[1], 0.58760, places=5)
+        self.assertRaises(
+            ValueError,
+            calculate_equities,
+            (parse_range('AK'), parse_range('QQ')),
+            (),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+
+    def test_calculate_equities_with_conflicting_ranges(self) -> None:
+        hole_range = parse_range(
+            '22+ A2+ K2+ Q2+ J2+ T2+ 92+ 82+ 72+ 62+ 52+ 42+ 32',
+        )
+
+        self.assertEqual(len(hole_range), 1326)
+
+        equities = calculate_equities(
+            (hole_range, hole_range, hole_range),
+            (),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            sample_count=1000,
+        )
+
+        self.assertAlmostEqual(sum(equities), 1)
+
+        for equity in equities:
+            self.assertAlmostEqual(equity, 1 / 3, delta=0.07)
+
+        hole_ranges = (
+            parse_range('AK'),
+            parse_range('AA', 'KK'),
+            parse_range('AQs', 'Kc2c'),
+        )
+        board_cards = tuple(Card.parse('2c3d7h9s'))
+        expected_equities = calculate_equities(
+            hole_ranges,
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+        equities = calculate_equities(
+            hole_ranges,
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            sample_count=10000,
+            rng=Random(0),
+        )
+
+        for equity, expected_equity in zip(equities, expected_equities):
+            self.assertAlmostEqual(equity, expected_equity, delta=0.02)
+
+        self.assertRaises(
+            ValueError,
+            calculate_equities,
+            (parse_range('AA'), parse_range('AA'), parse_range('AA')),
+            (),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            sample_count=1,
+        )
+        self.assertRaises(
+            ValueError,
+            calculate_equities,
+            (parse_range('AsKs'), parse_range('QQ')),
+            Card.parse('AsKd2c'),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+
+    def test_parse_weighted_range(self) -> None:
+        weighted_range = parse_weighted_range('AKs:0.5, QQ+:1.0, 76s:0.25')
+
+        self.assertEqual(len(weighted_range.weights), 1326)
+        self.assertEqual(
+            set(weighted_range),
+            parse_range('AKs', 'QQ+', '76s'),
+        )
+        self.assertEqual(
+            dict(weighted_range.items()),
+            dict.fromkeys(parse_range('AKs'), 0.5)
+            | dict.fromkeys(parse_range('QQ+'), 1.0)
+            | dict.fromkeys(parse_range('76s'), 0.25),
+        )
+
+        weighted_range = parse_weighted_range('AA KK:0.5, AsAh:0;AcKc:0.5')
+
+        self.assertEqual(weighted_range.get_weight(Card.parse('AsAh')), 0)
+        self.assertNotIn(frozenset(Card.parse('AsAh')), weighted_range)
+        self.assertEqual(len(weighted_range), 12)
+        self.assertEqual(
+            parse_range('AA KK:0.5 AsAh:0 AcKc:0.5'),
+            set(weighted_range),
+        )
+
+        weighted_range = parse_weighted_range('AsKsQsJs:2', card_count=4)
+
+        self.assertEqual(len(weighted_range.weights), 270725)
+        self.assertEqual(
+            list(weighted_range.items()),
+            [(frozenset(Card.parse('AsKsQsJs')), 2)],
+        )
+        self.assertEqual(
+            sorted(
+                map(
+                    WeightedRange.get_index,
+                    parse_range(
+                        '22+ A2+ K2+ Q2+ J2+ T2+ 92+ 82+ 72+ 62+ 52+ 42+ 32',
+                    ),
+                ),
+            ),
+            list(range(1326)),
+        )
+        self.assertRaises(ValueError, parse_weighted_range, 'AKs:-0.5')
+        self.assertRaises(ValueError, parse_weighted_range, 'AKs:nan')
+        self.assertRaises(ValueError, parse_weighted_range, 'AKs:x')
+        self.assertRaises(ValueError, parse_weighted_range, 'AKs AsKsQs')
+        self.assertRaises(
+            ValueError,
+            WeightedRange.get_index,
+            Card.parse('As'),
+        )
+        self.assertRaises(
+            ValueError,
+            WeightedRange.get_index,
+            Card.parse('AsAs'),
+        )
+
+    def test_compile_range(self) -> None:
+        raw_range = '22+ A2s+ KTo+ Q9s+ J9s+ T8s+ 97s+ 87s 76s 65s'
+        compiled_range = compile_range(raw_range)
+
+        self.assertIs(compile_range(raw_range), compiled_range)
+        self.assertIs(
+            compile_range(*raw_range.split()),
+            compiled_range,
+        )
+        self.assertIs(
+            compile_range(raw_range.replace(' ', ', ')),
+            compiled_range,
+        )
+        self.assertEqual(len(compile_range('22+')), 78)
+        self.assertEqual(
+            len(compile_range('22+', rank_order=RankOrder.REGULAR)),
+            72,
+        )
+        self.assertEqual(set(compiled_range), parse_range(raw_range))
+        self.assertEqual(len(compiled_range), len(parse_range(raw_range)))
+        self.assertEqual(
+            CompiledRange.from_hole_cards(parse_range(raw_range)),
+            compiled_range,
+        )
+        self.assertEqual(
+            [Card.get_mask(cards) for cards in compiled_range.hole_cards],
+            list(compiled_range.sorted_masks),
+        )
+
+        for raw_range_0, raw_range_1 in (
+                ('AA KK QQ', 'QQ JJ'),
+                ('AKs A5s', 'AK'),
+                ('22+', 'A2+'),
+        ):
+            range_0 = parse_range(raw_range_0)
+            range_1 = parse_range(raw_range_1)
+            compiled_range_0 = compile_range(raw_range_0)
+            compiled_range_1 = compile_range(raw_range_1)
+
+            self.assertEqual(
+                set(compiled_range_0 | compiled_range_1),
+                range_0 | range_1,
+            )
+            self.assertEqual(
+                set(compiled_range_0 & compiled_range_1),
+                range_0 & range_1,
+            )
+            self.assertEqual(
+                set(compiled_range_0 - compiled_range_1),
+                range_0 - range_1,
+            )
+
+        dead_cards = tuple(Card.parse('AsKdQh'))
+
+        self.assertEqual(
+            set(compiled_range.remove_cards(dead_cards)),
+            {
+                cards for cards in parse_range(raw_range)
+                if cards.isdisjoint(dead_cards)
+            },
+        )
+        self.assertIn(frozenset(Card.parse('AsAh')), compiled_range)
+        self.assertNotIn(frozenset(Card.parse('7c2d')), compiled_range)
+        self.assertNotIn(None, compiled_range)
+
+        board_cards = tuple(Card.parse('Ts8s2c3d'))
+
+        for hole_ranges in (
+                (compile_range('AK'), compile_range('QQ+ 99')),
+                (compile_range('AK'), parse_range('QQ+ 99')),
+        ):
+            self.assertEqual(
+                calculate_equities(
+                    hole_ranges,
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    exhaustive=True,
+                ),
+                calculate_equities(
+                    (parse_range('AK'), parse_range('QQ+ 99')),
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    exhaustive=True,
+                ),
+            )
+            self.assertEqual(
+                calculate_equities(
+                    hole_ranges,
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    sample_count=500,
+                    rng=Random(0),
+                ),
+                calculate_equities(
+                    (parse_range('AK'), parse_range('QQ+ 99')),
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    (StandardHighHand,),
+                    sample_count=500,
+                    rng=Random(0),
+                ),
+            )
+
+    def test_calculate_equities_with_weighted_ranges(self) -> None:
+        hole_range = parse_range('AsKs')
+        weighted_range = parse_weighted_range('QQ AA:0.5 JJ:0.1')
+        board_cards = tuple(Card.parse('Ts8s2c3d'))
+        matrix = calculate_equity_matrix(
+            hole_range,
+            weighted_range,
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+        equity_sum = 0.0
+        weight_sum = 0.0
+
+        for cards, equity in zip(matrix.other_hole_cards, matrix.equities[0]):
+            if equity is not None:
+                weight = weighted_range.get_weight(cards)
+                equity_sum += weight * equity
+                weight_sum += weight
+
+        expected_equity = equity_sum / weight_sum
+        equities = calculate_equities(
+            (hole_range, weighted_range),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            exhaustive=True,
+        )
+
+        self.assertAlmostEqual(equities[0], expected_equity)
+
+        equities = calculate_equities(
+            (hole_range, weighted_range),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            sample_count=10000,
+            rng=Random(0),
+        )
+
+        self.assertAlmostEqual(equities[0], expected_equity, delta=0.02)
+        self.assertAlmostEqual(
+            calculate_hand_strength(
+                2,
+                parse_weighted_range('AA:0.001 72o'),
+                (),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                sample_count=5000,
+            ),
+            calculate_hand_strength(
+                2,
+                parse_range('72o'),
+                (),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                sample_count=5000,
+            ),
+            delta=0.05,
+        )
+
+    def test_equity_cache(self) -> None:
+        args = (
+            (parse_range('AsKs'), parse_range('QhQd')),
+            tuple(Card.parse('Ts8s2c')),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+        key = EquityCache.get_key(*args)
+
+        self.assertEqual(
+            EquityCache.get_key(
+                (parse_range('KdAd'), parse_range('QsQc')),
+                Card.parse('2h8dTd'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+            ),
+            key,
+        )
+        self.assertNotEqual(
+            EquityCache.get_key(
+                (parse_range('QhQd'), parse_range('AsKs')),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+            ),
+            key,
+        )
+        self.assertNotEqual(
+            EquityCache.get_key(
+                (parse_range('AsKs'), parse_range('QhQc')),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+            ),
+            key,
+        )
+        self.assertNotEqual(
+            EquityCache.get_key(
+                (parse_range('AsKs'), parse_range('QhQd')),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (EightOrBetterLowHand,),
+            ),
+            key,
+        )
+        self.assertNotEqual(
+            EquityCache.get_key(
+                (
+                    parse_weighted_range('AsKs:0.5'),
+                    parse_range('QhQd'),
+                ),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+            ),
+            key,
+        )
+        self.assertEqual(
+            EquityCache.get_key(
+                (parse_range('AsKs AsTs'), parse_range('QhQd')),
+                Card.parse('Ts8s2c'),
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+            ),
+            key,
+        )
+
+        equity_cache = EquityCache()
+        equities, standard_errors = estimate_equities(
+            *args,
+            sample_count=1000,
+            rng=Random(0),
+            equity_cache=equity_cache,
+        )
+        result = equity_cache.get(key)
+
+        assert result is not None
+
+        self.assertEqual(result.sample_count, 1000)
+        self.assertEqual(result.equities, equities)
+        self.assertEqual(result.standard_errors, standard_errors)
+        self.assertEqual(
+            estimate_equities(
+                *args,
+                sample_count=500,
+                equity_cache=equity_cache,
+            ),
+            (equities, standard_errors),
+        )
+
+        equities, standard_errors = estimate_equities(
+            *args,
+            sample_count=2000,
+            rng=Random(1),
+            equity_cache=equity_cache,
+            block_size=100,
+        )
+        other_result = equity_cache.get(key)
+
+        assert other_result is not None
+
+        self.assertEqual(other_result.sample_count, 2000)
+        self.assertEqual(other_result.equities, equities)
+
+        equities, standard_errors = estimate_equities(
+            *args,
+            sample_count=10000,
+            equity_cache=equity_cache,
+            standard_error=max(standard_errors),
+        )
+
+        self.assertEqual(equity_cache.get(key), other_result)
+
+        equities = calculate_equities(
+            *args,
+            exhaustive=True,
+            equity_cache=equity_cache,
+        )
+        result = equity_cache.get(key)
+
+        assert result is not None
+
+        self.assertTrue(result.exact)
+        self.assertEqual(result.equities, equities)
+        self.assertEqual(
+            calculate_equities(
+                *args,
+                sample_count=1000,
+                equity_cache=equity_cache,
+            ),
+            equities,
+        )
+
+        equity_cache = EquityCache(max_size=1)
+        other_args = (
+            (parse_range('AsKs'), parse_range('QhQd')),
+            tuple(Card.parse('Ts8s2c3d')),
+            *args[2:],
+        )
+        other_key = EquityCache.get_key(*other_args)
+
+        equity_cache.put(key, result)
+        equity_cache.put(other_key, result)
+
+        self.assertIsNone(equity_cache.get(key))
+        self.assertEqual(equity_cache.get(other_key), result)
+
+        with TemporaryDirectory() as directory:
+            pathname = path.join(directory, 'equities.sqlite3')
+
+            with EquityCache(path=pathname) as equity_cache:
+                equities = calculate_equities(
+                    *other_args,
+                    exhaustive=True,
+                    equity_cache=equity_cache,
+                )
+
+            with EquityCache(path=pathname) as equity_cache:
+                result = equity_cache.get(other_key)
+
+                assert result is not None
+
+                self.assertTrue(result.exact)
+                self.assertEqual(result.equities, equities)
+                self.assertIsNone(equity_cache.get(key))
+
+            with (
+                    EquityCache(max_size=2, path=pathname) as equity_cache,
+                    ThreadPoolExecutor(4) as executor,
+            ):
+                board_cards = tuple(Card.parse('Ts8s2c3d'))
+                keys = [
+                    EquityCache.get_key(
+                        (hole_range, parse_range('QhQd')),
+                        board_cards,
+                        2,
+                        5,
+                        Deck.STANDARD,
+                        (StandardHighHand,),
+                    ) for hole_range in (
+                        parse_range('AsKs'),
+                        parse_range('AdKd'),
+                        parse_range('JcJd'),
+                        parse_range('9c9d'),
+                    )
+                ]
+
+                futures = [
+                    executor.submit(
+                        equity_cache.put,
+                        key_,
+                        EquityResult.from_equities([i, 0]),
+                    ) for i, key_ in enumerate(keys * 5)
+                ]
+
+                for future in futures:
+                    self.assertIsNone(future.result())
+
+                for result_ in executor.map(equity_cache.get, keys * 5):
+                    self.assertIsNotNone(result_)
+
+    def test_merge_equity_results(self) -> None:
+        result = EquityResult.merge(
+            EquityResult((1.0, 0.0), (1.0, 0.0), 1),
+            EquityResult((0.5, 1.5), (0.25, 1.25), 2),
+        )
+
+        self.assertEqual(result, EquityResult((1.5, 1.5), (1.25, 1.25), 3))
+        self.assertEqual(result.equities, [0.5, 0.5])
+        self.assertAlmostEqual(result.standard_errors[0], (0.25 / 3) ** 0.5)
+        self.assertEqual(
+            EquityResult((1.0,), (1.0,), 1).standard_errors,
+            [float('inf')],
+        )
+
+    def test_calculate_icm(self) -> None:
+        rng = Random(0)
+
+        for _ in range(20):
+            chips = [rng.randint(0, 100) for _ in range(rng.randint(1, 6))]
+            chips[0] += 1
+            payouts = [rng.random() for _ in range(rng.randint(1, 6))]
+            icms = [0.0] * len(chips)
+
+            for indices in permutations(range(len(chips))):
+                probability = 1.0
+                chip_sum = sum(chips)
+
+                for i in indices:
+                    probability *= (
+                        chips[i] / chip_sum
+                        if chip_sum
+                        else 1 / (len(chips) - indices.index(i))
+                    )
+                    chip_sum -= chips[i]
+
+                for payout, i in zip(payouts, indices):
+                    icms[i] += payout * probability
+
+            for icm, expected_icm in zip(
+                    calculate_icm(payouts, chips),
+                    icms,
+            ):
+                self.assertAlmostEqual(icm, expected_icm)
+
+            chips = [chip + 1 for chip in chips]
+            icms = [0.0] * len(chips)
+
+            for indices in permutations(range(len(chips))):
+                probability = 1.0
+                inverse_chip_sum = sum(1 / chip for chip in chips)
+
+                for i in reversed(indices):
+                    probability *= 1 / chips[i] / inverse_chip_sum
+                    inverse_chip_sum -= 1 / chips[i]
+
+                for payout, i in zip(payouts, indices):
+                    icms[i] += payout * probability
+
+            for icm, expected_icm in zip(
+                    calculate_icm(
+                        payouts,
+                        chips,
+                        model=ICMModel.MALMUTH_WEITZMAN,
+                    ),
+                    icms,
+            ):
+                self.assertAlmostEqual(icm, expected_icm)
+
+        chips = [10, 20, 30, 40, 50, 60, 70, 80, 90]
+
+        for model in ICMModel:
+            probabilities = calculate_finish_probabilities(chips, model=model)
+
+            for row in probabilities:
+                self.assertAlmostEqual(sum(row), 1)
+
+            for column in zip(*probabilities):
+                self.assertAlmostEqual(sum(column), 1)
+
+            sampled_probabilities = calculate_finish_probabilities(
+                chips,
+                3,
+                model=model,
+                sample_count=20000,
+                rng=Random(0),
+            )
+
+            for row, sampled_row in zip(probabilities, sampled_probabilities):
+                for probability, sampled_probability in zip(row, sampled_row):
+                    self.assertAlmostEqual(
+                        probability,
+                        sampled_probability,
+                        delta=0.02,
+                    )
+
+        self.assertEqual(calculate_finish_probabilities([1, 2], 0), ((), ()))
+        self.assertRaises(ValueError, calculate_finish_probabilities, [1], 2)
+        self.assertRaises(
+            ValueError,
+            calculate_finish_probabilities,
+            [1],
+            sample_count=0,
+        )
+
+        get_cached_icm_layers = getattr(
+            analysis,
+            '__get_cached_icm_layers',
+        )
+
+        get_cached_icm_layers.cache_clear()
+        calculate_icm([50, 30, 20], [3, 1, 2])
+
+        self.assertEqual(get_cached_icm_layers.cache_info().currsize, 1)
+
+        large_icms = calculate_icm([50, 30, 20], range(1, 13))
+
+        self.assertAlmostEqual(sum(large_icms), 100)
+        self.assertEqual(get_cached_icm_layers.cache_info().currsize, 1)
+
+    def test_calculate_icms(self) -> None:
+        rng = Random(0)
+        payouts = [50, 30, 20]
+        chips = [
+            [rng.randint(0, 100) + 1 for _ in range(rng.randint(1, 6))]
+            for _ in range(20)
+        ]
+        chips.append(list(reversed(chips[0])))
+
+        for model in ICMModel:
+            for icms, chips_ in zip(
+                    calculate_icms(payouts, chips, model=model),
+                    chips,
+            ):
+                for icm, expected_icm in zip(
+                        icms,
+                        calculate_icm(payouts, chips_, model=model),
+                ):
+                    self.assertAlmostEqual(icm, expected_icm)
+
+        sampled_icms = calculate_icms(
+            payouts,
+            [[10] * 30, [20, 10, 30]],
+            sample_count=1000,
+            rng=Random(0),
+        )
+
+        self.assertEqual(len(sampled_icms[0]), 30)
+        self.assertAlmostEqual(sum(sampled_icms[0]), 100)
+        self.assertEqual(len(sampled_icms[1]), 3)
+
+    def test_push_fold(self) -> None:
+        push_fold = PushFold(
+            (50, 30, 20),
+            (5000, 3000, 2000, 1000),
+            (25, 25, 125, 275),
+            2,
+            3,
+        )
+
+        for icms, stacks in (
+                (push_fold.fold_icms, (4975, 2975, 1875, 1175)),
+                (push_fold.steal_icms, (4975, 2975, 2325, 725)),
+                (push_fold.win_icms, (4975, 2975, 3050, 0)),
+                (push_fold.loss_icms, (4975, 2975, 1000, 2050)),
+        ):
+            for icm, expected_icm in zip(
+                    icms,
+                    calculate_icm((50, 30, 20), stacks),
+            ):
+                self.assertAlmostEqual(icm, expected_icm)
+
+        self.assertEqual(push_fold.pusher_fold_ev, push_fold.fold_icms[2])
+        self.assertEqual(push_fold.caller_fold_ev, push_fold.steal_icms[3])
+
+        hole_cards = tuple(Card.parse('AsAh')), tuple(Card.parse('KsKh'))
+        other_hole_cards = (
+            tuple(Card.parse('AcAd')),
+            tuple(Card.parse('AsKs')),
+        )
+        equity_matrix = EquityMatrix(
+            hole_cards,
+            other_hole_cards,
+            ((0.5, None), (0.2, None)),
+        )
+        call_probability = 1 / 1225
+        evs = push_fold.get_push_evs(equity_matrix)
+
+        self.assertAlmostEqual(
+            evs[0],
+            (1 - call_probability) * push_fold.steal_icms[2]
+            + call_probability * (
+                0.5 * push_fold.win_icms[2] + 0.5 * push_fold.loss_icms[2]
+            ),
+        )
+        self.assertAlmostEqual(
+            evs[1],
+            (1 - call_probability) * push_fold.steal_icms[2]
+            + call_probability * (
+                0.2 * push_fold.win_icms[2] + 0.8 * push_fold.loss_icms[2]
+            ),
+        )
+
+        board_cards = tuple(Card.parse('2c3d4h'))
+        pusher_hole_cards = tuple(Card.parse('AsKs'))
+        caller_hole_cards = tuple(
+            tuple(sorted(cards, key=attrgetter('index')))
+            for cards in parse_range('QQ+')
+        )
+        row = tuple(
+            (
+                None
+                if set(cards) & set(pusher_hole_cards) or i % 3 == 0
+                else i / 100
+            ) for i, cards in enumerate(caller_hole_cards)
+        )
+        equity_matrix = EquityMatrix(
+            (pusher_hole_cards,),
+            caller_hole_cards,
+            (row,),
+            board_cards,
+        )
+        call_probability = 12 / 1081
+        equity = mean(filter_none(row))
+        evs = push_fold.get_push_evs(equity_matrix)
+
+        self.assertAlmostEqual(
+            evs[0],
+            (1 - call_probability) * push_fold.steal_icms[2]
+            + call_probability * (
+                equity * push_fold.win_icms[2]
+                + (1 - equity) * push_fold.loss_icms[2]
+            ),
+        )
+        self.assertRaises(
+            ValueError,
+            push_fold.get_push_evs,
+            EquityMatrix(
+                (pusher_hole_cards,),
+                caller_hole_cards,
+                ((None,) * len(caller_hole_cards),),
+                board_cards,
+            ),
+        )
+
+        equity_matrix = calculate_equity_matrix(
+            parse_range('AsKs'),
+            parse_range('QQ+'),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+            sample_count=5,
+            rng=Random(0),
+        )
+        row = equity_matrix.equities[0]
+        equity = mean(filter_none(row))
+
+        self.assertEqual(equity_matrix.board_cards, board_cards)
+        self.assertAlmostEqual(
+            push_fold.get_push_evs(equity_matrix)[0],
+            (1 - call_probability) * push_fold.steal_icms[2]
+            + call_probability * (
+                equity * push_fold.win_icms[2]
+                + (1 - equity) * push_fold.loss_icms[2]
+            ),
+        )
+
+        equity_matrix = EquityMatrix(
+            other_hole_cards,
+            hole_cards,
+            ((0.5, 0.8), (None, None)),
+        )
+        evs_ = push_fold.get_call_evs(equity_matrix)
+
+        assert evs_[0] is not None
+
+        self.assertAlmostEqual(
+            evs_[0],
+            0.65 * push_fold.loss_icms[3] + 0.35 * push_fold.win_icms[3],
+        )
+        self.assertIsNone(evs_[1])
+        self.assertRaises(ValueError, PushFold, (1,), (1, 1), (0,), 0, 1)
+        self.assertRaises(ValueError, PushFold, (1,), (1, 1), (0, 0), 0, 0)
+        self.assertRaises(ValueError, PushFold, (1,), (1, 1), (0, 0), 0, 2)
+        self.assertRaises(ValueError, PushFold, (1,), (1, 1), (0, 2), 0, 1)
+
+    def test_statistics(self) -> None:
+        rng = Random(0)
+        payoffs = [rng.randint(-1000, 1000) for _ in range(1000)]
+        statistics = Statistics()
+
+        for payoff in payoffs:
+            statistics.add(payoff)
+
+        merged_statistics = Statistics.merge(
+            Statistics(payoffs=payoffs[:10]),
+            Statistics(),
+            Statistics(payoffs=payoffs[10:700]),
+            Statistics(payoffs=payoffs[700:]),
+        )
+        listed_statistics = Statistics.merge(
+            Statistics(payoffs=payoffs[:500]),
+            Statistics(payoffs=payoffs[500:]),
+        )
+
+        for statistics_ in (statistics, merged_statistics, listed_statistics):
+            self.assertEqual(statistics_.sample_count, len(payoffs))
+            self.assertEqual(statistics_.payoff_sum, sum(payoffs))
+            self.assertEqual(statistics_.payoff_min, min(payoffs))
+            self.assertEqual(statistics_.payoff_max, max(payoffs))
+            self.assertAlmostEqual(statistics_.payoff_mean, mean(payoffs))
+            self.assertAlmostEqual(statistics_.payoff_stdev, stdev(payoffs))
+            self.assertAlmostEqual(
+                statistics_.payoff_stderr,
+                stdev(payoffs) / len(payoffs) ** 0.5,
+            )
+
+        self.assertIsNone(statistics.payoffs)
+        self.assertIsNone(merged_statistics.payoffs)
+        self.assertEqual(listed_statistics.payoffs, payoffs)
+        self.assertRaises(ValueError, getattr, Statistics(), 'payoff_mean')
+        self.assertRaises(
+            ValueError,
+            getattr,
+            Statistics(payoffs=[1]),
+            'payoff_stdev',
+        )
+
+        statistics = Statistics(reservoir_size=100, rng=Random(0))
+
+        for payoff in range(10000):
+            statistics.add(payoff)
+
+        self.assertEqual(len(statistics.reservoir), 100)
+        self.assertEqual(len(set(statistics.reservoir)), 100)
+        self.assertAlmostEqual(mean(statistics.reservoir), 5000, delta=1000)
+
+        other_statistics = Statistics(reservoir_size=100, rng=Random(1))
+
+        for payoff in range(10000, 10050):
+            other_statistics.add(payoff)
+
+        self.assertEqual(other_statistics.reservoir, list(range(10000, 10050)))
+
+        merged_statistics = Statistics.merge(
+            statistics,
+            other_statistics,
+            rng=Random(0),
+        )
+
+        self.assertEqual(len(merged_statistics.reservoir), 100)
+        self.assertTrue(
+            set(merged_statistics.reservoir)
+            <= set(statistics.reservoir) | set(other_statistics.reservoir),
+        )
+        self.assertEqual(
+            len(Statistics.merge(other_statistics).reservoir),
+            50,
+        )
+
+    def test_statistics_from_hand_history(self) -> None:
+        hh = self.__load_hand_history()
+        statistics = Statistics.from_hand_history(hh, hh)
+
+        self.assertEqual(statistics.keys(), {'Alice', 'Bob', 'Carol'})
+        self.assertEqual(statistics['Alice'].sample_count, 2)
+        self.assertEqual(statistics['Alice'].payoff_sum, 16)
+        self.assertEqual(statistics['Bob'].payoff_mean, -2)
+        self.assertEqual(statistics['Carol'].payoff_stdev, 0)
+
+    @classmethod
+    def __load_hand_history(cls) -> HandHistory:
+        return HandHistory.loads(
+            '''
+variant = "NT"
+ante_trimming_status = true
+antes = [0, 0, 0]
+blinds_or_straddles = [1, 2, 0]
+min_bet = 2
+starting_stacks = [200, 200, 200]
+actions = [
+    "d dh p1 AsAh",
+    "d dh p2 7c2d",
+    "d dh p3 KsKh",
+    "p3 cbr 6",
+    "p1 cc",
+    "p2 f",
+    "d db 2c3c4d",
+    "p1 cbr 10",
+    "p3 f",
+]
+players = ["Alice", "Bob", "Carol"]
+''',
+        )
+
+    def test_hand_history_statistics(self) -> None:
+        hh = self.__load_hand_history()
+        other_hh = HandHistory.loads(hh.dumps())
+        other_hh.players = None
+        other_hh.finishing_stacks = [201, 199, 200]
+
+        statistics = HandHistoryStatistics.from_hand_histories(
+            (hh if i % 3 else other_hh for i in range(10)),
+        )
+
+        self.assertEqual(statistics.hand_count, 10)
+        self.assertEqual(statistics.player_statistics['Alice'].sample_count, 6)
+        self.assertEqual(statistics.position_statistics[0].sample_count, 10)
+        self.assertEqual(statistics.position_statistics[0].payoff_sum, 52)
+        self.assertEqual(
+            statistics.player_position_statistics['Carol', 2].payoff_sum,
+            -36,
+        )
+
+        with TemporaryDirectory() as directory:
+            pathnames = []
+
+            for i in range(10):
+                pathname = path.join(directory, f'{i}.phh')
+
+                with open(pathname, 'wb') as file:
+                    (hh if i % 3 else other_hh).dump(file)
+
+                pathnames.append(pathname)
+
+            pathname = path.join(directory, 'hands.phhs')
+
+            with open(pathname, 'wb') as file:
+                HandHistory.dump_all((hh, other_hh), file)
+
+            pathnames.append(pathname)
+
+            with ProcessPoolExecutor() as executor:
+                other_statistics = HandHistoryStatistics.from_hand_histories(
+                    pathnames,
+                    executor=executor,
+                    chunk_size=3,
+                )
+
+        statistics = HandHistoryStatistics.merge(
+            statistics,
+            HandHistoryStatistics.from_hand_histories((hh, other_hh)),
+        )
+
+        self.assertEqual(other_statistics.hand_count, 12)
+
+        for key, statistics_ in statistics.position_statistics.items():
+            other_statistics_ = other_statistics.position_statistics[key]
+
+            self.assertEqual(
+                other_statistics_.sample_count,
+                statistics_.sample_count,
+            )
+            self.assertEqual(
+                other_statistics_.payoff_sum,
+                statistics_.payoff_sum,
+            )
+            self.assertAlmostEqual(
+                other_statistics_.payoff_stdev,
+                statistics_.payoff_stdev,
+            )
+
+        self.assertEqual(
+            other_statistics.player_statistics.keys(),
+            statistics.player_statistics.keys(),
+        )
+        self.assertEqual(
+            other_statistics.player_position_statistics.keys(),
+            statistics.player_position_statistics.keys(),
+        )
+
+    def test_action_statistics(self) -> None:
+        hh = self.__load_hand_history()
+        alice, bob, carol = ActionStatistics.from_state_actions(
+            hh.state_actions,
+        )
+
+        self.assertEqual(
+            alice,
+            ActionStatistics(
+                hand_count=1,
+                voluntary_put_count=1,
+                three_bet_opportunity_count=1,
+                postflop_bet_or_raise_count=1,
+                flop_count=1,
+            ),
+        )
+        self.assertEqual(
+            bob,
+            ActionStatistics(hand_count=1, three_bet_opportunity_count=1),
+        )
+        self.assertEqual(
+            carol,
+            ActionStatistics(
+                hand_count=1,
+                voluntary_put_count=1,
+                preflop_raise_count=1,
+                flop_count=1,
+            ),
+        )
+
+        other_hh = HandHistory.loads(hh.dumps())
+        other_hh.actions = [
+            'd dh p1 AsAh',
+            'd dh p2 7c2d',
+            'd dh p3 KsKh',
+            'p3 cbr 6',
+            'p1 cbr 18',
+            'p2 f',
+            'p3 cc',
+            'd db 2c3d4h',
+            'p1 cbr 20',
+            'p3 cc',
+            'd db 5s',
+            'p1 cc',
+            'p3 cbr 40',
+            'p1 cc',
+            'd db 9d',
+            'p1 cc',
+            'p3 cc',
+            'p1 sm AsAh',
+            'p3 sm -',
+        ]
+        alice, bob, carol = ActionStatistics.from_state_actions(
+            other_hh.state_actions,
+        )
+
+        self.assertEqual(
+            alice,
+            ActionStatistics(
+                hand_count=1,
+                voluntary_put_count=1,
+                preflop_raise_count=1,
+                three_bet_opportunity_count=1,
+                three_bet_count=1,
+                continuation_bet_opportunity_count=1,
+                continuation_bet_count=1,
+                postflop_bet_or_raise_count=1,
+                postflop_call_count=1,
+                flop_count=1,
+                showdown_count=1,
+                showdown_win_count=1,
+            ),
+        )
+        self.assertEqual(bob, ActionStatistics(hand_count=1))
+        self.assertEqual(
+            carol,
+            ActionStatistics(
+                hand_count=1,
+                voluntary_put_count=1,
+                preflop_raise_count=1,
+                three_bet_fold_opportunity_count=1,
+                postflop_bet_or_raise_count=1,
+                postflop_call_count=1,
+                flop_count=1,
+                showdown_count=1,
+            ),
+        )
+        self.assertRaises(ValueError, getattr, bob, 'three_bet_frequency')
+        self.assertRaises(ValueError, getattr, bob, 'aggression_factor')
+
+        hhs = [hh, other_hh, other_hh, hh, hh]
+        statistics = HandHistoryStatistics.from_hand_histories(
+            hhs,
+            action_statistics_status=True,
+        )
+        action_statistics = statistics.player_statistics[
+            'Alice'
+        ].action_statistics
+
+        self.assertEqual(action_statistics.hand_count, 5)
+        self.assertEqual(action_statistics.vpip, 1)
+        self.assertAlmostEqual(action_statistics.pfr, 0.4)
+        self.assertAlmostEqual(action_statistics.three_bet_frequency, 0.4)
+        self.assertEqual(action_statistics.continuation_bet_frequency, 1)
+        self.assertAlmostEqual(action_statistics.aggression_factor, 2.5)
+        self.assertAlmostEqual(
+            action_statistics.went_to_showdown_frequency,
+            0.4,
+        )
+        self.assertEqual(action_statistics.won_at_showdown_frequency, 1)
+        self.assertEqual(
+            statistics.player_statistics['Carol'].payoff_sum,
+            3 * -6 + 2 * -78,
+        )
+
+        with ProcessPoolExecutor() as executor:
+            other_statistics = HandHistoryStatistics.from_hand_histories(
+                hhs,
+                executor=executor,
+                chunk_size=2,
+                action_statistics_status=True,
+            )
+
+        for key, statistics_ in statistics.player_position_statistics.items():
+            self.assertEqual(
+                other_statistics.player_position_statistics[
+                    key
+                ].action_statistics,
+                statistics_.action_statistics,
+            )
+
+        self.assertEqual(
+            HandHistoryStatistics.from_hand_histories(
+                hhs,
+            ).player_statistics['Alice'].action_statistics,
+            ActionStatistics(),
+        )
+
+    def test_calculate_hand_potential(self) -> None:
+        for raw_hole_cards, raw_board_cards, hand_type in (
+                ('AdQc', '3h4cJhQd', StandardHighHand),
+                ('9s8s', 'Ts7d2s2h', StandardHighHand),
+                ('As2c', '3h4c8hKd', EightOrBetterLowHand),
+                ('KsKc', '3h4c8hKd', EightOrBetterLowHand),
+                ('AdQc', '3h4cJhQd5s', StandardHighHand),
+        ):
+            hole_cards = tuple(Card.parse(raw_hole_cards))
+            board_cards = tuple(Card.parse(raw_board_cards))
+            hand_potential = calculate_hand_potential(
+                hole_cards,
+                board_cards,
+                2,
+                5,
+                Deck.STANDARD,
+                hand_type,
+                bin_count=5,
+            )
+            expected_hand_potential = self.__calculate_hand_potential(
+                hole_cards,
+                board_cards,
+                hand_type,
+                5,
+            )
+
+            for value, expected_value in zip(
+                    (
+                        hand_potential.hand_strength,
+                        hand_potential.positive_potential,
+                        hand_potential.negative_potential,
+                        hand_potential.squared_effective_hand_strength,
+                        *hand_potential.histogram,
+                    ),
+                    expected_hand_potential,
+            ):
+                self.assertAlmostEqual(value, expected_value)
+
+        board_cards = tuple(Card.parse('3h4cJhQd'))
+        hand_potentials = calculate_hand_potentials(
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            StandardHighHand,
+        )
+
+        self.assertEqual(len(hand_potentials), 1128)
+
+        for hole_cards in (
+                tuple(Card.parse('2c2d')),
+                tuple(Card.parse('QcAd')),
+                tuple(Card.parse('5h6h')),
+        ):
+            self.assertEqual(
+                hand_potentials[hole_cards],
+                calculate_hand_potential(
+                    hole_cards,
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    StandardHighHand,
+                ),
+            )
+
+        hand_potential = hand_potentials[tuple(Card.parse('QcAd'))]
+
+        self.assertAlmostEqual(
+            hand_potential.get_effective_hand_strength(),
+            hand_potential.hand_strength
+            * (1 - hand_potential.negative_potential)
+            + (1 - hand_potential.hand_strength)
+            * hand_potential.positive_potential,
+        )
+        self.assertRaises(
+            ValueError,
+            calculate_hand_potential,
+            Card.parse('QdAd'),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            StandardHighHand,
+        )
+
+    @classmethod
+    def __calculate_hand_potential(
+            cls,
+            hole_cards: tuple[Card, ...],
+            board_cards: tuple[Card, ...],
+            hand_type: type[Hand],
+            bin_count: int,
+    ) -> list[float]:
+        def compare(
+                cards: tuple[Card, ...],
+                other_cards: tuple[Card, ...],
+        ) -> int:
+            hand = hand_type.from_game_or_none(cards, board_cards_)
+            other_hand = hand_type.from_game_or_none(
+                other_cards,
+                board_cards_,
+            )
+
+            if hand == other_hand:
+                return 1
+            elif other_hand is None or (
+                    hand is not None and hand > other_hand
+            ):
+                return 2
+
+            return 0
+
+        deck_cards = [
+            card for card in Deck.STANDARD
+            if card not in hole_cards and card not in board_cards
+        ]
+        counts = [0, 0, 0]
+        potential_counts = [[0, 0, 0] for _ in range(3)]
+        final_hand_strengths = []
+
+        for other_hole_cards in combinations(deck_cards, 2):
+            board_cards_ = board_cards
+            counts[compare(hole_cards, other_hole_cards)] += 1
+
+        runouts = list(combinations(deck_cards, 5 - len(board_cards)))
+
+        for runout in runouts:
+            final_counts = [0, 0, 0]
+
+            for other_hole_cards in combinations(deck_cards, 2):
+                if set(other_hole_cards) & set(runout):
+                    continue
+
+                board_cards_ = board_cards
+                status = compare(hole_cards, other_hole_cards)
+                board_cards_ = board_cards + runout
+                final_status = compare(hole_cards, other_hole_cards)
+                potential_counts[status][final_status] += 1
+                final_counts[final_status] += 1
+
+            final_hand_strengths.append(
+                (final_counts[2] + final_counts[1] / 2) / sum(final_counts),
+            )
+
+        hand_strength = (counts[2] + counts[1] / 2) / sum(counts)
+        totals = list(map(sum, potential_counts))
+        positive_denominator = totals[0] + totals[1] / 2
+        negative_denominator = totals[2] + totals[1] / 2
+
+        if not runouts:
+            final_hand_strengths.append(hand_strength)
+
+        histogram = [0.0] * bin_count
+
+        for final_hand_strength in final_hand_strengths:
+            histogram[
+                min(int(final_hand_strength * bin_count), bin_count - 1)
+            ] += 1 / len(final_hand_strengths)
+
+        return [
+            hand_strength,
+            (
+                (
+                    potential_counts[0][2]
+                    + potential_counts[0][1] / 2
+                    + potential_counts[1][2] / 2
+                ) / positive_denominator
+            ) if positive_denominator else 0,
+            (
+                (
+                    potential_counts[2][0]
+                    + potential_counts[1][0] / 2
+                    + potential_counts[2][1] / 2
+                ) / negative_denominator
+            ) if negative_denominator else 0,
+            sum(
+                final_hand_strength ** 2
+                for final_hand_strength in final_hand_strengths
+            ) / len(final_hand_strengths),
+            *histogram,
+        ]
+
+    def test_calculate_equity_matrix(self) -> None:
+        hole_range = parse_range('AK', 'Ts9s')
+        other_hole_range = parse_range('QQ', 'AdTd')
+        board_cards = tuple(Card.parse('Ts8s2c'))
+        matrix = calculate_equity_matrix(
+            hole_range,
+            other_hole_range,
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+
+        self.assertEqual(len(matrix.hole_cards), 16)
+        self.assertEqual(len(matrix.other_hole_cards), 7)
+
+        for cards, equities in zip(matrix.hole_cards, matrix.equities):
+            for other_cards, equity in zip(matrix.other_hole_cards, equities):
+                if set(cards) & set(other_cards):
+                    self.assertIsNone(equity)
+                else:
+                    assert equity is not None
+
+                    self.assertAlmostEqual(
+                        equity,
+                        calculate_equities(
+                            ({cards}, {other_cards}),
+                            board_cards,
+                            2,
+                            5,
+                            Deck.STANDARD,
+                            (StandardHighHand,),
+                            exhaustive=True,
+                        )[0],
+                    )
+
+        self.assertAlmostEqual(
+            matrix.get_range_equity(),
+            calculate_equities(
+                (hole_range, other_hole_range),
+                board_cards,
+                2,
+                5,
+                Deck.STANDARD,
+                (StandardHighHand,),
+                exhaustive=True,
+            )[0],
+        )
+
+        hand_types = StandardHighHand, EightOrBetterLowHand
+        board_cards = tuple(Card.parse('2c3d4hKs'))
+        matrix = calculate_equity_matrix(
+            parse_range('A5', 'KK'),
+            parse_range('6s7s', 'AA'),
+            board_cards,
+            2,
+            5,
+            Deck.STANDARD,
+            hand_types,
+        )
+
+        for cards, equity in zip(matrix.hole_cards, matrix.get_equities()):
+            assert equity is not None
+
+            self.assertAlmostEqual(
+                equity,
+                calculate_equities(
+                    ({cards}, parse_range('6s7s', 'AA')),
+                    board_cards,
+                    2,
+                    5,
+                    Deck.STANDARD,
+                    hand_types,
+                    exhaustive=True,
+                )[0],
+            )
+
+        args = (
+            parse_range('AK'),
+            parse_range('QQ', 'JJ'),
+            tuple(Card.parse('Ts8s2c')),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+        matrix = calculate_equity_matrix(
+            *args,
+            sample_count=500,
+            block_size=50,
+            rng=Random(0),
+        )
+
+        with ProcessPoolExecutor() as executor:
+            self.assertEqual(
+                calculate_equity_matrix(
+                    *args,
+                    sample_count=500,
+                    executor=executor,
+                    block_size=50,
+                    rng=Random(0),
+                ),
+                matrix,
+            )
+
+        self.assertAlmostEqual(matrix.get_range_equity(), 0.3, delta=0.07)
+        self.assertRaises(
+            ValueError,
+            calculate_equity_matrix,
+            parse_range('AK'),
+            [()],
+            (),
+            2,
+            5,
+            Deck.STANDARD,
+            (StandardHighHand,),
+        )
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
@@ -2,22 +2,45 @@
 :mod:`pokerkit.test_lookups`.
 """
 
+from collections import Counter
 from collections.abc import Iterable
 from hashlib import md5
 from itertools import combinations
+from os import listdir, path
+from tempfile import TemporaryDirectory
 from unittest import main, TestCase
 
 from pokerkit.lookups import (
     BadugiLookup,
     EightOrBetterLookup,
     KuhnPokerLookup,
+    Lookup,
     RegularLookup,
     RhodeIslandHoldemLookup,
     ShortDeckHoldemLookup,
     StandardBadugiLookup,
     StandardLookup,
 )
-from pokerkit.utilities import Card, Deck
+from pokerkit.utilities import Card, Deck, RankOrder
+
+__temporary_directory: TemporaryDirectory[str] | None = None
+__cache_directory: str | None = None
+
+
+def setUpModule() -> None:
+    global __temporary_directory, __cache_directory
+
+    __temporary_directory = TemporaryDirectory()
+    __cache_directory = Lookup.cache_directory
+    Lookup.cache_directory = __temporary_directory.name
+
+
+def tearDownModule() -> None:
+    assert __temporary_directory is not None
+
+    Lookup.cache_directory = __cache_directory
+
+    __temporary_directory.cleanup()
 
 
 class LookupTestCaseMixin:
@@ -32,6 +55,212 @@ class LookupTestCaseMixin:
     def serialize_combination(cls, combination: Iterable[Card]) -> str:
         return ''.join(map(repr, combination))
 
+    def assert_entry_indices(
+            self,
+            lookup: Lookup,
+            combinations_: Iterable[Iterable[Card]],
+    ) -> None:
+        assert isinstance(self, TestCase)
+
+        import numpy as np
+
+        batch_card_indices = []
+        indices = []
+
+        for combination in combinations_:
+            combination = tuple(combination)
+            card_indices = tuple(card.index for card in combination)
+
+            if lookup.has_entry(combination):
+                index = lookup.get_entry(combination).index
+
+                self.assertEqual(lookup.get_entry_index(card_indices), index)
+            else:
+                index = -1
+
+                self.assertRaises(
+                    ValueError,
+                    lookup.get_entry_index,
+                    card_indices,
+                )
+
+            batch_card_indices.append(card_indices)
+            indices.append(index)
+
+        self.assertEqual(
+            lookup.get_entry_indices(
+                np.array(batch_card_indices, dtype=np.uint8),
+            ).tolist(),
+            indices,
+        )
+
+    def assert_best_positions(
+            self,
+            lookup: Lookup,
+            card_count: int,
+            low: bool,
+            combinations_: Iterable[Iterable[Card]],
+    ) -> None:
+        assert isinstance(self, TestCase)
+
+        for combination in combinations_:
+            combination = tuple(combination)
+            best_positions = None
+            best_entry = None
+
+            for positions in combinations(
+                    range(len(combination)),
+                    card_count,
+            ):
+                entry = lookup.get_entry_or_none(
+                    map(combination.__getitem__, positions),
+                )
+
+                if entry is not None and (
+                        best_entry is None
+                        or (entry < best_entry if low else entry > best_entry)
+                ):
+                    best_positions = positions
+                    best_entry = entry
+
+            self.assertEqual(
+                lookup.get_best_positions(
+                    [card.index for card in combination],
+                    card_count,
+                    low,
+                ),
+                best_positions,
+            )
+
+    def assert_best_rainbow_positions(
+            self,
+            lookup: BadugiLookup,
+            combinations_: Iterable[Iterable[Card]],
+    ) -> None:
+        assert isinstance(self, TestCase)
+
+        for combination in combinations_:
+            combination = tuple(combination)
+            best_positions = None
+            best_entry = None
+
+            for count in range(4, 0, -1):
+                for positions in combinations(range(len(combination)), count):
+                    cards = tuple(map(combination.__getitem__, positions))
+
+                    if lookup.has_entry(cards):
+                        entry = lookup.get_entry(cards)
+
+                        if best_entry is None or entry < best_entry:
+                            best_positions = positions
+                            best_entry = entry
+
+                if best_positions is not None:
+                    break
+
+            self.assertEqual(
+                lookup.get_best_rainbow_positions(
+                    [card.index for card in combination],
+                ),
+                best_positions,
+            )
+
+    def assert_cumulative_counts(
+            self,
+            lookup: Lookup,
+            hand_card_count: int,
+            card_count: int | None,
+            low: bool,
+            ranks: RankOrder,
+            combinations_: Iterable[Iterable[Card]],
+    ) -> None:
+        assert isinstance(self, TestCase)
+
+        counts = Counter[int]()
+
+        for combination in combinations_:
+            combination = tuple(combination)
+            positions: tuple[int, ...] | None
+
+            if card_count is None:
+                positions = tuple(range(len(combination)))
+            else:
+                positions = lookup.get_best_positions(
+                    [card.index for card in combination],
+                    hand_card_count,
+                    low,
+                )
+
+            if positions is not None:
+                counts[
+                    lookup.get_entry(
+                        map(combination.__getitem__, positions),
+                    ).index
+                ] += 1
+
+        cumulative_counts = lookup.get_cumulative_counts(
+            card_count,
+            low,
+            ranks,
+        )
+        cumulative_count = 0
+
+        for index, count in enumerate(cumulative_counts):
+            cumulative_count += counts[index]
+
+            self.assertEqual(count, cumulative_count)
+
+        self.assertEqual(cumulative_counts[-1], counts.total())
+
+    def assert_best_hole_board_positions(
+            self,
+            lookup: Lookup,
+            low: bool,
+            hole_combinations: Iterable[Iterable[Card]],
+            board_cards: Iterable[Card],
+    ) -> None:
+        assert isinstance(self, TestCase)
+
+        board_cards = tuple(board_cards)
+
+        for hole_cards in map(tuple, hole_combinations):
+            best_positions = None
+            best_entry = None
+
+            for hole_positions in combinations(range(len(hole_cards)), 2):
+                for board_positions in combinations(
+                        range(len(board_cards)),
+                        3,
+                ):
+                    entry = lookup.get_entry_or_none(
+                        (
+                            *map(hole_cards.__getitem__, hole_positions),
+                            *map(board_cards.__getitem__, board_positions),
+                        ),
+                    )
+
+                    if entry is not None and (
+                            best_entry is None
+                            or (
+                                entry < best_entry
+                                if low
+                                else entry > best_entry
+                            )
+                    ):
+                        best_positions = hole_positions, board_positions
+                        best_entry = entry
+
+            self.assertEqual(
+                lookup.get_best_hole_board_positions(
+                    [card.index for card in hole_cards],
+                    [card.index for card in board_cards],
+                    2,
+                    3,
+                    low,
+                ),
+                best_positions,
+            )
+
 
 class StandardLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -49,6 +278,158 @@ class StandardLookupTestCase(LookupTestCaseMixin, TestCase):
             '488cdd27873395ba75205cd02fb9d6b2',
         )
 
+    def test_get_entry_index(self) -> None:
+        self.assert_entry_indices(
+            StandardLookup(),
+            combinations(Deck.STANDARD[::2], 5),
+        )
+
+    def test_get_best_positions(self) -> None:
+        lookup = StandardLookup()
+
+        for low in (False, True):
+            self.assert_best_positions(
+                lookup,
+                5,
+                low,
+                combinations(Deck.STANDARD[:16], 7),
+            )
+            self.assert_best_positions(
+                lookup,
+                5,
+                low,
+                combinations(Deck.STANDARD[::4], 7),
+            )
+            self.assert_best_positions(
+                lookup,
+                5,
+                low,
+                combinations(Deck.STANDARD[36:], 6),
+            )
+
+    def test_get_cumulative_counts(self) -> None:
+        lookup = StandardLookup()
+
+        self.assertEqual(lookup.get_cumulative_counts()[-1], 2598960)
+        self.assert_cumulative_counts(
+            lookup,
+            5,
+            None,
+            False,
+            RankOrder.ROYAL_POKER,
+            combinations(Deck.ROYAL_POKER, 5),
+        )
+
+        for card_count in (6, 7):
+            self.assert_cumulative_counts(
+                lookup,
+                5,
+                card_count,
+                False,
+                RankOrder.ROYAL_POKER,
+                combinations(Deck.ROYAL_POKER, card_count),
+            )
+        self.assertRaises(ValueError, lookup.get_cumulative_counts, 4)
+        self.assertRaises(ValueError, lookup.get_cumulative_counts, 10)
+
+    def test_get_best_hole_board_positions(self) -> None:
+        lookup = StandardLookup()
+
+        for board_cards in ('2c3c4c5c6c', 'AsKsQsJs9h', '7h8h2d2sTh'):
+            self.assert_best_hole_board_positions(
+                lookup,
+                False,
+                combinations(Deck.STANDARD[20::2], 4),
+                Card.parse(board_cards),
+            )
+
+
+class LookupTestCase(LookupTestCaseMixin, TestCase):
+    @classmethod
+    def create_lookup_type(cls) -> type[Lookup]:
+        class PersistedLookup(StandardLookup):
+            pass
+
+        return PersistedLookup
+
+    def test_cache_directory(self) -> None:
+        cache_directory = Lookup.cache_directory
+        hands = tuple(combinations(Deck.STANDARD[::3], 5))
+        combinations_ = tuple(combinations(Deck.STANDARD[::3], 7))
+
+        try:
+            with TemporaryDirectory() as temporary_directory:
+                Lookup.cache_directory = temporary_directory
+                lookup = self.create_lookup_type()()
+                entries = list(map(lookup.get_entry, hands))
+                positions = [
+                    lookup.get_best_positions(
+                        [card.index for card in combination],
+                        5,
+                    ) for combination in combinations_
+                ]
+
+                self.assertEqual(len(listdir(temporary_directory)), 3)
+
+                lookup = self.create_lookup_type()()
+
+                self.assertEqual(
+                    list(map(lookup.get_entry, hands)),
+                    entries,
+                )
+                self.assertEqual(
+                    [
+                        lookup.get_best_positions(
+                            [card.index for card in combination],
+                            5,
+                        ) for combination in combinations_
+                    ],
+                    positions,
+                )
+                self.assertEqual(len(listdir(temporary_directory)), 3)
+
+                Lookup.cache_directory = None
+                lookup = self.create_lookup_type()()
+
+                self.assertEqual(
+                    list(map(lookup.get_entry, hands)),
+                    entries,
+                )
+        finally:
+            Lookup.cache_directory = cache_directory
+
+    def test_cache_directory_corruption(self) -> None:
+        cache_directory = Lookup.cache_directory
+        hands = tuple(combinations(Deck.STANDARD[::3], 5))
+        entries = list(map(StandardLookup().get_entry, hands))
+
+        try:
+            with TemporaryDirectory() as temporary_directory:
+                Lookup.cache_directory = temporary_directory
+                self.create_lookup_type()().get_entry(hands[0])
+
+                pathname, = (
+                    path.join(temporary_directory, filename)
+                    for filename in listdir(temporary_directory)
+                    if filename.endswith('.entries')
+                )
+
+                for content in (b'', b'PKLT\0', b'PKLT' + bytes(100)):
+                    with open(pathname, 'wb') as file:
+                        file.write(content)
+
+                    lookup = self.create_lookup_type()()
+
+                    self.assertEqual(
+                        list(map(lookup.get_entry, hands)),
+                        entries,
+                    )
+
+                    with open(pathname, 'rb') as file:
+                        self.assertNotEqual(file.read(), content)
+        finally:
+            Lookup.cache_directory = cache_directory
+
 
 class ShortDeckHoldemLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -66,6 +447,12 @@ class ShortDeckHoldemLookupTestCase(LookupTestCaseMixin, TestCase):
             '5b46b727ce4526a68d41b0e55939353c',
         )
 
+    def test_get_entry_index(self) -> None:
+        self.assert_entry_indices(
+            ShortDeckHoldemLookup(),
+            combinations(Deck.STANDARD[1::2], 5),
+        )
+
 
 class EightOrBetterLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -83,6 +470,23 @@ class EightOrBetterLookupTestCase(LookupTestCaseMixin, TestCase):
             'ecf2b6b16031562a6761932b1ce1de91',
         )
 
+    def test_get_entry_index(self) -> None:
+        self.assert_entry_indices(
+            EightOrBetterLookup(),
+            combinations(Deck.REGULAR[:32], 5),
+        )
+
+    def test_get_best_hole_board_positions(self) -> None:
+        lookup = EightOrBetterLookup()
+
+        for board_cards in ('2c3c4c5c6c', 'AsKsQsJs9h', '7h8h2d2sTh'):
+            self.assert_best_hole_board_positions(
+                lookup,
+                True,
+                combinations(Deck.REGULAR[:32:2], 4),
+                Card.parse(board_cards),
+            )
+
 
 class RegularLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -100,6 +504,30 @@ class RegularLookupTestCase(LookupTestCaseMixin, TestCase):
             '28925b97b06a1e674eaabf241a441e15',
         )
 
+    def test_get_entry_index(self) -> None:
+        self.assert_entry_indices(
+            RegularLookup(),
+            combinations(Deck.REGULAR[::2], 5),
+        )
+
+    def test_get_cumulative_counts(self) -> None:
+        self.assert_cumulative_counts(
+            RegularLookup(),
+            5,
+            7,
+            True,
+            RankOrder.ROYAL_POKER,
+            combinations(Deck.ROYAL_POKER, 7),
+        )
+
+    def test_get_best_positions(self) -> None:
+        self.assert_best_positions(
+            RegularLookup(),
+            5,
+            True,
+            combinations(Deck.REGULAR[:16], 7),
+        )
+
 
 class BadugiLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -127,6 +555,54 @@ class BadugiLookupTestCase(LookupTestCaseMixin, TestCase):
             '9d29ddbc3f76d815e166c6faa2af9021',
         )
 
+    def test_get_entry_index(self) -> None:
+        self.assert_entry_indices(
+            BadugiLookup(),
+            combinations(Deck.REGULAR[::3], 4),
+        )
+
+    def test_get_entry_or_none(self) -> None:
+        lookup = BadugiLookup()
+
+        for cards in combinations(Deck.REGULAR[::3], 3):
+            if Card.are_rainbow(cards) and not Card.are_paired(cards):
+                self.assertTrue(lookup.has_entry(cards))
+                self.assertEqual(
+                    lookup.get_entry_or_none(cards),
+                    lookup.get_entry(cards),
+                )
+            else:
+                self.assertFalse(lookup.has_entry(cards))
+                self.assertIsNone(lookup.get_entry_or_none(cards))
+                self.assertRaises(ValueError, lookup.get_entry, cards)
+
+    def test_get_cumulative_counts(self) -> None:
+        lookup = BadugiLookup()
+
+        self.assert_cumulative_counts(
+            lookup,
+            4,
+            None,
+            False,
+            RankOrder.ROYAL_POKER,
+            (
+                cards
+                for count in range(1, 5)
+                for cards in combinations(Deck.ROYAL_POKER, count)
+                if lookup.has_entry(cards)
+            ),
+        )
+        self.assertRaises(ValueError, lookup.get_cumulative_counts, 5)
+
+    def test_get_best_rainbow_positions(self) -> None:
+        lookup = BadugiLookup()
+
+        for count in range(6):
+            self.assert_best_rainbow_positions(
+                lookup,
+                combinations(Deck.REGULAR[::3], count),
+            )
+
 
 class StandardBadugiLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -154,6 +630,15 @@ class StandardBadugiLookupTestCase(LookupTestCaseMixin, TestCase):
             '06886dd57a4c7b780953f5090c63bcfe',
         )
 
+    def test_get_best_rainbow_positions(self) -> None:
+        lookup = StandardBadugiLookup()
+
+        for count in range(6):
+            self.assert_best_rainbow_positions(
+                lookup,
+                combinations(Deck.STANDARD[1::3], count),
+            )
+
 
 class KuhnPokerLookupTestCase(LookupTestCaseMixin, TestCase):
     def test_get_entry(self) -> None:
@@ -5,6 +5,7 @@
 from functools import partial
 from hashlib import md5
 from itertools import combinations
+from random import Random
 from unittest import main, TestCase
 from warnings import resetwarnings, simplefilter
 
@@ -30,6 +31,7 @@ from pokerkit.state import (
     HoleDealing,
     _LowHandOpeningLookup,
     Opening,
+    Operation,
     Pot,
     State,
     Street,
@@ -1203,6 +1205,47 @@ class StateTestCase(TestCase):
 
         resetwarnings()
 
+    def test_rng(self) -> None:
+        simplefilter('ignore')
+
+        game = FixedLimitDeuceToSevenLowballTripleDraw(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_DEALING,
+                Automation.BOARD_DEALING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PUSHING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            4,
+        )
+
+        def play(state: State) -> list[Operation]:
+            while state.status:
+                player_index = state.stand_patter_or_discarder_index
+
+                if player_index is not None:
+                    state.stand_pat_or_discard(state.hole_cards[player_index])
+                else:
+                    state.check_or_call()
+
+            return state.operations
+
+        operations = play(game(200, 6, rng=Random(0)))
+
+        self.assertEqual(play(game(200, 6, rng=Random(0))), operations)
+        self.assertNotEqual(play(game(200, 6, rng=Random(1))), operations)
+
+        resetwarnings()
+
     def test_hole_to_board_dealing(self) -> None:
         state = FixedLimitRazz.create_state(
             (
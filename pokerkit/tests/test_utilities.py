@@ -2,6 +2,8 @@
 :mod:`pokerkit.utilities`.
 """
 
+from itertools import combinations, permutations
+from random import Random
 from unittest import main, TestCase
 
 from pokerkit.utilities import Card, Deck, Rank, RankOrder, Suit
@@ -26,6 +28,64 @@ class SuitTestCase(TestCase):
         self.assertEqual(''.join(Suit), 'cdhs?')
 
 
+class CardTestCase(TestCase):
+    def test_canonicalize(self) -> None:
+        self.assertEqual(
+            len(
+                {
+                    Card.canonicalize(cards)[0]
+                    for cards in combinations(Deck.STANDARD, 2)
+                },
+            ),
+            169,
+        )
+        self.assertEqual(
+            len(
+                {
+                    Card.canonicalize(cards)[0]
+                    for cards in combinations(Deck.STANDARD, 3)
+                },
+            ),
+            1755,
+        )
+
+        random = Random(0)
+        suits = Suit.CLUB, Suit.DIAMOND, Suit.HEART, Suit.SPADE
+
+        for _ in range(100):
+            cards = random.sample(Deck.STANDARD, 9)
+            groups = cards[:2], cards[2:4], cards[4:]
+            canonical_groups, permutation = Card.canonicalize(*groups)
+
+            self.assertEqual(
+                canonical_groups,
+                tuple(
+                    tuple(
+                        sorted(
+                            Card.permute_suits(group, permutation),
+                            key=lambda card: card.index,
+                        ),
+                    ) for group in groups
+                ),
+            )
+
+            for permuted_suits in permutations(suits):
+                permuted_groups = [
+                    random.sample(
+                        Card.permute_suits(
+                            group,
+                            dict(zip(suits, permuted_suits)),
+                        ),
+                        len(group),
+                    ) for group in groups
+                ]
+
+                self.assertEqual(
+                    Card.canonicalize(*permuted_groups)[0],
+                    canonical_groups,
+                )
+
+
 class DeckTestCase(TestCase):
     def test_members(self) -> None:
         self.assertEqual(len(Deck.STANDARD), 52)
@@ -9,16 +9,16 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Mapping
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
 from decimal import Decimal
 from enum import Enum, StrEnum, unique
-from functools import partial
-from itertools import product, starmap
+from functools import cache, partial
+from itertools import permutations, product, starmap
 from math import inf
 from numbers import Integral, Number
-from operator import is_not
-from random import shuffle
+from operator import attrgetter, is_not
+from random import Random, shuffle
 from re import compile, Pattern
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypeVar
 import builtins
@@ -240,6 +240,16 @@ class Suit(StrEnum):
     """The unknown suit."""
 
 
+_CARD_INDICES = {
+    key: index for index, key in enumerate(
+        sorted(
+            product((*RankOrder.STANDARD, Rank.UNKNOWN), Suit),
+            key=lambda key: Rank.UNKNOWN in key,
+        ),
+    )
+}
+
+
 @dataclass(frozen=True)
 class Card:
     """The class for cards.
@@ -274,6 +284,18 @@ class Card:
     >>> isinstance(card, Hashable)
     True
 
+    Each card is also assigned a small integer index. The cards in
+    :attr:`pokerkit.utilities.Deck.STANDARD` are indexed from ``0`` to
+    ``51`` in the deck's order. Cards with unknown ranks or suits are
+    assigned the indices that follow.
+
+    >>> card.index
+    51
+    >>> Card(Rank.DEUCE, Suit.CLUB).index
+    0
+    >>> Card.UNKNOWN.index
+    69
+
     :param rank: The rank. For more details, please refer to
                  :attr:`pokerkit.utilities.Card.rank`.
     :param suit: The suit. For more details, please refer to
@@ -286,6 +308,8 @@ class Card:
     """The rank of the card."""
     suit: Suit
     """The suit of the card."""
+    index: int = field(init=False, repr=False, compare=False)
+    """The integer index of the card."""
 
     @classmethod
     def get_ranks(cls, cards: CardsLike) -> Iterator[Rank]:
@@ -317,6 +341,51 @@ class Card:
         for card in cls.clean(cards):
             yield card.suit
 
+    @classmethod
+    def get_mask(cls, cards: CardsLike) -> int:
+        """Return the bitmask of the cards.
+
+        The bit of each card is the power of two of its index (see
+        :attr:`pokerkit.utilities.Card.index`). Hence, the cards of
+        :attr:`pokerkit.utilities.Deck.STANDARD` fit in 52 bits.
+
+        >>> Card.get_mask('2c2d')
+        3
+        >>> Card.get_mask('As') == 1 << 51
+        True
+        >>> Card.get_mask('2c2d') & Card.get_mask('2dAs')
+        2
+
+        :param cards: The cards.
+        :return: The bitmask.
+        """
+        mask = 0
+
+        for card in cls.clean(cards):
+            mask |= 1 << card.index
+
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> tuple[Card, ...]:
+        """Return the cards of the bitmask, ordered by their indices.
+
+        >>> Card.from_mask(3)
+        (2c, 2d)
+        >>> Card.from_mask(Card.get_mask('AsKsTc'))
+        (Tc, Ks, As)
+
+        :param mask: The bitmask (see
+                     :meth:`pokerkit.utilities.Card.get_mask`).
+        :return: The cards.
+        """
+        cards = cls.__get_cards()
+
+        return tuple(
+            cards[index] for index in range(mask.bit_length())
+            if mask >> index & 1
+        )
+
     @classmethod
     def are_paired(cls, cards: CardsLike) -> bool:
         """Return the pairedness of the given cards.
@@ -479,6 +548,138 @@ class Card:
 
                     yield cls(rank, suit)
 
+    @classmethod
+    def permute_suits(
+            cls,
+            cards: CardsLike,
+            permutation: Mapping[Suit, Suit],
+    ) -> tuple[Card, ...]:
+        """Return the cards with their suits permuted.
+
+        The suits absent from the permutation are left as they are.
+
+        >>> Card.permute_suits('AsKh2c', {Suit.SPADE: Suit.CLUB})
+        (Ac, Kh, 2c)
+        >>> Card.permute_suits('??', {Suit.SPADE: Suit.CLUB})
+        (??,)
+
+        :param cards: The cards.
+        :param permutation: The mapping from the suits to the permuted
+                            suits.
+        :return: The cards with the permuted suits.
+        """
+        return tuple(
+            cls(card.rank, permutation.get(card.suit, card.suit))
+            for card in cls.clean(cards)
+        )
+
+    @classmethod
+    @cache
+    def __get_permutation_tables(
+            cls,
+    ) -> tuple[tuple[dict[Suit, Suit], tuple[int, ...]], ...]:
+        suits = Suit.CLUB, Suit.DIAMOND, Suit.HEART, Suit.SPADE
+        cards = sorted(
+            starmap(cls, product(Rank, Suit)),
+            key=attrgetter('index'),
+        )
+        tables = []
+
+        for permuted_suits in permutations(suits):
+            permutation = dict(zip(suits, permuted_suits))
+            indices = tuple(
+                card.index for card in cls.permute_suits(cards, permutation)
+            )
+
+            tables.append((permutation, indices))
+
+        return tuple(tables)
+
+    @classmethod
+    @cache
+    def __get_cards(cls) -> tuple[Card, ...]:
+        return tuple(
+            sorted(
+                starmap(cls, product(Rank, Suit)),
+                key=attrgetter('index'),
+            ),
+        )
+
+    @classmethod
+    def canonicalize(
+            cls,
+            *cards: CardsLike,
+    ) -> tuple[tuple[tuple[Card, ...], ...], dict[Suit, Suit]]:
+        """Return the canonical representative of the groups of cards
+        under the permutations of the suits, and the permutation that
+        maps the groups to it.
+
+        In most poker variants, the suits are interchangeable, and
+        situations that only differ by a permutation of the suits (up to
+        ``24`` of them) are strategically identical. Each group of cards
+        (e.g., the hole cards of a player or the board cards) is treated
+        as unordered, while the order of the groups is kept. Among the
+        permutations of the suits, the one for which the sorted card
+        indices (see :attr:`pokerkit.utilities.Card.index`) of the
+        groups are lexicographically the smallest is chosen. Hence,
+        the canonical representatives of two situations are equal if
+        and only if the situations are suit-isomorphic, and can be used
+        as keys to share the work between the situations.
+
+        >>> groups, permutation = Card.canonicalize('AsKs', 'Qs7h2d')
+        >>> groups
+        ((Kc, Ac), (2d, 7h, Qc))
+        >>> groups == Card.canonicalize('AhKh', '7c2dQh')[0]
+        True
+        >>> groups == Card.canonicalize('AhKh', '7s2dQh')[0]
+        True
+        >>> groups == Card.canonicalize('AhKh', '7h2dQc')[0]
+        False
+
+        The permutation, or its inverse, can be applied to other cards
+        through :meth:`pokerkit.utilities.Card.permute_suits`.
+
+        >>> permutation[Suit.SPADE]
+        <Suit.CLUB: 'c'>
+        >>> Card.permute_suits('Js', permutation)
+        (Jc,)
+        >>> inverse = {value: key for key, value in permutation.items()}
+        >>> Card.permute_suits(groups[1], inverse)
+        (2d, 7h, Qs)
+
+        Unknown suits are left as they are.
+
+        >>> Card.canonicalize('As??')[0]
+        ((Ac, ??),)
+
+        :param cards: The groups of cards.
+        :return: The canonical groups of cards, sorted by their indices,
+                 and the permutation of the suits applied to them.
+        """
+        groups = tuple(
+            tuple(card.index for card in cls.clean(group)) for group in cards
+        )
+        permutation, indices = min(
+            cls.__get_permutation_tables(),
+            key=lambda table: tuple(
+                sorted(map(table[1].__getitem__, group)) for group in groups
+            ),
+        )
+        cards_ = cls.__get_cards()
+        canonical_groups = tuple(
+            tuple(
+                map(
+                    cards_.__getitem__,
+                    sorted(map(indices.__getitem__, group)),
+                ),
+            ) for group in groups
+        )
+
+        return canonical_groups, permutation
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'index', _CARD_INDICES[self.rank, self.suit])
+
     def __repr__(self) -> str:
         return f'{self.rank}{self.suit}'
 
@@ -728,7 +929,7 @@ def clean_values(values: ValuesLike, count: int) -> tuple[int, ...]:
     return values
 
 
-def shuffled(values: Iterable[_T]) -> list[_T]:
+def shuffled(values: Iterable[_T], rng: Random | None = None) -> list[_T]:
     """Return the shuffled values.
 
     The shuffling is performed out-of-place (i.e., not done in-place).
@@ -737,12 +938,23 @@ def shuffled(values: Iterable[_T]) -> list[_T]:
     >>> cards  # doctest: +ELLIPSIS
     [A..., A..., A..., A...]
 
+    A random number generator can be supplied for reproducibility.
+
+    >>> shuffled(range(5), Random(0)) == shuffled(range(5), Random(0))
+    True
+
     :param values: The values to shuffle.
+    :param rng: The optional random number generator, defaults to
+                ``None`` which is the global one of the :mod:`random`
+                module.
     :return: The shuffled values.
     """
     values = list(values)
 
-    shuffle(values)
+    if rng is None:
+        shuffle(values)
+    else:
+        rng.shuffle(values)
 
     return values
 
@@ -63,5 +63,6 @@ setup(
     },
     packages=find_packages(),
     python_requires='>=3.11',
+    extras_require={'numpy': ['numpy>=1.24']},
     package_data={'pokerkit': ['py.typed']},
 )